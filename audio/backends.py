@@ -0,0 +1,149 @@
+"""
+Audio Backends Module
+
+Pluggable output backends for SoundManager, so the game can run where no
+sound device exists and benchmarks are not skewed by audio-driver latency.
+
+Features:
+- MixerBackend: real pygame.mixer output through SoundScheduler, with
+  procedurally synthesized fallbacks for missing sound files
+- NullBackend: no device, no decoding, every call a no-op
+- RecordingBackend: no device; logs (tick, sound, volume) play requests
+  for tests and headless runs
+- Startup selection via config.AUDIO_BACKEND or the CORAL_AUDIO_BACKEND
+  environment variable
+"""
+
+import os
+import pygame
+import config
+from audio.sound_scheduler import SoundScheduler
+
+class MixerBackend:
+    """Plays audio through pygame.mixer."""
+
+    name = "mixer"
+    loads_in_background = True
+
+    def __init__(self):
+        self.scheduler = None
+
+    def init(self):
+        pygame.mixer.init()
+        self.scheduler = SoundScheduler()
+
+    def load_sound(self, path, volume):
+        sound = pygame.mixer.Sound(path)
+        sound.set_volume(volume)
+        return sound
+
+    def synthesize(self, sound_name, volume):
+        # Imported here so numpy stays optional for file-based audio
+        from audio import synthesis
+        sound = synthesis.make_sound(sound_name)
+        sound.set_volume(volume)
+        return sound
+
+    def set_sound_volume(self, sound, volume):
+        sound.set_volume(volume)
+
+    def play(self, sound_name, sound, volume):
+        return self.scheduler.play(sound_name, sound)
+
+    def play_music(self, path, volume):
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(-1)  # -1 means loop indefinitely
+
+    def set_music_volume(self, volume):
+        pygame.mixer.music.set_volume(volume)
+
+    def stop_music(self):
+        pygame.mixer.music.stop()
+
+class NullBackend:
+    """Discards all audio. Nothing is initialized, decoded or played."""
+
+    name = "null"
+    loads_in_background = False
+
+    def init(self):
+        pass
+
+    def load_sound(self, path, volume):
+        # No decoding; the path stands in for the sound handle
+        return path
+
+    def synthesize(self, sound_name, volume):
+        return sound_name
+
+    def set_sound_volume(self, sound, volume):
+        pass
+
+    def play(self, sound_name, sound, volume):
+        return None
+
+    def play_music(self, path, volume):
+        pass
+
+    def set_music_volume(self, volume):
+        pass
+
+    def stop_music(self):
+        pass
+
+class RecordingBackend(NullBackend):
+    """
+    Records play requests instead of producing sound.
+
+    Args:
+        tick_source (callable): Returns the current tick; defaults to
+            pygame.time.get_ticks (milliseconds since pygame.init)
+
+    Attributes:
+        plays (list): (tick, sound_name, volume) per play request
+        music (list): (tick, path or None when stopped, volume)
+    """
+
+    name = "recording"
+
+    def __init__(self, tick_source=None):
+        self.tick_source = tick_source or pygame.time.get_ticks
+        self.plays = []
+        self.music = []
+
+    def play(self, sound_name, sound, volume):
+        self.plays.append((self.tick_source(), sound_name, volume))
+        return None
+
+    def play_music(self, path, volume):
+        self.music.append((self.tick_source(), path, volume))
+
+    def stop_music(self):
+        self.music.append((self.tick_source(), None, 0.0))
+
+    def clear(self):
+        self.plays = []
+        self.music = []
+
+BACKENDS = {
+    MixerBackend.name: MixerBackend,
+    NullBackend.name: NullBackend,
+    RecordingBackend.name: RecordingBackend
+}
+
+def create_backend(name=None):
+    """
+    Create the audio backend selected for this run.
+
+    Args:
+        name (str): Backend name; defaults to $CORAL_AUDIO_BACKEND, then
+            config.AUDIO_BACKEND
+
+    Returns:
+        Backend instance
+    """
+    name = name or os.environ.get("CORAL_AUDIO_BACKEND") or config.AUDIO_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown audio backend '{name}', expected one of {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
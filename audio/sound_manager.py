@@ -1,5 +1,10 @@
 import pygame
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from audio.backends import NullBackend, create_backend
+from utils.logger import logger
+from utils.startup_timer import startup_timer
 
 """
 Sound Manager Module
@@ -13,25 +18,80 @@ Features:
 - Volume control
 - Warning sound system
 - Error handling for missing audio files
+- Cooldowns, voice limits and channel pooling via SoundScheduler
+- Mixer initialization and decoding on a background thread; sounds are
+  silent no-ops until the `ready` future completes
+- Pluggable output backend (mixer, null, recording) chosen at startup
+- Missing sound files replaced by cached procedurally synthesized effects
 """
 
 class SoundManager:
-    def __init__(self):
-        pygame.mixer.init()
+    def __init__(self, backend=None):
+        self.backend = backend or create_backend()
         self.sounds = {}
+        self.warning_sound = None
         self.music_playing = False
+        self.music_requested = False
         self.volume = 0.7
-        
-        # Load sound effects
-        self.load_sounds()
-        try:
-            self.warning_sound = pygame.mixer.Sound("assets/audio/warning.wav")
-        except:
-            self.warning_sound = None
-            print("Warning: Could not load warning sound")
         self.warning_played = False
-        
+        self._loaded = False
+        self._music_lock = threading.Lock()
+
+        if self.backend.loads_in_background:
+            # Initialize the mixer and decode sound effects off the main thread
+            self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-loader")
+            self.ready = self._loader.submit(self._load_audio)
+            self._loader.shutdown(wait=False)
+        else:
+            self.ready = Future()
+            self.ready.set_result(self._load_audio())
+        self.ready.add_done_callback(self._on_loaded)
+
+    def _load_audio(self):
+        """Initialize the backend, then decode every sound effect."""
+        with startup_timer.measure("audio.mixer_init"):
+            try:
+                self.backend.init()
+            except pygame.error as e:
+                logger.warning(f"Audio device unavailable, continuing without sound: {e}")
+                self.backend = NullBackend()
+        with startup_timer.measure("audio.decode"):
+            sounds, missing = self.load_sounds()
+            warning_sound = self._load_or_synthesize(
+                "warning", "assets/audio/warning.wav", missing
+            )
+        if missing:
+            logger.warning(f"Could not load sounds: {', '.join(missing)}")
+
+        self.warning_sound = warning_sound
+        self.sounds = sounds
+
+        with self._music_lock:
+            self._loaded = True
+            if self.music_requested:
+                self._start_music()
+
+    def _on_loaded(self, future):
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"Audio unavailable: {error}")
+            return
+        logger.info(
+            f"Audio ready with {self.backend.name} backend "
+            f"(init {startup_timer.total('audio.mixer_init') * 1000:.1f} ms, "
+            f"decode {startup_timer.total('audio.decode') * 1000:.1f} ms)"
+        )
+
+    def is_ready(self):
+        return self._loaded
+
     def load_sounds(self):
+        """
+        Decode the sound effects.
+
+        Returns:
+            tuple: (dict of name to sound handle, list of missing files)
+        """
         sound_files = {
             "bubble": "bubble.wav",
             "splash": "splash.wav",
@@ -39,46 +99,68 @@ class SoundManager:
             "success": "success.wav",
             "fail": "fail.wav"
         }
-        
+        sounds = {}
+        missing = []
+
         for sound_name, filename in sound_files.items():
-            try:
-                path = os.path.join("assets", "sounds", filename)
-                self.sounds[sound_name] = pygame.mixer.Sound(path)
-                self.sounds[sound_name].set_volume(self.volume)
-            except:
-                print(f"Warning: Could not load sound {filename}")
-                
+            path = os.path.join("assets", "sounds", filename)
+            sound = self._load_or_synthesize(sound_name, path, missing)
+            if sound is not None:
+                sounds[sound_name] = sound
+        return sounds, missing
+
+    def _load_or_synthesize(self, sound_name, path, missing):
+        """Load a sound file, falling back to the synthesized version."""
+        try:
+            return self.backend.load_sound(path, self.volume)
+        except (pygame.error, FileNotFoundError):
+            pass
+        try:
+            return self.backend.synthesize(sound_name, self.volume)
+        except (pygame.error, ImportError, KeyError, ValueError) as e:
+            logger.debug(f"Could not synthesize {sound_name}: {e}")
+            missing.append(os.path.basename(path))
+            return None
+
     def play_sound(self, sound_name):
         if sound_name in self.sounds:
-            self.sounds[sound_name].play()
-            
+            self.backend.play(sound_name, self.sounds[sound_name], self.volume)
+
     def play_background_music(self):
+        # Deferred to the loader thread if the mixer is not up yet
+        with self._music_lock:
+            self.music_requested = True
+            if self.is_ready():
+                self._start_music()
+
+    def _start_music(self):
         try:
-            pygame.mixer.music.load(os.path.join("assets", "sounds", "ocean_ambient.mp3"))
-            pygame.mixer.music.set_volume(self.volume * 0.5)
-            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
+            with startup_timer.measure("audio.music"):
+                self.backend.play_music(os.path.join("assets", "sounds", "ocean_ambient.mp3"),
+                                        self.volume * 0.5)
             self.music_playing = True
-        except:
-            print("Warning: Could not load background music")
-            
+        except (pygame.error, FileNotFoundError):
+            logger.warning("Could not load background music")
+
     def stop_background_music(self):
-        pygame.mixer.music.stop()
-        self.music_playing = False
-        
+        with self._music_lock:
+            self.music_requested = False
+            if self.music_playing:
+                self.backend.stop_music()
+            self.music_playing = False
+
     def set_volume(self, volume):
         self.volume = max(0.0, min(1.0, volume))
         for sound in self.sounds.values():
-            sound.set_volume(self.volume)
+            self.backend.set_sound_volume(sound, self.volume)
         if self.music_playing:
-            pygame.mixer.music.set_volume(self.volume * 0.5) 
-            
+            self.backend.set_music_volume(self.volume * 0.5)
+
     def play_warning(self):
         if not self.warning_played:
             if self.warning_sound:
-                self.warning_sound.play()
-            else:
-                print("Warning: No warning sound loaded")
-            
+                self.backend.play("warning", self.warning_sound, self.volume)
+
             self.warning_played = True
     def reset_warning(self):
-        self.warning_played = False 
\ No newline at end of file
+        self.warning_played = False
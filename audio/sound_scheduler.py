@@ -0,0 +1,153 @@
+"""
+Sound Scheduler Module
+
+Decides whether and on which mixer channel a sound effect may play, so
+trigger storms (a sound requested every frame) cannot saturate the mixer.
+
+Features:
+- Per-sound cooldowns
+- Maximum concurrent voices per sound
+- Reserved channels for warning sounds
+- Priority-based voice stealing
+- Global mixing budget (maximum voices playing at once)
+"""
+
+import time
+import pygame
+import config
+from utils.metrics import metrics
+
+SOUNDS_PLAYED = metrics.counter("sounds_played_total", "Sound effects started on a mixer channel")
+SOUNDS_SUPPRESSED = metrics.counter("sounds_suppressed_total", "Sound requests dropped by cooldown, voice limit or budget")
+VOICES_STOLEN = metrics.counter("voices_stolen_total", "Playing voices stopped for a higher-priority sound")
+
+class SoundPolicy:
+    """
+    Scheduling rules for one sound.
+
+    Attributes:
+        cooldown (float): Minimum seconds between starts of this sound
+        max_voices (int): Maximum instances playing at once
+        priority (int): Higher priorities may steal lower-priority voices
+        reserved (bool): Whether the sound may use the reserved channels
+    """
+
+    def __init__(self, cooldown, max_voices, priority, reserved=False):
+        self.cooldown = cooldown
+        self.max_voices = max_voices
+        self.priority = priority
+        self.reserved = reserved
+
+class Voice:
+    """A sound currently assigned to a mixer channel."""
+
+    def __init__(self, channel, sound_name, priority, started):
+        self.channel = channel
+        self.sound_name = sound_name
+        self.priority = priority
+        self.started = started
+
+class SoundScheduler:
+    """
+    Channel pool and admission control in front of pygame.mixer.
+
+    The first config.AUDIO_RESERVED_CHANNELS channels are reserved with
+    pygame.mixer.set_reserved and only handed to sounds whose policy is
+    marked reserved; those sounds fall back to the general pool when the
+    reserved channels are busy.
+    """
+
+    def __init__(self, num_channels=None, reserved_channels=None, max_voices=None,
+                 policies=None, clock=time.monotonic):
+        num_channels = num_channels or config.AUDIO_CHANNELS
+        reserved_channels = config.AUDIO_RESERVED_CHANNELS if reserved_channels is None else reserved_channels
+        self.max_voices = max_voices or config.AUDIO_MAX_VOICES
+        self.clock = clock
+
+        policies = config.SOUND_POLICIES if policies is None else policies
+        self.policies = {name: SoundPolicy(**rules) for name, rules in policies.items()}
+        self.default_policy = SoundPolicy(**config.DEFAULT_SOUND_POLICY)
+
+        pygame.mixer.set_num_channels(num_channels)
+        pygame.mixer.set_reserved(reserved_channels)
+        self.reserved_pool = [pygame.mixer.Channel(i) for i in range(reserved_channels)]
+        self.general_pool = [pygame.mixer.Channel(i) for i in range(reserved_channels, num_channels)]
+
+        self.voices = []
+        self.last_started = {}
+
+    def get_policy(self, sound_name):
+        return self.policies.get(sound_name, self.default_policy)
+
+    def play(self, sound_name, sound):
+        """
+        Play a sound if its policy and the mixing budget allow it.
+
+        Args:
+            sound_name (str): Name used for policy lookup
+            sound (pygame.mixer.Sound): Sound to play
+
+        Returns:
+            pygame.mixer.Channel or None: Channel used, None if suppressed
+        """
+        now = self.clock()
+        policy = self.get_policy(sound_name)
+
+        last = self.last_started.get(sound_name)
+        if last is not None and now - last < policy.cooldown:
+            SOUNDS_SUPPRESSED.inc()
+            return None
+
+        self._reap()
+        if sum(1 for voice in self.voices if voice.sound_name == sound_name) >= policy.max_voices:
+            SOUNDS_SUPPRESSED.inc()
+            return None
+
+        channel = None
+        if len(self.voices) < self.max_voices:
+            channel = self._find_free_channel(policy)
+        if channel is None:
+            channel = self._steal_channel(policy)
+        if channel is None:
+            SOUNDS_SUPPRESSED.inc()
+            return None
+
+        channel.play(sound)
+        self.voices.append(Voice(channel, sound_name, policy.priority, now))
+        self.last_started[sound_name] = now
+        SOUNDS_PLAYED.inc()
+        return channel
+
+    def stop_all(self):
+        for voice in self.voices:
+            voice.channel.stop()
+        self.voices = []
+
+    def _pools_for(self, policy):
+        if policy.reserved:
+            return self.reserved_pool + self.general_pool
+        return self.general_pool
+
+    def _reap(self):
+        """Forget voices whose channel has finished playing."""
+        self.voices = [voice for voice in self.voices if voice.channel.get_busy()]
+
+    def _find_free_channel(self, policy):
+        in_use = {id(voice.channel) for voice in self.voices}
+        for channel in self._pools_for(policy):
+            if id(channel) not in in_use and not channel.get_busy():
+                return channel
+        return None
+
+    def _steal_channel(self, policy):
+        """Stop the lowest-priority, oldest voice below the requested priority."""
+        allowed = {id(channel) for channel in self._pools_for(policy)}
+        candidates = [voice for voice in self.voices
+                      if voice.priority < policy.priority and id(voice.channel) in allowed]
+        if not candidates:
+            return None
+        victim = min(candidates, key=lambda voice: (voice.priority, voice.started))
+        victim.channel.stop()
+        self.voices.remove(victim)
+        VOICES_STOLEN.inc()
+        return victim.channel
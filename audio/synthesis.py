@@ -0,0 +1,187 @@
+"""
+Sound Synthesis Module
+
+Generates the game's sound effects procedurally from compact parameter
+specs, so no audio assets need to ship and later launches skip decoding.
+
+Features:
+- Vectorized NumPy oscillators (sine, square, saw, triangle, noise)
+- Frequency sweeps and note sequences
+- Attack/release envelopes applied per note, plus pulse gating
+- Moving-average low-pass for noise-based effects
+- On-disk cache of rendered 16-bit PCM keyed by spec hash and sample rate
+- Conversion to the mixer's format and wrapping with pygame.sndarray
+
+Spec keys:
+    wave (str): Oscillator shape
+    duration (float): Length in seconds
+    notes (list): Frequencies played in equal-length segments, or
+    sweep (list): Start and end frequency of a geometric sweep
+    attack, release (float): Envelope ramps in seconds, per note
+    pulses (int): Number of on/off beeps across the duration
+    smoothing (int): Low-pass kernel length in samples
+    volume (float): Peak amplitude between 0 and 1
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pygame
+
+import config
+
+# Bump when rendering changes so stale cache entries are not reused
+SYNTH_VERSION = 1
+
+SOUND_SPECS = {
+    "bubble": {"wave": "sine", "duration": 0.18, "sweep": [400, 1300],
+               "attack": 0.005, "release": 0.08, "volume": 0.5},
+    "splash": {"wave": "noise", "duration": 0.45, "smoothing": 6,
+               "attack": 0.01, "release": 0.35, "volume": 0.45},
+    "alert": {"wave": "square", "duration": 0.6, "notes": [880],
+              "pulses": 3, "attack": 0.005, "release": 0.02, "volume": 0.25},
+    "warning": {"wave": "saw", "duration": 0.9, "sweep": [660, 330],
+                "pulses": 2, "attack": 0.01, "release": 0.05, "volume": 0.3},
+    "success": {"wave": "triangle", "duration": 0.45, "notes": [523.25, 659.25, 783.99],
+                "attack": 0.01, "release": 0.06, "volume": 0.5},
+    "fail": {"wave": "triangle", "duration": 0.6, "notes": [392.0, 311.13, 261.63],
+             "attack": 0.01, "release": 0.1, "volume": 0.5}
+}
+
+def spec_hash(spec, sample_rate):
+    """Stable hash of everything that affects the rendered samples."""
+    payload = json.dumps({"spec": spec, "rate": sample_rate, "version": SYNTH_VERSION},
+                         sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+def _frequency_track(spec, t, duration):
+    if "sweep" in spec:
+        start, end = spec["sweep"]
+        return start * (end / start) ** (t / duration)
+    notes = np.asarray(spec.get("notes", [440.0]), dtype=np.float64)
+    index = np.minimum((t / duration * len(notes)).astype(np.int64), len(notes) - 1)
+    return notes[index]
+
+def _oscillator(wave, phase, rng):
+    if wave == "sine":
+        return np.sin(phase)
+    if wave == "square":
+        return np.sign(np.sin(phase))
+    if wave == "saw":
+        return 2.0 * ((phase / (2 * np.pi)) % 1.0) - 1.0
+    if wave == "triangle":
+        return 2.0 * np.abs(2.0 * ((phase / (2 * np.pi)) % 1.0) - 1.0) - 1.0
+    if wave == "noise":
+        return rng.uniform(-1.0, 1.0, phase.shape[0])
+    raise ValueError(f"Unknown oscillator '{wave}'")
+
+def _envelope(spec, t, duration):
+    """Attack/release ramps per segment (note or pulse) and pulse gating."""
+    segments = max(len(spec.get("notes", [])), spec.get("pulses", 1), 1)
+    segment_length = duration / segments
+    local = t % segment_length
+
+    if "pulses" in spec:
+        # Each pulse sounds for the first half of its period
+        segment_length /= 2
+        gate = local < segment_length
+    else:
+        gate = np.ones_like(t, dtype=bool)
+
+    attack = max(spec.get("attack", 0.0), 1e-6)
+    release = max(spec.get("release", 0.0), 1e-6)
+    rise = np.clip(local / attack, 0.0, 1.0)
+    fall = np.clip((segment_length - local) / release, 0.0, 1.0)
+    return np.minimum(rise, fall) * gate
+
+def render(spec, sample_rate):
+    """
+    Render a spec to mono 16-bit PCM.
+
+    Args:
+        spec (dict): Sound parameters (see module docstring)
+        sample_rate (int): Samples per second
+
+    Returns:
+        numpy.ndarray: int16 samples
+    """
+    duration = spec["duration"]
+    count = int(duration * sample_rate)
+    t = np.arange(count, dtype=np.float64) / sample_rate
+
+    frequency = _frequency_track(spec, t, duration)
+    phase = 2 * np.pi * np.cumsum(frequency) / sample_rate
+    rng = np.random.default_rng(int(spec_hash(spec, sample_rate), 16) & 0xFFFFFFFF)
+    signal = _oscillator(spec["wave"], phase, rng)
+
+    smoothing = spec.get("smoothing", 0)
+    if smoothing > 1:
+        kernel = np.ones(smoothing) / smoothing
+        signal = np.convolve(signal, kernel, mode="same")
+
+    signal *= _envelope(spec, t, duration) * spec.get("volume", 0.5)
+    return np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+
+def load_or_render(name, sample_rate, cache_dir=None):
+    """
+    Return cached PCM for a named spec, rendering and caching it on a miss.
+
+    Args:
+        name (str): Key into SOUND_SPECS
+        sample_rate (int): Mixer sample rate
+        cache_dir (str): Directory for cached .npy files
+
+    Returns:
+        numpy.ndarray: Mono int16 samples
+    """
+    spec = SOUND_SPECS[name]
+    cache_dir = cache_dir or config.SOUND_CACHE_DIR
+    path = os.path.join(cache_dir, f"{name}-{spec_hash(spec, sample_rate)}.npy")
+    try:
+        return np.load(path)
+    except (OSError, ValueError):
+        pass
+
+    samples = render(spec, sample_rate)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = path + ".tmp.npy"
+        np.save(tmp_path, samples)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Caching is an optimization; the rendered sound is still usable
+    return samples
+
+def to_mixer_format(samples, mixer_format, channels):
+    """Convert mono int16 PCM to the array layout pygame.sndarray expects."""
+    if mixer_format == -16:
+        converted = samples
+    elif mixer_format == 16:
+        converted = (samples.astype(np.int32) + 32768).astype(np.uint16)
+    elif mixer_format == -8:
+        converted = (samples >> 8).astype(np.int8)
+    elif mixer_format == 8:
+        converted = ((samples >> 8) + 128).astype(np.uint8)
+    elif mixer_format == 32:
+        converted = samples.astype(np.float32) / 32768.0
+    else:
+        raise ValueError(f"Unsupported mixer format {mixer_format}")
+    if channels > 1:
+        converted = np.repeat(converted[:, np.newaxis], channels, axis=1)
+    return np.ascontiguousarray(converted)
+
+def make_sound(name):
+    """
+    Build a pygame Sound for a named spec using the initialized mixer.
+
+    Args:
+        name (str): Key into SOUND_SPECS
+
+    Returns:
+        pygame.mixer.Sound
+    """
+    sample_rate, mixer_format, channels = pygame.mixer.get_init()
+    samples = load_or_render(name, sample_rate)
+    return pygame.sndarray.make_sound(to_mixer_format(samples, mixer_format, channels))
@@ -0,0 +1,151 @@
+"""
+Benchmark Suite
+
+Micro-benchmarks of the components the game spends its frames in, and
+macro-benchmarks of a headless round and an offscreen frame. Results are
+stored per machine fingerprint in config.BENCHMARK_RESULTS_PATH; compare
+checks the latest run against the machine's stored baseline. stress runs
+the synthetic load scenarios of benchmarks.stress, and soak the memory
+growth test of benchmarks.soak.
+
+Usage:
+    python -m benchmarks run [--kind micro|macro] [--filter TEXT] [--min-time S] [--baseline] [--json]
+    python -m benchmarks compare [--threshold 0.15] [--json]
+    python -m benchmarks stress [--duration S] [--scale 1 2 4] [--corals N] [--particles N] ... [--json]
+    python -m benchmarks soak [--minutes 60] [--draw] [--max-growth-mb 8] [--json]
+        (traced play runs several times slower than real time: the default
+        hour of play can take hours of wall time on a slow machine)
+    python -m benchmarks list
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+# Offscreen drawing and no sound device, before pygame is first imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("CORAL_AUDIO_BACKEND", "null")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import config
+from benchmarks import harness
+from utils.logger import logger
+from benchmarks import micro, macro  # Register the benchmarks
+
+def selected(kind, text):
+    return [
+        name for name, (benchmark_kind, setup) in harness.BENCHMARKS.items()
+        if (kind is None or benchmark_kind == kind) and (text is None or text in name)
+    ]
+
+def run(args):
+    names = selected(args.kind, args.filter)
+    if not names:
+        print("No benchmarks selected")
+        return 1
+    info = harness.machine_info()
+    run = harness.run_suite(names, args.min_time, None if args.json else harness.print_progress)
+    key = harness.save_run(run, info, baseline=args.baseline, path=args.results)
+    if args.json:
+        print(json.dumps(dict(run, fingerprint=key, machine=info), indent=2))
+    else:
+        stored = "latest and baseline" if args.baseline else "latest"
+        print(f"\nStored as {stored} for machine {key} ({info['cpu']}, {info['cpu_count']} CPUs)")
+    return 0
+
+def compare(args):
+    info = harness.machine_info()
+    key = harness.fingerprint(info)
+    entry = harness.load_results(args.results).get(key, {})
+    if "latest" not in entry or "baseline" not in entry:
+        print(f"Machine {key} needs a run and a baseline; use: python -m benchmarks run --baseline")
+        return 1
+    rows = harness.compare(entry["baseline"]["results"], entry["latest"]["results"], args.threshold)
+    print(json.dumps(rows, indent=2) if args.json else harness.format_comparison(rows, args.threshold))
+    return 1 if any(row["regressions"] for row in rows) else 0
+
+def stress(args):
+    from benchmarks import stress as stress_scenarios
+    counts = {key: getattr(args, key) for key in config.STRESS_SCENARIO}
+    reports = []
+    for scale in args.scale:
+        report = stress_scenarios.run_scenario(stress_scenarios.scaled_counts(counts, scale), args.duration)
+        reports.append((scale, report))
+        if not args.json:
+            print(stress_scenarios.format_report(report, scale if len(args.scale) > 1 else None), flush=True)
+            print()
+    if args.json:
+        print(json.dumps([dict(report, scale=scale) for scale, report in reports], indent=2))
+    elif len(reports) > 1:
+        print(stress_scenarios.format_sweep(reports))
+    return 0
+
+def soak(args):
+    from benchmarks import soak as soak_test
+    result = soak_test.run_soak(
+        args.minutes * 60.0, draw=args.draw, max_growth_mb=args.max_growth_mb,
+        progress=None if args.json else lambda sample: print(soak_test.format_sample(sample), flush=True)
+    )
+    print(json.dumps(result, indent=2) if args.json else soak_test.format_result(result))
+    return 0 if result["passed"] else 1
+
+def list_benchmarks(args):
+    for name, (kind, setup) in harness.BENCHMARKS.items():
+        print(f"  {kind:<6} {name}")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run and compare the game's benchmarks.")
+    parser.add_argument("--results", default=config.BENCHMARK_RESULTS_PATH,
+                        help="Results file (default: config.BENCHMARK_RESULTS_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Measure benchmarks and store the results")
+    run_parser.add_argument("--kind", choices=("micro", "macro"), help="Only this kind of benchmark")
+    run_parser.add_argument("--filter", help="Only benchmarks whose name contains this text")
+    run_parser.add_argument("--min-time", type=float, default=config.BENCHMARK_MIN_TIME,
+                            help="Least seconds of timed calls per benchmark (default: config.BENCHMARK_MIN_TIME)")
+    run_parser.add_argument("--baseline", action="store_true", help="Also store the results as this machine's baseline")
+    run_parser.add_argument("--json", action="store_true", help="Print the run as JSON")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Check the latest run against the stored baseline")
+    compare_parser.add_argument("--threshold", type=float, default=config.BENCHMARK_REGRESSION_THRESHOLD,
+                                help="Relative slowdown flagged as a regression (default: config.BENCHMARK_REGRESSION_THRESHOLD)")
+    compare_parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    compare_parser.set_defaults(handler=compare)
+
+    stress_parser = commands.add_parser("stress", help="Run a synthetic load scenario and report frame times")
+    stress_parser.add_argument("--duration", type=float, default=config.STRESS_DURATION,
+                               help="Seconds of game time to run (default: config.STRESS_DURATION)")
+    stress_parser.add_argument("--scale", type=float, nargs="+", default=[1.0],
+                               help="Run at each multiple of the counts, e.g. --scale 1 2 4 8")
+    for key, value in config.STRESS_SCENARIO.items():
+        stress_parser.add_argument(f"--{key.replace('_', '-')}", type=type(value), default=value,
+                                   help=f"Default: {value}")
+    stress_parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    stress_parser.set_defaults(handler=stress)
+
+    soak_parser = commands.add_parser("soak", help="Play headless under the memory tracker and check for growth")
+    soak_parser.add_argument("--minutes", type=float, default=config.SOAK_DURATION / 60.0,
+                             help="Minutes of simulated play (default: config.SOAK_DURATION); "
+                                  "expect several times as long in wall time")
+    soak_parser.add_argument("--draw", action="store_true", help="Also draw every frame offscreen")
+    soak_parser.add_argument("--max-growth-mb", type=float, default=config.SOAK_MAX_GROWTH_MB,
+                             help="Growth per hour of play that fails the soak (default: config.SOAK_MAX_GROWTH_MB)")
+    soak_parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    soak_parser.set_defaults(handler=soak)
+
+    list_parser = commands.add_parser("list", help="List the registered benchmarks")
+    list_parser.set_defaults(handler=list_benchmarks)
+
+    args = parser.parse_args(argv)
+    # The game logs setup at INFO to the console, i.e. stdout; keep stdout
+    # to the reports, so --json output parses
+    logger.setLevel(logging.WARNING)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
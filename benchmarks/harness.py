@@ -0,0 +1,302 @@
+"""
+Benchmark Harness
+
+Times registered benchmarks and stores the results per machine, so a run
+is only ever compared with earlier runs on the same hardware.
+
+A benchmark is a setup function returning the operation to time. Setup
+runs once, outside the timing; the operation is warmed up, then timed
+call by call for at least min_time seconds. A shorter second pass runs
+under tracemalloc for the peak Python memory allocated within one call.
+
+Features:
+- Registry filled by the @benchmark decorator, micro and macro kinds
+- ops/s, mean, p50 and p99 per call
+- Peak traced allocation and retained memory per call, and surfaces
+  created per call (SURFACE_ALLOCATIONS)
+- Machine fingerprint from CPU model, core count and interpreter
+- Results file keyed by fingerprint, holding the latest run and a
+  stored baseline, and a comparison that flags regressions
+
+Results file (config.BENCHMARK_RESULTS_PATH):
+    {fingerprint: {"machine": {...}, "latest": run, "baseline": run}}
+"""
+
+import gc
+import hashlib
+import json
+import os
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+import config
+from utils.metrics import SURFACE_ALLOCATIONS
+
+# Name to (kind, setup); filled by @benchmark as the suites are imported
+BENCHMARKS = {}
+
+# Per kind: fewest timed calls, and calls in the allocation pass
+KIND_SAMPLES = {
+    "micro": (50, 20),
+    "macro": (3, 1)
+}
+
+# Calls before timing starts, to fill caches and finish lazy setup
+WARMUP_CALLS = 3
+
+# Allocation growth below this many bytes is not a regression
+ALLOCATION_SLACK_BYTES = 4096
+
+def benchmark(kind, name):
+    """
+    Register a setup function as a benchmark.
+
+    Args:
+        kind (str): "micro" or "macro"
+        name (str): Unique name, e.g. "particle_system.draw"
+    """
+    def register(setup):
+        BENCHMARKS[name] = (kind, setup)
+        return setup
+    return register
+
+def display_surface():
+    """The display surface, setting a display mode on first use."""
+    import pygame
+    surface = pygame.display.get_surface()
+    if surface is None:
+        pygame.display.init()
+        pygame.font.init()
+        surface = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    return surface
+
+def _cpu_model():
+    # platform.processor() is empty on most Linux systems
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+def machine_info():
+    """Hardware and software the results were measured on."""
+    import numpy
+    import pygame
+    return {
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy.__version__
+    }
+
+def fingerprint(info):
+    """
+    Short id of the machine and interpreter.
+
+    Library versions and OS patch level are left out: a pygame upgrade
+    that slows a benchmark should show up as a regression against the
+    machine's baseline, not start a new baseline.
+    """
+    python_minor = ".".join(info["python"].split(".")[:2])
+    key = "|".join(str(part) for part in (
+        info["cpu"], info["cpu_count"], info["machine"], info["system"],
+        info["implementation"], python_minor
+    ))
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+def measure(setup, min_time, min_samples, allocation_samples):
+    """
+    Time one benchmark.
+
+    Args:
+        setup (callable): Returns the operation to time
+        min_time (float): Least seconds of timed calls
+        min_samples (int): Least timed calls
+        allocation_samples (int): Calls in the tracemalloc pass
+
+    Returns:
+        dict: Timing in microseconds per call, and allocations per call
+    """
+    random.seed(0)
+    operation = setup()
+    for _ in range(WARMUP_CALLS):
+        operation()
+    gc.collect()
+
+    samples = []
+    surfaces_before = SURFACE_ALLOCATIONS.value
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    while len(samples) < min_samples or perf_counter() - start < min_time:
+        call_start = perf_counter()
+        operation()
+        samples.append(perf_counter() - call_start)
+    surfaces = (SURFACE_ALLOCATIONS.value - surfaces_before) / len(samples)
+
+    # Allocation pass, untimed: tracemalloc slows every allocation
+    peaks = []
+    tracemalloc.start()
+    try:
+        first = tracemalloc.get_traced_memory()[0]
+        for _ in range(allocation_samples):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            operation()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        retained = (tracemalloc.get_traced_memory()[0] - first) / allocation_samples
+    finally:
+        tracemalloc.stop()
+
+    percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "samples": len(samples),
+        "ops_per_sec": round(len(samples) / sum(samples), 2),
+        "mean_us": round(statistics.fmean(samples) * 1e6, 2),
+        "p50_us": round(statistics.median(samples) * 1e6, 2),
+        "p99_us": round(percentiles[98] * 1e6, 2),
+        "alloc_peak_bytes": int(statistics.median(peaks)),
+        "retained_bytes_per_op": int(retained),
+        "surfaces_per_op": round(surfaces, 2)
+    }
+
+def run_suite(names, min_time, progress=None):
+    """
+    Measure the named benchmarks.
+
+    Args:
+        names (list): Registered benchmark names
+        min_time (float): Least seconds of timed calls per benchmark
+        progress (callable): Called with each name and result
+
+    Returns:
+        dict: Run with "started", "min_time" and "results" by name
+    """
+    results = {}
+    for name in names:
+        kind, setup = BENCHMARKS[name]
+        min_samples, allocation_samples = KIND_SAMPLES[kind]
+        result = dict(measure(setup, min_time, min_samples, allocation_samples), kind=kind)
+        results[name] = result
+        if progress:
+            progress(name, result)
+    return {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "min_time": min_time,
+        "results": results
+    }
+
+def load_results(path=None):
+    path = path or config.BENCHMARK_RESULTS_PATH
+    if not os.path.exists(path):
+        return {}
+    with open(path) as results_file:
+        return json.load(results_file)
+
+def save_run(run, info, baseline=False, path=None):
+    """
+    Store a run as this machine's latest, and optionally as its baseline.
+
+    Results of benchmarks not in the run are kept, so a filtered run
+    only replaces the benchmarks it measured.
+
+    Returns:
+        str: Fingerprint the run was stored under
+    """
+    path = path or config.BENCHMARK_RESULTS_PATH
+    results = load_results(path)
+    key = fingerprint(info)
+    entry = results.setdefault(key, {})
+    entry["machine"] = info
+    for slot in ("latest", "baseline") if baseline else ("latest",):
+        stored = entry.setdefault(slot, {"results": {}})
+        stored["started"] = run["started"]
+        stored["min_time"] = run["min_time"]
+        stored["results"].update(run["results"])
+
+    # Write to a temporary file first, so an interrupted write keeps the old results
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+    os.replace(temporary, path)
+    return key
+
+def compare(baseline, latest, threshold):
+    """
+    Compare results benchmark by benchmark.
+
+    A benchmark regresses when its p50 is more than threshold slower,
+    when its peak allocation grows by more than threshold and
+    ALLOCATION_SLACK_BYTES, or when it creates a surface more per call.
+
+    Args:
+        baseline (dict): Baseline results by name
+        latest (dict): Latest results by name
+        threshold (float): Relative change tolerated, e.g. 0.15
+
+    Returns:
+        list: One dict per benchmark in latest, with "regressions" listing
+            what got worse
+    """
+    rows = []
+    for name in sorted(latest):
+        result = latest[name]
+        base = baseline.get(name)
+        row = {"name": name, "p50_us": result["p50_us"], "regressions": []}
+        if base is None:
+            row["status"] = "new"
+            rows.append(row)
+            continue
+        row["p50_change"] = result["p50_us"] / base["p50_us"] - 1.0
+        row["p99_change"] = result["p99_us"] / base["p99_us"] - 1.0
+        if row["p50_change"] > threshold:
+            row["regressions"].append("time")
+        allowed_bytes = base["alloc_peak_bytes"] * (1.0 + threshold) + ALLOCATION_SLACK_BYTES
+        if result["alloc_peak_bytes"] > allowed_bytes:
+            row["regressions"].append("allocations")
+        if result["surfaces_per_op"] >= base["surfaces_per_op"] + 1:
+            row["regressions"].append("surfaces")
+        row["status"] = "REGRESSED" if row["regressions"] else "ok"
+        rows.append(row)
+    return rows
+
+def format_result(name, result):
+    return (
+        f"  {name:<28} {result['ops_per_sec']:>11.1f} ops/s  "
+        f"p50 {result['p50_us']:>10.1f} us  p99 {result['p99_us']:>10.1f} us  "
+        f"peak {result['alloc_peak_bytes'] / 1024:>8.1f} KiB  "
+        f"surfaces {result['surfaces_per_op']:.1f}"
+    )
+
+def format_comparison(rows, threshold):
+    lines = [f"Latest against baseline (threshold {threshold:.0%})"]
+    for row in rows:
+        if row["status"] == "new":
+            lines.append(f"  {row['name']:<28} {row['p50_us']:>10.1f} us  no baseline")
+            continue
+        detail = ", ".join(row["regressions"])
+        lines.append(
+            f"  {row['name']:<28} {row['p50_us']:>10.1f} us  "
+            f"p50 {row['p50_change']:>+7.1%}  p99 {row['p99_change']:>+7.1%}  "
+            f"{row['status']}{' (' + detail + ')' if detail else ''}"
+        )
+    regressed = sum(1 for row in rows if row["regressions"])
+    lines.append("")
+    lines.append(f"FAIL: {regressed} regressed" if regressed else "PASS")
+    return "\n".join(lines)
+
+def print_progress(name, result):
+    print(format_result(name, result), flush=True)
@@ -0,0 +1,60 @@
+"""
+Macro-benchmarks
+
+Whole-game scenarios: a full round of simulation without rendering, and
+a full frame of simulation, visuals and drawing into an offscreen
+surface.
+"""
+
+import random
+
+import pygame
+
+import config
+from benchmarks.harness import benchmark, display_surface
+from benchmarks.micro import DT, keep_playing, playing_game_screen
+
+# Seed for the events of the benchmarked round, so every call plays the same round
+ROUND_SEED = 1
+
+@benchmark("macro", "round.headless")
+def round_headless():
+    from core.game_manager import GameManager
+    from ui.game_screen import GameScreen
+    display_surface()  # GameScreen loads display-converted images
+    game_manager = GameManager()
+    # Only the gameplay rules of the screen run; nothing is drawn
+    game_screen = GameScreen(pygame.Surface((1, 1)), game_manager)
+
+    def operation():
+        random.seed(ROUND_SEED)
+        game_manager.start_game()
+        while game_manager.game_state == "playing":
+            game_manager.update(DT)
+            if game_manager.game_state == "playing":
+                game_screen.update_simulation(DT)
+    return operation
+
+@benchmark("macro", "frame.offscreen")
+def frame_offscreen():
+    from core.simulation import take_snapshot
+    from visuals.ocean_background import OceanBackground
+    from visuals.visual_feedback import VisualFeedback
+    display_surface()
+    screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    game_manager, game_screen = playing_game_screen(screen)
+    ocean_background = OceanBackground(screen)
+    visual_feedback = VisualFeedback(screen)
+
+    def operation():
+        # As CoralReefSimulator runs a playing frame, without the flip
+        keep_playing(game_manager)
+        game_manager.update(DT)
+        game_screen.update_simulation(DT)
+        ocean_background.update(DT)
+        game_screen.update_visuals(DT, take_snapshot(game_manager))
+        visual_feedback.update(DT)
+        ocean_background.draw()
+        game_screen.draw()
+        visual_feedback.draw()
+    return operation
@@ -0,0 +1,145 @@
+"""
+Micro-benchmarks
+
+One method of one component per benchmark, on a steady workload: the
+state a call leaves behind is either restored or converges, so every
+timed call does the same work.
+"""
+
+import config
+from benchmarks.harness import benchmark, display_surface
+
+DT = 1.0 / config.FPS
+
+# Particles kept alive for the particle benchmarks, about three events' worth
+PARTICLE_LOAD = 400
+
+def keep_playing(game_manager):
+    """Hold a game mid-round with a living reef, so no call ends it."""
+    game_manager.round_timer = config.ROUND_DURATION
+    if game_manager.health_system.current_health < 50:
+        game_manager.health_system.current_health = config.INITIAL_HEALTH
+
+def playing_game_screen(screen):
+    """A GameManager in play and a built GameScreen past its tutorial."""
+    from core.game_manager import GameManager
+    from core.simulation import take_snapshot
+    from ui.game_screen import GameScreen
+    game_manager = GameManager()
+    game_manager.start_game()
+    game_screen = GameScreen(screen, game_manager)
+    game_screen.tutorial.active = False
+    game_screen.update_visuals(DT, take_snapshot(game_manager))
+    return game_manager, game_screen
+
+@benchmark("micro", "game_manager.update")
+def game_manager_update():
+    from core.game_manager import GameManager
+    game_manager = GameManager()
+    game_manager.start_game()
+
+    def operation():
+        keep_playing(game_manager)
+        game_manager.update(DT)
+    return operation
+
+@benchmark("micro", "health_system.update")
+def health_system_update():
+    from core.health_system import HealthSystem
+    health_system = HealthSystem()
+
+    def operation():
+        if health_system.current_health < 50:
+            health_system.reset()
+        # Off-optimal, so the damage rules run
+        health_system.temperature = config.TEMP_OPTIMAL + 3.0
+        health_system.update(DT)
+    return operation
+
+@benchmark("micro", "event_system.update")
+def event_system_update():
+    from core.events import EventSystem
+    event_system = EventSystem()
+    return lambda: event_system.update(DT)
+
+def _loaded_particle_system():
+    from visuals.particle_system import ParticleSystem
+    particle_system = ParticleSystem(display_surface())
+    while len(particle_system.particles) < PARTICLE_LOAD:
+        particle_system.create_warning_effect(450, 500)
+    return particle_system
+
+@benchmark("micro", "particle_system.update")
+def particle_system_update():
+    particle_system = _loaded_particle_system()
+
+    def operation():
+        particle_system.update(DT)
+        # Replace expired particles, as an ongoing event does
+        while len(particle_system.particles) < PARTICLE_LOAD:
+            particle_system.create_warning_effect(450, 500)
+    return operation
+
+@benchmark("micro", "particle_system.draw")
+def particle_system_draw():
+    return _loaded_particle_system().draw
+
+@benchmark("micro", "ocean_background.draw")
+def ocean_background_draw():
+    from visuals.ocean_background import OceanBackground
+    ocean_background = OceanBackground(display_surface())
+    ocean_background.update(DT)
+    return ocean_background.draw
+
+@benchmark("micro", "coral_animation.draw")
+def coral_animation_draw():
+    from visuals.animations import CoralAnimation
+    screen = display_surface()
+    coral = CoralAnimation(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 100)
+    coral.update(DT, 60)  # Stressed, so the health tint is not white
+    return lambda: coral.draw(screen)
+
+@benchmark("micro", "fish_animation.draw")
+def fish_animation_draw():
+    from visuals.animations import FishAnimation
+    screen = display_surface()
+    school = FishAnimation(screen)
+    school.x = config.SCREEN_WIDTH / 2  # On screen
+    return lambda: school.draw(screen)
+
+@benchmark("micro", "fish_flock.update")
+def fish_flock_update():
+    from visuals.fish_flock import FishFlock
+    fish_flock = FishFlock(display_surface(), seed=0)
+    return lambda: fish_flock.update(DT, 60)
+
+@benchmark("micro", "background_manager.draw")
+def background_manager_draw():
+    from visuals.background_manager import BackgroundManager
+    background = BackgroundManager(display_surface())
+    background.update(DT, 60)
+    return background.draw
+
+@benchmark("micro", "game_screen.draw")
+def game_screen_draw():
+    game_manager, game_screen = playing_game_screen(display_surface())
+    return game_screen.draw
+
+@benchmark("micro", "environment_field.update")
+def environment_field_update():
+    from core.environment_field import EnvironmentField
+    field = EnvironmentField()
+    ambient = (config.TEMP_OPTIMAL + 1.0, config.PH_OPTIMAL, config.SALINITY_OPTIMAL)
+    return lambda: field.update(DT, ambient, ())
+
+@benchmark("micro", "coral_population.update")
+def coral_population_update():
+    from core.coral_population import CoralPopulation
+    population = CoralPopulation(seed=0)
+    conditions = (config.TEMP_OPTIMAL + 3.0, config.PH_OPTIMAL, config.SALINITY_OPTIMAL)
+
+    def operation():
+        if population.reef_health < 50:
+            population.reset()
+        population.update(DT, conditions)
+    return operation
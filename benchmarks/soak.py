@@ -0,0 +1,180 @@
+"""
+Soak Test
+
+Plays the game headless for a long stretch of simulated time under the
+MemoryTracker and checks that memory reaches a steady state. Rounds and
+games restart as they end, as a player would continue, so state carried
+from one game to the next is exercised too.
+
+After a warm-up, live memory and the lengths of the game's growable
+lists are sampled at intervals. Live memory comes from a tracemalloc
+snapshot that leaves out the tracker and this module, so the samples
+and the tracker's bookkeeping do not count as growth. Growth is the
+least-squares slope of the samples, projected over an hour of play; the
+soak fails when that exceeds config.SOAK_MAX_GROWTH_MB.
+
+Tracing slows the game several times over: on a single slow core an
+hour of play (config.SOAK_DURATION) takes a few hours of wall time.
+"""
+
+import statistics
+import time
+
+import pygame
+
+import config
+from benchmarks.harness import display_surface
+from benchmarks.micro import DT, playing_game_screen
+from utils.memory_tracker import MemoryTracker, format_report
+
+class SoakScene:
+    """
+    A game in play, advanced frame by frame as CoralReefSimulator would.
+
+    Args:
+        draw (bool): Draw every frame into an offscreen surface; slower,
+            but includes the draw paths' allocations
+    """
+
+    def __init__(self, draw=False):
+        from core.simulation import take_snapshot
+        from visuals.ocean_background import OceanBackground
+        from visuals.visual_feedback import VisualFeedback
+        display_surface()
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        self.draw = draw
+        self.take_snapshot = take_snapshot
+        self.game_manager, self.game_screen = playing_game_screen(screen)
+        self.ocean_background = OceanBackground(screen)
+        self.visual_feedback = VisualFeedback(screen)
+        self.games = 1
+
+    def containers(self):
+        """Lengths of the lists that grow with what is on screen."""
+        game_screen = self.game_screen
+        return {
+            "particles": len(game_screen.particle_system.particles),
+            "bubbles": len(game_screen.background.bubbles),
+            "visual_effects": len(self.visual_feedback.effects),
+            "notifications": len(game_screen.achievement_manager.notifications),
+            "active_events": len(self.game_manager.event_system.active_events)
+        }
+
+    def frame(self):
+        game_manager = self.game_manager
+        if game_manager.game_state == "round_end":
+            game_manager.start_next_round()
+        elif game_manager.game_state == "game_over":
+            game_manager.start_game()
+            self.games += 1
+
+        game_manager.update(DT)
+        if game_manager.game_state == "playing":
+            self.game_screen.update_simulation(DT)
+        self.ocean_background.update(DT)
+        self.game_screen.update_visuals(DT, self.take_snapshot(game_manager))
+        self.visual_feedback.update(DT)
+        if self.draw:
+            self.ocean_background.draw()
+            self.game_screen.draw()
+            self.visual_feedback.draw()
+
+def slope(points):
+    """Least-squares slope of (x, y) points."""
+    xs = [x for x, y in points]
+    ys = [y for x, y in points]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+def run_soak(duration, draw=False, warmup=None, sample_interval=None, max_growth_mb=None, progress=None):
+    """
+    Soak the game for duration seconds of simulated play.
+
+    Args:
+        duration (float): Seconds of play after the warm-up
+        draw (bool): Draw every frame as well
+        warmup (float): Seconds of play before growth is measured
+        sample_interval (float): Seconds of play between samples
+        max_growth_mb (float): Growth per hour of play that fails the soak
+        progress (callable): Called with each sample
+
+    Returns:
+        dict: Samples, projected growth per hour, the memory report and
+            whether the soak passed
+    """
+    warmup = config.SOAK_WARMUP if warmup is None else warmup
+    sample_interval = sample_interval or config.SOAK_SAMPLE_INTERVAL
+    max_growth_mb = config.SOAK_MAX_GROWTH_MB if max_growth_mb is None else max_growth_mb
+    frames_per_sample = max(1, int(round(sample_interval / DT)))
+
+    scene = SoakScene(draw)
+    # Snapshots at the samples only; per-frame tracking stays cheap
+    tracker = MemoryTracker(snapshot_interval=0, exclude=(__file__,))
+    tracker.start()
+    wall_start = time.perf_counter()
+    try:
+        for _ in range(int(round(warmup / DT))):
+            scene.frame()
+            tracker.frame()
+        tracker.snapshot()
+        tracker.mark_baseline()
+
+        samples = []
+        for number in range(max(2, int(round(duration / sample_interval))) + 1):
+            if number:
+                for _ in range(frames_per_sample):
+                    scene.frame()
+                    tracker.frame()
+                tracker.snapshot()
+            sample = dict(
+                scene.containers(),
+                minutes=round(number * sample_interval / 60.0, 2),
+                live_bytes=tracker.live_bytes,
+                games=scene.games
+            )
+            samples.append(sample)
+            if progress:
+                progress(sample)
+        report = tracker.report()
+    finally:
+        tracker.stop()
+
+    growth_per_hour = slope([(sample["minutes"] / 60.0, sample["live_bytes"]) for sample in samples])
+    return {
+        "duration": duration,
+        "warmup": warmup,
+        "draw": draw,
+        "wall_seconds": round(time.perf_counter() - wall_start, 1),
+        "samples": samples,
+        "growth_bytes": samples[-1]["live_bytes"] - samples[0]["live_bytes"],
+        "growth_bytes_per_hour": int(growth_per_hour),
+        "max_growth_mb": max_growth_mb,
+        "memory": report,
+        "passed": growth_per_hour <= max_growth_mb * 1024 * 1024
+    }
+
+def format_sample(sample):
+    return (
+        f"  {sample['minutes']:>7.1f} min  {sample['live_bytes'] / 1024:>10,.1f} KiB  "
+        f"games {sample['games']:>3}  particles {sample['particles']:>5}  bubbles {sample['bubbles']:>4}  "
+        f"effects {sample['visual_effects']:>3}  events {sample['active_events']}"
+    )
+
+def format_result(result):
+    lines = [
+        "",
+        format_report(result["memory"]),
+        "",
+        f"Soak of {result['duration'] / 60.0:g} min of play after {result['warmup']:.0f}s warm-up "
+        f"({result['wall_seconds']:.0f}s wall{', drawing' if result['draw'] else ''})",
+        f"  growth: {result['growth_bytes'] / 1024:+,.1f} KiB measured, "
+        f"{result['growth_bytes_per_hour'] / (1024 * 1024):+.2f} MiB per hour projected "
+        f"(limit {result['max_growth_mb']:.1f} MiB)",
+        "",
+        "PASS" if result["passed"] else "FAIL"
+    ]
+    return "\n".join(lines)
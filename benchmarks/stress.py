@@ -0,0 +1,364 @@
+"""
+Stress Scenarios
+
+Renderer load tests beyond normal play: a configurable number of corals,
+fish, particles, bubbles, VisualEffect texts and achievement
+notifications, with scripted event storms fed to the EventSystem. Frames
+run offscreen at a fixed delta for a fixed duration while each subsystem
+is timed, and the report gives the frame-time distribution and, for the
+frames over budget, the subsystem that took the most of them.
+
+Counts default to config.STRESS_SCENARIO; a list of scales runs the
+scenario at each multiple of the counts, to find where frame time stops
+growing in proportion.
+"""
+
+import gc
+import random
+import statistics
+import time
+
+import pygame
+
+import config
+from benchmarks.harness import display_surface
+from benchmarks.micro import DT, keep_playing, playing_game_screen
+from core.events import EVENT_TYPES, Event
+
+# Counts that scale with --scale; storm timing does not
+SCALED_COUNTS = ("corals", "fish", "fish_schools", "particles", "bubbles", "texts", "achievements", "storm_size")
+
+class EventStorm:
+    """
+    Scripted events for GameManager.event_schedule: every interval
+    seconds, size events start together and last duration seconds.
+
+    Args:
+        interval (float): Seconds from one storm to the next
+        size (int): Events per storm, cycling through EVENT_TYPES
+        duration (float): Seconds each storm lasts
+    """
+
+    def __init__(self, interval, size, duration):
+        self.interval = interval
+        self.size = size
+        self.duration = min(duration, interval)
+        self.storms = {}
+
+    def _storm(self, index):
+        # The same Event objects every tick, so the EventSystem counts each once
+        events = self.storms.get(index)
+        if events is None:
+            events = []
+            for number in range(self.size):
+                event_type = EVENT_TYPES[(index * self.size + number) % len(EVENT_TYPES)]
+                event = Event(event_type["description"], dict(event_type["effects"]))
+                event.duration = event.time_remaining = self.duration
+                events.append(event)
+            self.storms = {key: value for key, value in self.storms.items() if key >= index - 1}
+            self.storms[index] = events
+        return events
+
+    def events_at(self, time, warning_time):
+        index = int(time // self.interval)
+        start = index * self.interval
+        active = self._storm(index) if time - start < self.duration else []
+        upcoming = None
+        if self.size and start + self.interval - time <= warning_time:
+            upcoming = self._storm(index + 1)[0]
+        return active, upcoming
+
+class SubsystemClock:
+    """
+    Per-frame self time of instrumented methods, grouped by subsystem.
+
+    Methods are wrapped on the instance, so only the objects of the stress
+    scene are timed. Time spent in an instrumented method called from
+    another one counts toward the inner subsystem only.
+    """
+
+    def __init__(self):
+        self.frame = {}
+        self._stack = []
+
+    def wrap(self, function, name):
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = self._stack.pop()
+                self.frame[name] = self.frame.get(name, 0.0) + elapsed - children
+                if self._stack:
+                    self._stack[-1] += elapsed
+        return timed
+
+    def instrument(self, target, methods, name):
+        for method in methods:
+            setattr(target, method, self.wrap(getattr(target, method), name))
+
+    def take_frame(self):
+        frame = self.frame
+        self.frame = {}
+        return frame
+
+class GarbageCollectionClock:
+    """
+    Pauses of the cyclic garbage collector, through gc.callbacks.
+
+    Collections run inside whatever allocated last, so their time is
+    also part of that subsystem's; this clock reports them on their own.
+    """
+
+    def __init__(self):
+        self.pauses = []
+        self._start = None
+
+    def __enter__(self):
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            self.pauses.append(time.perf_counter() - self._start)
+            self._start = None
+
+class StressScene:
+    """
+    A game in play with its visual load raised to the given counts.
+
+    Args:
+        counts (dict): Keys of config.STRESS_SCENARIO
+        screen (pygame.Surface): Target of the frames
+    """
+
+    def __init__(self, counts, screen):
+        from core.achievements import Achievement
+        from core.simulation import take_snapshot
+        from visuals.animations import CoralAnimation, FishAnimation
+        from visuals.ocean_background import OceanBackground
+        from visuals.visual_feedback import VisualFeedback
+
+        random.seed(0)
+        self.counts = counts
+        self.screen = screen
+        self.take_snapshot = take_snapshot
+        self.game_manager, self.game_screen = playing_game_screen(screen)
+        self.game_manager.event_schedule = EventStorm(
+            counts["storm_interval"], counts["storm_size"], counts["storm_duration"]
+        )
+        game_screen = self.game_screen
+
+        # A bigger reef, in rows along the bottom
+        game_screen.corals = [
+            CoralAnimation(
+                random.randint(50, config.SCREEN_WIDTH - 50),
+                config.SCREEN_HEIGHT - random.randint(40, 160)
+            )
+            for _ in range(counts["corals"])
+        ]
+        if game_screen.fish_flock:
+            from visuals.fish_flock import FishFlock
+            game_screen.fish_flock = FishFlock(screen, count=max(1, counts["fish"]), seed=0)
+            game_screen.fish_flock.set_reef([(coral.x, coral.y) for coral in game_screen.corals])
+        game_screen.fish_schools = [FishAnimation(screen) for _ in range(counts["fish_schools"])]
+
+        self.ocean_background = OceanBackground(screen)
+        self.visual_feedback = VisualFeedback(screen)
+        self.notifications = [
+            Achievement(f"Stress Test {number + 1}", "", (), lambda state: False)
+            for number in range(counts["achievements"])
+        ]
+        self.refill(initial=True)
+
+        self.clock = SubsystemClock()
+        self._instrument()
+
+    def _instrument(self):
+        clock = self.clock
+        game_screen = self.game_screen
+        clock.instrument(self.game_manager, ("update",), "simulation")
+        clock.instrument(game_screen, ("update_simulation",), "simulation")
+        clock.instrument(game_screen, ("update_visuals", "draw"), "game_screen")
+        clock.instrument(self.ocean_background, ("update", "draw"), "ocean")
+        clock.instrument(game_screen.background, ("update", "draw"), "background")
+        for coral in game_screen.corals:
+            clock.instrument(coral, ("update", "draw"), "corals")
+        if game_screen.fish_flock:
+            clock.instrument(game_screen.fish_flock, ("update", "draw"), "fish")
+        for school in game_screen.fish_schools:
+            clock.instrument(school, ("update", "draw"), "fish")
+        clock.instrument(game_screen.particle_system, ("update", "draw", "create_warning_effect"), "particles")
+        clock.instrument(game_screen.achievement_manager, ("update", "draw"), "achievements")
+        clock.instrument(self.visual_feedback, ("update", "draw"), "texts")
+        self.flip = clock.wrap(pygame.display.flip, "display")
+
+    def refill(self, initial=False):
+        """Top the particles, bubbles, texts and notifications back up to their counts."""
+        counts = self.counts
+        game_screen = self.game_screen
+        particle_system = game_screen.particle_system
+        while len(particle_system.particles) < counts["particles"]:
+            particle_system.create_bubble_effect(
+                random.randint(0, config.SCREEN_WIDTH), random.randint(100, config.SCREEN_HEIGHT), 10
+            )
+
+        background = game_screen.background
+        while len(background.bubbles) < counts["bubbles"]:
+            background.create_bubbles()
+        if initial:
+            # Spread the first bubbles over the screen instead of all rising from the bottom
+            for bubble in background.bubbles:
+                bubble.y = random.uniform(0, config.SCREEN_HEIGHT)
+
+        visual_feedback = self.visual_feedback
+        while len(visual_feedback.effects) < counts["texts"]:
+            visual_feedback.add_health_change(
+                random.randint(50, config.SCREEN_WIDTH - 100), random.randint(80, config.SCREEN_HEIGHT - 200),
+                random.uniform(-5.0, 5.0)
+            )
+
+        notifications = game_screen.achievement_manager.notifications
+        for achievement in self.notifications:
+            if achievement.time_remaining <= 0:
+                achievement.time_remaining = achievement.notification_time
+                notifications.append(achievement)
+
+    def frame(self):
+        """
+        Run one frame the way CoralReefSimulator runs a playing frame.
+
+        Returns:
+            tuple: (frame seconds, self seconds by subsystem)
+        """
+        keep_playing(self.game_manager)
+        self.refill()
+        self.clock.take_frame()
+
+        start = time.perf_counter()
+        self.game_manager.update(DT)
+        self.game_screen.update_simulation(DT)
+        self.ocean_background.update(DT)
+        self.game_screen.update_visuals(DT, self.take_snapshot(self.game_manager))
+        self.visual_feedback.update(DT)
+        self.ocean_background.draw()
+        self.game_screen.draw()
+        self.visual_feedback.draw()
+        self.flip()
+        elapsed = time.perf_counter() - start
+
+        subsystems = self.clock.take_frame()
+        subsystems["other"] = max(0.0, elapsed - sum(subsystems.values()))
+        return elapsed, subsystems
+
+def scaled_counts(counts, scale):
+    scaled = dict(counts)
+    for key in SCALED_COUNTS:
+        scaled[key] = int(round(counts[key] * scale))
+    return scaled
+
+def run_scenario(counts, duration, budget=None):
+    """
+    Run a stress scene for duration seconds of game time.
+
+    Args:
+        counts (dict): Keys of config.STRESS_SCENARIO
+        duration (float): Game seconds; frames advance by 1 / config.FPS
+        budget (float): Frame budget in seconds, 1 / config.FPS by default
+
+    Returns:
+        dict: Report with the frame-time distribution, per-subsystem
+            times, the subsystems blamed for over-budget frames and the
+            garbage collector's pauses
+    """
+    budget = budget or 1.0 / config.FPS
+    scene = StressScene(counts, display_surface())
+    gc.collect()  # Start without the setup's garbage
+    frames = []
+    per_subsystem = {}
+    blamed = {}
+    with GarbageCollectionClock() as gc_clock:
+        for _ in range(max(1, int(round(duration / DT)))):
+            elapsed, subsystems = scene.frame()
+            frames.append(elapsed)
+            for name, seconds in subsystems.items():
+                per_subsystem.setdefault(name, []).append(seconds)
+            if elapsed > budget:
+                worst = max(subsystems, key=subsystems.get)
+                blamed[worst] = blamed.get(worst, 0) + 1
+
+    def ms(seconds):
+        return round(seconds * 1000.0, 3)
+
+    percentiles = statistics.quantiles(frames, n=100, method="inclusive")
+    over_budget = sum(1 for elapsed in frames if elapsed > budget)
+    subsystems = {}
+    for name, times in per_subsystem.items():
+        times += [0.0] * (len(frames) - len(times))  # Frames it did not run in
+        subsystems[name] = {
+            "mean_ms": ms(statistics.fmean(times)),
+            "p99_ms": ms(statistics.quantiles(times, n=100, method="inclusive")[98]),
+            "blamed_frames": blamed.get(name, 0)
+        }
+    return {
+        "counts": counts,
+        "frames": len(frames),
+        "budget_ms": ms(budget),
+        "frame_ms": {
+            "mean": ms(statistics.fmean(frames)),
+            "p50": ms(statistics.median(frames)),
+            "p90": ms(percentiles[89]),
+            "p99": ms(percentiles[98]),
+            "max": ms(max(frames))
+        },
+        "over_budget_frames": over_budget,
+        "gc": {
+            "collections": len(gc_clock.pauses),
+            "total_ms": ms(sum(gc_clock.pauses)),
+            "max_ms": ms(max(gc_clock.pauses, default=0.0))
+        },
+        "subsystems": dict(sorted(subsystems.items(), key=lambda item: -item[1]["mean_ms"])),
+        "bottleneck": max(blamed, key=blamed.get) if blamed else None
+    }
+
+def format_report(report, scale=None):
+    counts = report["counts"]
+    frame_ms = report["frame_ms"]
+    title = f"Stress scenario{f' at scale {scale:g}' if scale is not None else ''}: " + ", ".join(
+        f"{counts[key]} {key.replace('_', ' ')}" for key in SCALED_COUNTS
+    )
+    lines = [
+        title,
+        f"  {report['frames']} frames, budget {report['budget_ms']:.1f} ms",
+        f"  frame time: mean {frame_ms['mean']:.1f} ms, p50 {frame_ms['p50']:.1f}, "
+        f"p90 {frame_ms['p90']:.1f}, p99 {frame_ms['p99']:.1f}, max {frame_ms['max']:.1f}",
+        f"  over budget: {report['over_budget_frames']} frames "
+        f"({report['over_budget_frames'] / report['frames']:.0%})",
+        f"  gc: {report['gc']['collections']} collections, {report['gc']['total_ms']:.1f} ms in total, "
+        f"longest {report['gc']['max_ms']:.2f} ms",
+        "",
+        f"  {'subsystem':<14} {'mean ms':>8} {'p99 ms':>8} {'blamed':>7}"
+    ]
+    for name, times in report["subsystems"].items():
+        lines.append(f"  {name:<14} {times['mean_ms']:>8.2f} {times['p99_ms']:>8.2f} {times['blamed_frames']:>7}")
+    if report["bottleneck"]:
+        lines.append("")
+        lines.append(f"  Budget exceeded mostly in: {report['bottleneck']}")
+    return "\n".join(lines)
+
+def format_sweep(reports):
+    """One line per scale: where frame time stops scaling with load."""
+    lines = ["", f"  {'scale':>6} {'p50 ms':>8} {'p99 ms':>8} {'over':>6}  bottleneck"]
+    for scale, report in reports:
+        lines.append(
+            f"  {scale:>6g} {report['frame_ms']['p50']:>8.1f} {report['frame_ms']['p99']:>8.1f} "
+            f"{report['over_budget_frames'] / report['frames']:>6.0%}  {report['bottleneck'] or '-'}"
+        )
+    return "\n".join(lines)
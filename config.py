@@ -13,11 +13,31 @@ Contains:
 - Event timing configurations
 """
 
+import os
+
+# Asset locations, relative to the package rather than the working directory
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(PACKAGE_DIR, "assets")
+
 # Screen settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+# Frame-rate governor
+# Per-state frame cap; None blocks on input because nothing animates there
+STATE_FPS = {
+    "playing": FPS,
+    "menu": None,
+    "round_end": None,
+    "game_over": None,
+    "loading": FPS  # Menu shown while screens are still being built
+}
+IDLE_FPS = 10              # Frame cap while the window is unfocused or minimized
+IDLE_WAKE_INTERVAL = 1.0   # Seconds a blocked loop waits before redrawing anyway
+INPUT_GRACE_PERIOD = 1.0   # Seconds of full frame rate after the last input
+CPU_REPORT_INTERVAL = 30.0 # Seconds between CPU-use log reports
+
 # Colors
 OCEAN_BLUE = (0, 105, 148)
 WHITE = (255, 255, 255)
@@ -95,4 +115,176 @@ DIFFICULTY_SCORE_MULTIPLIER = {
     "easy": 0.8,
     "normal": 1.0,
     "hard": 1.5
-} 
\ No newline at end of file
+} 
+
+# Logging settings
+LOG_FORMAT = "text"  # "text" or "json" (one JSON object per line)
+# Rate limit per logger call site as (records per second, burst). Child
+# loggers inherit the closest parent's limit; CRITICAL is never limited.
+LOG_RATE_LIMITS = {
+    "coral_reef_simulator": (5.0, 20)
+}
+
+# Metrics settings
+METRICS_ENABLED = True                    # Periodically export the metrics registry
+METRICS_EXPORT_PATH = "logs/metrics.prom" # Prometheus text format snapshot
+METRICS_EXPORT_INTERVAL = 10.0            # Seconds between snapshots
+METRICS_HTTP_PORT = None                  # e.g. 9108 to serve /metrics on localhost
+
+# Telemetry settings
+TELEMETRY_ENABLED = False     # Record per-tick session telemetry (requires numpy)
+TELEMETRY_DIR = "telemetry"   # One subdirectory per recorded game
+TELEMETRY_CHUNK_TICKS = 4096  # Ticks buffered in memory between flushes
+
+# Import audit (python -m utils.import_audit)
+# Cold-import budget for the game's own modules, as a fraction of the cold
+# import of these stdlib modules measured in the same audit run (the game
+# currently needs about 0.6 on an idle machine)
+IMPORT_BUDGET_RATIO = 1.0
+IMPORT_REFERENCE = ("logging", "argparse", "json", "unittest")
+# Modules that must not be imported before the first frame
+IMPORT_DEFERRED = (
+    "ui.game_screen",
+    "audio.sound_manager",
+    "visuals.animations",
+    "sqlite3",
+    "http.server"
+)
+
+# Object pools (particles, floating texts, bubbles)
+OBJECT_POOL_CAPACITY = 5000  # Most retired objects each pool keeps for reuse
+
+# Memory tracking (tracemalloc; slows the game while on)
+MEMORY_TRACKING = False           # Track allocations per frame and log reports
+MEMORY_TRACE_FRAMES = 8           # Call stack depth recorded per allocation
+MEMORY_SNAPSHOT_INTERVAL = 300    # Frames between per-subsystem snapshots
+MEMORY_WINDOW_FRAMES = 600        # Recent frames in the per-frame percentiles
+MEMORY_TOP_SITES = 10             # Allocation sites listed in reports
+MEMORY_REPORT_INTERVAL = 60.0     # Seconds between logged reports
+
+# Soak test (python -m benchmarks soak)
+SOAK_DURATION = 3600.0        # Seconds of simulated play
+SOAK_WARMUP = 120.0           # Seconds of play before growth is measured
+SOAK_SAMPLE_INTERVAL = 60.0   # Seconds of play between memory samples
+SOAK_MAX_GROWTH_MB = 8.0      # Traced memory growth per hour of play that fails the soak
+
+# Benchmarks (python -m benchmarks)
+BENCHMARK_RESULTS_PATH = os.path.join(PACKAGE_DIR, "benchmarks", "results.json")  # Keyed by machine fingerprint
+BENCHMARK_MIN_TIME = 1.0               # Least seconds of timed calls per benchmark
+BENCHMARK_REGRESSION_THRESHOLD = 0.15  # p50 slowdown or allocation growth flagged by compare
+
+# Stress scenarios (python -m benchmarks stress)
+STRESS_SCENARIO = {
+    "corals": 40,           # Reef corals drawn
+    "fish": 200,            # Flock size, with FISH_FLOCKING
+    "fish_schools": 8,      # FishAnimation schools
+    "particles": 1500,      # Particles kept alive, on top of the ones events create
+    "bubbles": 300,         # Background bubbles
+    "texts": 40,            # VisualEffect texts shown at once
+    "achievements": 6,      # Achievement notifications shown at once
+    "storm_interval": 4.0,  # Seconds between event storms
+    "storm_size": 6,        # Events active at once during a storm
+    "storm_duration": 3.0   # Seconds each storm lasts
+}
+STRESS_DURATION = 20.0      # Seconds of game time per stress run
+
+# Screens are built between menu frames, at most this many seconds per frame
+LOADING_FRAME_BUDGET = 0.012
+
+# Simulation threading
+SIM_THREAD = False  # Tick the simulation on its own thread at a fixed rate
+SIM_RATE = 60       # Simulation steps per second in threaded mode
+
+# Time warp ([ and ] while playing)
+TIME_WARP_LEVELS = (1, 2, 4, 8, 32)  # Selectable sim speed multipliers
+TIME_WARP_MAX_STEP = 1 / 30          # Longest sim step in seconds; longer frames are substepped
+TIME_WARP_MAX_SUBSTEPS = 32          # Most sim steps per frame (or per fixed tick when threaded)
+TIME_WARP_BUDGET = 0.008             # Wall-clock seconds of sim work per frame before warp gives way
+TIME_WARP_VISUAL_RATE = 2.0          # Fastest speed-up of fish, particles and waves
+
+# Spatial environment field
+ENVIRONMENT_FIELD_ENABLED = False  # Resolve conditions on a grid instead of one value each
+FIELD_SIZE = (256, 256)            # Grid rows and columns over the screen
+FIELD_DIFFUSION = 8.0              # Diffusivity in cells^2 per second
+FIELD_CURRENT = (6.0, 0.0)         # Uniform current (x, y) in cells per second
+FIELD_RELAXATION_TIME = 20.0       # Seconds for the reef to settle to the slider values
+FIELD_EVENT_RADIUS = (0.06, 0.12)  # Event footprint radius range, fraction of screen width
+
+# Per-colony coral population
+CORAL_POPULATION_ENABLED = False  # Model individual colonies; reef health is their mean
+CORAL_COLONIES = 5000             # Colonies simulated (vectorized; scales to 100k)
+# Damage multiplier per species; order is the species code order
+CORAL_SPECIES_TOLERANCE = {
+    "branching": 1.3,  # Fast-growing, bleaches first
+    "fan": 1.0,
+    "brain": 0.7       # Massive, most tolerant
+}
+CORAL_BLEACH_HEALTH = 30       # Stressed colonies below this health bleach
+CORAL_RECOVERY_TIME = 10.0     # Stress-free seconds a bleached colony needs to recover
+CORAL_RENDER_COUNT = 12        # Corals drawn, each standing for a strip of colonies
+
+# Fish schooling (boids)
+FISH_FLOCKING = True          # Per-fish flocking; False uses the rigid FishAnimation schools
+FISH_COUNT = 60               # Fish in the flock; about 2000 fit in a 60 FPS frame, 3000 do not
+FISH_NEIGHBOUR_RADIUS = 50.0  # Pixels; also the spatial hash cell size
+FISH_SEPARATION_RADIUS = 18.0 # Pixels within which fish push apart
+FISH_COHESION = 1.0           # Steering toward neighbours' centre (1/s^2)
+FISH_ALIGNMENT = 2.0          # Steering toward neighbours' velocity (1/s)
+FISH_SEPARATION = 2000.0      # Push from close neighbours (px^3/s^2)
+FISH_REEF_AVOIDANCE = 300.0   # Push from a fully stressed coral (px/s^2)
+FISH_REEF_AVOID_RADIUS = 160.0
+FISH_BOUND_STRENGTH = 4.0     # Steering back inside the top and bottom bounds (1/s^2)
+FISH_WANDER = 20.0            # Random steering (px/s^2)
+FISH_MIN_SPEED = 40.0         # Pixels per second, before the stress multiplier
+FISH_MAX_SPEED = 100.0
+
+# Decades mode: a climate scenario drives conditions and events, and the
+# game's rounds span the whole scenario
+CLIMATE_START_YEAR = 2025
+CLIMATE_YEARS = 100
+CLIMATE_SCENARIO = "moderate"
+# Trends per decade: warming in degrees C, acidification in pH units
+CLIMATE_SCENARIOS = {
+    "low": {"warming": 0.1, "acidification": 0.01},
+    "moderate": {"warming": 0.25, "acidification": 0.02},
+    "high": {"warming": 0.45, "acidification": 0.035}
+}
+# Amplitude of the yearly cycle around the trend
+CLIMATE_SEASONAL = {"temperature": 1.5, "ph": 0.05, "salinity": 0.8}
+CLIMATE_EVENT_RATE = 1.0            # Events per year before warming, rising with it
+CLIMATE_EVENT_DURATION = (0.04, 0.15)  # Years an event lasts
+CLIMATE_RECOVERY_RATE = 1.0         # Health per game second when all factors are in range
+CLIMATE_RESPONSE_TIME = 2.0         # Seconds for conditions to return to the climate after a slider move
+# Adaptive integrator for headless runs: step bounds in years and the
+# health error accepted per step
+CLIMATE_MAX_STEP = 0.25
+CLIMATE_MIN_STEP = 1e-4
+CLIMATE_TOLERANCE = 0.02
+
+# Profile store settings
+PROFILE_STORE_ENABLED = True          # Persist runs, leaderboards and achievements
+PROFILE_DB_PATH = "data/profiles.db"  # SQLite database (WAL mode)
+PROFILE_BATCH_WINDOW = 0.25           # Seconds the writer gathers writes per commit
+LEADERBOARD_SIZE = 5                  # Top scores shown per difficulty
+DEFAULT_PROFILE = "Player"            # Profile runs are recorded under
+
+# Audio output: "mixer" (sound device), "null" (silent) or "recording"
+# (logs play requests). The CORAL_AUDIO_BACKEND environment variable overrides.
+AUDIO_BACKEND = "mixer"
+
+# Audio scheduling
+AUDIO_CHANNELS = 16          # Mixer channels allocated
+AUDIO_RESERVED_CHANNELS = 2  # Channels only warning-class sounds may take
+AUDIO_MAX_VOICES = 12        # Mixing budget: sound effects playing at once
+# Per-sound cooldown (seconds), concurrent voice limit, stealing priority
+# and access to the reserved channels
+SOUND_POLICIES = {
+    "warning": {"cooldown": 1.0, "max_voices": 1, "priority": 10, "reserved": True},
+    "alert": {"cooldown": 2.0, "max_voices": 1, "priority": 8, "reserved": True},
+    "fail": {"cooldown": 0.5, "max_voices": 1, "priority": 6},
+    "success": {"cooldown": 0.5, "max_voices": 1, "priority": 6},
+    "splash": {"cooldown": 0.2, "max_voices": 2, "priority": 3},
+    "bubble": {"cooldown": 0.1, "max_voices": 4, "priority": 1}
+}
+DEFAULT_SOUND_POLICY = {"cooldown": 0.1, "max_voices": 2, "priority": 5}
+SOUND_CACHE_DIR = "cache/sounds"  # Rendered PCM of synthesized sound effects
@@ -1,15 +1,68 @@
+import collections
 import pygame
 import config
 
+"""
+Achievements Module
+
+Declarative achievement rules evaluated incrementally.
+
+Each achievement names the state keys its condition depends on. The
+manager keeps the last published value of every key and re-evaluates only
+the rules whose keys changed, and retires rules once they unlock, so the
+per-frame cost stays flat however many achievements ship.
+
+Features:
+- Dependency-tracked rule evaluation
+- Retirement of unlocked rules
+- Streak counters for "for N seconds" and "N in a row" conditions
+- Unlock notifications
+"""
+
+class StreakCounter:
+    """
+    Length of the current run of consecutive successful observations.
+
+    Attributes:
+        current (float): Length of the ongoing streak
+        best (float): Longest streak seen
+    """
+
+    def __init__(self):
+        self.current = 0
+        self.best = 0
+
+    def update(self, success, amount=1):
+        """
+        Extend the streak on success, reset it otherwise.
+
+        Args:
+            success (bool): Whether this observation continues the streak
+            amount (float): How much to extend by (seconds or a count)
+        """
+        if success:
+            self.current += amount
+            self.best = max(self.best, self.current)
+        else:
+            self.current = 0
+
+    def reset(self):
+        self.current = 0
+
 class Achievement:
-    def __init__(self, name, description, condition):
+    __slots__ = (
+        "name", "description", "depends_on", "condition", "unlocked", "notification_time", "time_remaining"
+    )
+
+    def __init__(self, name, description, depends_on, condition):
         self.name = name
         self.description = description
+        self.depends_on = tuple(depends_on)
         self.condition = condition
         self.unlocked = False
         self.notification_time = 3.0
         self.time_remaining = 0
-        
+
     def check(self, game_state):
         if not self.unlocked and self.condition(game_state):
             self.unlocked = True
@@ -22,48 +75,101 @@ class AchievementManager:
         self.screen = screen
         self.font = pygame.font.Font(None, 32)
         self.achievements = self.create_achievements()
-        
+        self.state = {}
+        self.notifications = []
+        # Unlocks waiting to be shown; filled by update_state(), which may
+        # run on the simulation thread, and drained by update()
+        self.pending = collections.deque()
+
+        # State key -> pending achievements that depend on it
+        self.rules_by_key = {}
+        for achievement in self.achievements:
+            for key in achievement.depends_on:
+                self.rules_by_key.setdefault(key, []).append(achievement)
+
     def create_achievements(self):
         return [
             Achievement(
                 "Perfect Balance",
                 "Maintain optimal conditions for 30 seconds",
-                lambda state: state.get("optimal_time", 0) >= 30
+                ("optimal_streak",),
+                lambda state: state["optimal_streak"] >= 30
             ),
             Achievement(
                 "Quick Recovery",
                 "Restore reef health from below 30% to above 70%",
-                lambda state: state.get("recovery_achieved", False)
+                ("recovery_achieved",),
+                lambda state: state["recovery_achieved"]
             ),
             Achievement(
                 "Event Master",
                 "Successfully handle 5 consecutive events",
-                lambda state: state.get("events_handled", 0) >= 5
+                ("event_streak",),
+                lambda state: state["event_streak"] >= 5
             )
         ]
-        
-    def update(self, delta_time, game_state):
-        for achievement in self.achievements:
-            if achievement.time_remaining > 0:
-                achievement.time_remaining -= delta_time
-                
+
+    def update(self, delta_time):
+        """Count down the unlock notifications currently shown."""
+        while self.pending:
+            self.notifications.append(self.pending.popleft())
+        for achievement in self.notifications:
+            achievement.time_remaining -= delta_time
+        self.notifications = [a for a in self.notifications if a.time_remaining > 0]
+
+    def update_state(self, changes):
+        """
+        Publish state values and evaluate the rules they affect.
+
+        Args:
+            changes (dict): State key to current value. Keys whose value is
+                unchanged since the last call cost one comparison.
+
+        Returns:
+            list: Achievements unlocked by this update
+        """
+        dirty = []
+        state = self.state
+        for key, value in changes.items():
+            if key in state and state[key] == value:
+                continue
+            state[key] = value
+            dirty.extend(self.rules_by_key.get(key, ()))
+
+        unlocked = []
+        for achievement in dirty:
+            if achievement.unlocked:
+                continue  # Listed under several changed keys
+            if all(key in state for key in achievement.depends_on) and achievement.check(state):
+                unlocked.append(achievement)
+                self.pending.append(achievement)
+                self._retire(achievement)
+        return unlocked
+
     def check_achievements(self, game_state):
-        for achievement in self.achievements:
-            achievement.check(game_state)
-            
+        return self.update_state(game_state)
+
+    def _retire(self, achievement):
+        for key in achievement.depends_on:
+            rules = self.rules_by_key.get(key)
+            if rules is None:
+                continue
+            rules.remove(achievement)
+            if not rules:
+                del self.rules_by_key[key]
+
     def draw(self):
         y = 50
-        for achievement in self.achievements:
-            if achievement.time_remaining > 0:
-                # Draw achievement notification
-                text = f"Achievement Unlocked: {achievement.name}"
-                surface = self.font.render(text, True, config.GREEN)
-                rect = surface.get_rect(right=config.SCREEN_WIDTH - 20, top=y)
-                
-                # Draw background
-                bg_rect = rect.inflate(20, 10)
-                pygame.draw.rect(self.screen, (0, 0, 0), bg_rect)
-                pygame.draw.rect(self.screen, config.GREEN, bg_rect, 2)
-                
-                self.screen.blit(surface, rect)
-                y += 50 
\ No newline at end of file
+        for achievement in self.notifications:
+            # Draw achievement notification
+            text = f"Achievement Unlocked: {achievement.name}"
+            surface = self.font.render(text, True, config.GREEN)
+            rect = surface.get_rect(right=config.SCREEN_WIDTH - 20, top=y)
+
+            # Draw background
+            bg_rect = rect.inflate(20, 10)
+            pygame.draw.rect(self.screen, (0, 0, 0), bg_rect)
+            pygame.draw.rect(self.screen, config.GREEN, bg_rect, 2)
+
+            self.screen.blit(surface, rect)
+            y += 50
@@ -0,0 +1,356 @@
+"""
+Climate Scenario Module
+
+Long-horizon "decades" mode. A scenario describes reef conditions over
+many years as a warming and acidification trend with a yearly cycle, plus
+a schedule of events (heat waves, acid rain, ...) whose frequency and mix
+shift as the ocean warms. In game, each simulated year compresses to a
+few seconds and the scenario replaces the EventSystem's random timer.
+
+Headless, integrate() runs the reef through the whole scenario with an
+adaptive step: months at a time while nothing changes, refined near
+threshold crossings and never stepping across an event's start or end.
+
+Features:
+- Low, moderate and high trend presets (config.CLIMATE_SCENARIOS)
+- Seeded, reproducible event schedule (Poisson process thinned by a
+  warming-dependent rate)
+- Heun integration with an embedded Euler error estimate
+- Yearly summary: health, warmest conditions, first bleaching and collapse
+
+Usage:
+    python -m core.climate_scenario [--scenario moderate] [--years 100] [--seed N] [--json]
+"""
+
+import argparse
+import bisect
+import collections
+import json
+import math
+import random
+import sys
+import time
+import config
+from core.events import Event, EVENT_TYPES
+from core.health_system import DAMAGE_THRESHOLDS, DAMAGE_WEIGHTS
+
+FACTORS = ("temperature", "ph", "salinity")
+OPTIMAL = (config.TEMP_OPTIMAL, config.PH_OPTIMAL, config.SALINITY_OPTIMAL)
+LIMITS = (
+    (config.TEMP_MIN, config.TEMP_MAX),
+    (config.PH_MIN, config.PH_MAX),
+    (config.SALINITY_MIN, config.SALINITY_MAX)
+)
+TWO_PI = 2.0 * math.pi
+
+
+ScenarioResult = collections.namedtuple("ScenarioResult", [
+    "years",                # Years simulated
+    "final_health",
+    "first_bleaching_year", # First year health fell below CORAL_BLEACH_HEALTH, or None
+    "collapse_year",        # Year health reached zero, or None
+    "steps",                # Accepted integrator steps
+    "rejected_steps",       # Steps retried with a smaller size
+    "events",               # Events in the schedule up to the end of the run
+    "yearly"                # (year, health, warmest temperature, lowest pH) per year
+])
+
+class ClimateScenario:
+    """
+    Conditions and events over a span of years.
+
+    Time t is in years from the start of the scenario.
+
+    Args:
+        preset (str): Key of config.CLIMATE_SCENARIOS
+        years (int): Length of the scenario
+        seed (int): Seed for the event schedule
+        seconds_per_year (float): Game seconds one year takes; by default
+            the rounds of a game span the whole scenario
+    """
+
+    def __init__(self, preset=None, years=None, seed=None, seconds_per_year=None):
+        self.preset = preset or config.CLIMATE_SCENARIO
+        trends = config.CLIMATE_SCENARIOS[self.preset]
+        self.years = years or config.CLIMATE_YEARS
+        self.start_year = config.CLIMATE_START_YEAR
+        self.seconds_per_year = seconds_per_year or (
+            config.ROUND_DURATION * config.TOTAL_ROUNDS / self.years
+        )
+
+        # Trend per year and yearly cycle per factor, in FACTORS order
+        self.trend = (trends["warming"] / 10.0, -trends["acidification"] / 10.0, 0.0)
+        self.amplitude = tuple(config.CLIMATE_SEASONAL[factor] for factor in FACTORS)
+        # Warm season peaks a quarter into the year, with the lowest pH;
+        # the wet season lowers salinity at the start of the year
+        self.phase = (0.0, math.pi, math.pi)
+        # Bound on each factor's second derivative, for step refinement
+        self.max_curvature = tuple(TWO_PI * TWO_PI * amplitude for amplitude in self.amplitude)
+
+        self.events = []
+        self.event_starts = []
+        self.event_ends = []
+        self._schedule_events(random.Random(seed))
+        self.max_event_duration = config.CLIMATE_EVENT_DURATION[1]
+
+    def warming(self, t):
+        """Warming above the starting climate at year t, in degrees C."""
+        return self.trend[0] * t
+
+    def event_rate(self, t):
+        """Expected events per year at year t."""
+        return config.CLIMATE_EVENT_RATE * (1.0 + self.warming(t))
+
+    def _schedule_events(self, rng):
+        # Poisson process with rising rate, by thinning a process at the peak rate
+        peak_rate = self.event_rate(self.years)
+        t = 0.0
+        while True:
+            t += rng.expovariate(peak_rate)
+            if t >= self.years:
+                break
+            if rng.random() * peak_rate > self.event_rate(t):
+                continue
+            if self.event_ends and t < self.event_ends[-1]:
+                continue  # One event at a time, as in the EventSystem
+
+            # Warming makes heat waves and acidification events likelier
+            warming = self.warming(t)
+            weights = []
+            for event_type in EVENT_TYPES:
+                effects = event_type["effects"]
+                weight = 1.0
+                if effects.get("temperature", 0) > 0 or effects.get("ph", 0) < 0:
+                    weight += 2.0 * warming
+                weights.append(weight)
+            event_type = rng.choices(EVENT_TYPES, weights)[0]
+
+            # Effects are offsets from the climate here, stronger as it warms
+            intensity = 1.0 + 0.25 * warming
+            event = Event(
+                event_type["description"],
+                {factor: change * intensity for factor, change in event_type["effects"].items()}
+            )
+            duration = rng.uniform(*config.CLIMATE_EVENT_DURATION)
+            event.duration = duration * self.seconds_per_year
+            event.time_remaining = event.duration
+            self.events.append(event)
+            self.event_starts.append(t)
+            self.event_ends.append(t + duration)
+
+    def active_event_index(self, t):
+        """Index of the event in progress at year t, or None."""
+        index = bisect.bisect_right(self.event_starts, t) - 1
+        if index >= 0 and t < self.event_ends[index]:
+            return index
+        return None
+
+    def events_at(self, t, warning_years=0.0):
+        """
+        Events for the EventSystem at year t.
+
+        Returns:
+            tuple: (list of active Events, next Event starting within
+                warning_years or None)
+        """
+        active = []
+        index = self.active_event_index(t)
+        if index is not None:
+            event = self.events[index]
+            event.time_remaining = (self.event_ends[index] - t) * self.seconds_per_year
+            active.append(event)
+        upcoming = None
+        following = bisect.bisect_right(self.event_starts, t)
+        if following < len(self.events) and self.event_starts[following] - t <= warning_years:
+            upcoming = self.events[following]
+        return active, upcoming
+
+    def climate(self, t):
+        """Conditions at year t without events, as a (temperature, ph, salinity) tuple."""
+        return tuple(
+            optimal + trend * t + amplitude * math.sin(TWO_PI * t + phase)
+            for optimal, trend, amplitude, phase in zip(OPTIMAL, self.trend, self.amplitude, self.phase)
+        )
+
+    def conditions(self, t, event=None, clamp=True):
+        """
+        Conditions at year t including the event in progress.
+
+        Args:
+            t (float): Year
+            event (Event): Event to apply; by default the one active at t
+            clamp (bool): Limit values to the valid ranges, as the game does
+        """
+        if event is None:
+            index = self.active_event_index(t)
+            event = self.events[index] if index is not None else None
+        values = self.climate(t)
+        if event is not None and not event.blocked:
+            values = tuple(
+                value + event.effects.get(factor, 0.0) for factor, value in zip(FACTORS, values)
+            )
+        if not clamp:
+            return values
+        return tuple(
+            min(high, max(low, value)) for value, (low, high) in zip(values, LIMITS)
+        )
+
+    def health_rate(self, values, health):
+        """Reef health change per year under conditions values."""
+        damage = 0.0
+        for factor, value, optimal in zip(FACTORS, values, OPTIMAL):
+            deviation = abs(value - optimal)
+            if deviation > DAMAGE_THRESHOLDS[factor]:
+                damage += deviation * DAMAGE_WEIGHTS[factor]
+        if damage:
+            return -damage * self.seconds_per_year
+        if health < 100.0:
+            return config.CLIMATE_RECOVERY_RATE * self.seconds_per_year
+        return 0.0
+
+    def _crossing_step(self, t, values):
+        """
+        Largest step from year t that cannot carry a factor across a
+        damage threshold. A factor changes by at most |v'| h + M h^2 / 2
+        over a step h, M bounding its second derivative; the step is the
+        h at which that bound reaches the distance to the threshold.
+        """
+        step = math.inf
+        for factor, value, optimal, trend, amplitude, phase, curvature in zip(
+            FACTORS, values, OPTIMAL, self.trend, self.amplitude, self.phase, self.max_curvature
+        ):
+            margin = abs(DAMAGE_THRESHOLDS[factor] - abs(value - optimal))
+            slope = abs(trend + TWO_PI * amplitude * math.cos(TWO_PI * t + phase))
+            if curvature:
+                step = min(step, (math.sqrt(slope * slope + 2.0 * curvature * margin) - slope) / curvature)
+            elif slope:
+                step = min(step, margin / slope)
+        return step
+
+    def integrate(self, health=None, years=None, tolerance=None):
+        """
+        Run the reef through the scenario without player input.
+
+        Args:
+            health (float): Starting health
+            years (float): Years to simulate, up to the scenario length
+            tolerance (float): Health error accepted per step
+
+        Returns:
+            ScenarioResult: Summary of the run
+        """
+        health = config.INITIAL_HEALTH if health is None else health
+        end = min(years or self.years, self.years)
+        tolerance = tolerance or config.CLIMATE_TOLERANCE
+        max_step = config.CLIMATE_MAX_STEP
+        min_step = config.CLIMATE_MIN_STEP
+
+        t = 0.0
+        step = max_step
+        steps = rejected = 0
+        first_bleaching = collapse = None
+        yearly = []
+        next_year = 1.0
+        warmest = -math.inf
+        lowest_ph = math.inf
+        # Start and end times of events; steps stop at each one
+        boundaries = sorted(self.event_starts + self.event_ends)
+        boundary = 0
+
+        while t < end:
+            while boundary < len(boundaries) and boundaries[boundary] <= t:
+                boundary += 1
+            limit = min(end, next_year)
+            if boundary < len(boundaries):
+                limit = min(limit, boundaries[boundary])
+
+            # The event in progress cannot change within the step
+            index = self.active_event_index(t)
+            event = self.events[index] if index is not None else None
+            raw_values = self.conditions(t, event, clamp=False)
+            values = tuple(min(high, max(low, value)) for value, (low, high) in zip(raw_values, LIMITS))
+            # Unclamped: a range limit can coincide with a threshold
+            h = min(step, limit - t, max(min_step, self._crossing_step(t, raw_values)))
+
+            # Heun step; its difference from the Euler step estimates the error
+            rate = self.health_rate(values, health)
+            euler = health + h * rate
+            end_values = self.conditions(t + h, event)
+            end_rate = self.health_rate(end_values, min(100.0, max(0.0, euler)))
+            error = 0.5 * h * abs(end_rate - rate)
+            if error > tolerance and h > min_step:
+                step = max(min_step, 0.5 * h)
+                rejected += 1
+                continue
+
+            health = min(100.0, max(0.0, health + 0.5 * h * (rate + end_rate)))
+            t += h
+            steps += 1
+            warmest = max(warmest, values[0], end_values[0])
+            lowest_ph = min(lowest_ph, values[1], end_values[1])
+            growth = 4.0 if error == 0 else min(4.0, max(0.5, 0.9 * math.sqrt(tolerance / error)))
+            step = min(max_step, max(min_step, h * growth))
+
+            if first_bleaching is None and health < config.CORAL_BLEACH_HEALTH:
+                first_bleaching = self.start_year + t
+            if health <= 0.0:
+                collapse = self.start_year + t
+                break
+            if t >= next_year - 1e-9:
+                yearly.append((self.start_year + round(t), health, warmest, lowest_ph))
+                warmest = -math.inf
+                lowest_ph = math.inf
+                next_year += 1.0
+
+        return ScenarioResult(
+            years=t,
+            final_health=health,
+            first_bleaching_year=first_bleaching,
+            collapse_year=collapse,
+            steps=steps,
+            rejected_steps=rejected,
+            events=bisect.bisect_left(self.event_starts, t),
+            yearly=yearly
+        )
+
+def format_result(scenario, result, wall_seconds):
+    def year(value):
+        return f"{value:.1f}" if value is not None else "never"
+
+    lines = [
+        f"Scenario {scenario.preset}: {result.years:.1f} years from {scenario.start_year} "
+        f"in {wall_seconds * 1000:.1f} ms",
+        f"  steps:           {result.steps} accepted, {result.rejected_steps} rejected",
+        f"  events:          {result.events}",
+        f"  final health:    {result.final_health:.1f}",
+        f"  first bleaching: {year(result.first_bleaching_year)}",
+        f"  collapse:        {year(result.collapse_year)}",
+        "",
+        "  year  health  warmest   lowest pH"
+    ]
+    for year_value, health, warmest, lowest_ph in result.yearly[9::10]:
+        lines.append(f"  {year_value}  {health:6.1f}  {warmest:6.2f} C  {lowest_ph:6.3f}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a climate scenario headless with an adaptive timestep.")
+    parser.add_argument("--scenario", default=config.CLIMATE_SCENARIO, choices=sorted(config.CLIMATE_SCENARIOS),
+                        help="Trend preset (default: config.CLIMATE_SCENARIO)")
+    parser.add_argument("--years", type=int, default=config.CLIMATE_YEARS, help="Years to simulate")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the event schedule")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    scenario = ClimateScenario(args.scenario, args.years, args.seed)
+    result = scenario.integrate()
+    wall_seconds = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(dict(result._asdict(), scenario=args.scenario, wall_seconds=wall_seconds), indent=2))
+    else:
+        print(format_result(scenario, result, wall_seconds))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Coral Population Module
+
+Optional per-colony reef model. Instead of one health number, thousands of
+coral colonies each carry their own health, species tolerance, bleaching
+state and recovery timer, stored as typed NumPy arrays (struct of arrays)
+and updated together with vectorized threshold rules.
+
+Rules per colony, each tick:
+- Damage follows the HealthSystem rules for the conditions at the colony
+  (global conditions, or the environment field sampled at its position),
+  scaled by its species tolerance
+- A colony that drops below CORAL_BLEACH_HEALTH while stressed bleaches;
+  bleached colonies do not regenerate
+- A bleached colony recovers after CORAL_RECOVERY_TIME seconds without
+  stress; a colony at zero health is dead until the next game
+
+Reef health is the mean colony health. Rendering does not draw colonies
+individually: the reef is split into CORAL_RENDER_COUNT strips and each
+strip is drawn as one coral showing the mean health of its colonies.
+"""
+
+import numpy as np
+
+import config
+from core.environment_field import DAMAGE_THRESHOLDS, DAMAGE_WEIGHTS
+
+# Species names in the order of their codes in CoralPopulation.species;
+# the same names as CoralAnimation.coral_type
+SPECIES = tuple(config.CORAL_SPECIES_TOLERANCE)
+
+OPTIMAL = np.array([config.TEMP_OPTIMAL, config.PH_OPTIMAL, config.SALINITY_OPTIMAL], dtype=np.float32)
+
+class CoralPopulation:
+    """
+    Struct-of-arrays coral colonies.
+
+    Args:
+        count (int): Number of colonies
+        seed (int): Seed for positions, species and tolerances
+
+    Attributes:
+        x, y (numpy.ndarray): float32 screen positions
+        species (numpy.ndarray): uint8 index into SPECIES
+        tolerance (numpy.ndarray): float32 damage multiplier; above 1.0
+            is more sensitive than average
+        health (numpy.ndarray): float32 health, 0 to max_health
+        bleached (numpy.ndarray): bool bleaching state
+        recovery (numpy.ndarray): float32 seconds of stress-free conditions
+            a bleached colony still needs to recover
+    """
+
+    def __init__(self, count=None, seed=None):
+        self.count = count or config.CORAL_COLONIES
+        self.max_health = 100.0
+        rng = np.random.default_rng(seed)
+
+        # Colonies spread over the reef band along the bottom of the screen
+        self.x = rng.uniform(50, config.SCREEN_WIDTH - 50, self.count).astype(np.float32)
+        self.y = rng.uniform(config.SCREEN_HEIGHT - 160, config.SCREEN_HEIGHT - 60, self.count).astype(np.float32)
+        self.species = rng.integers(0, len(SPECIES), self.count, dtype=np.uint8)
+        species_tolerance = np.array(list(config.CORAL_SPECIES_TOLERANCE.values()), dtype=np.float32)
+        self.tolerance = species_tolerance[self.species] * rng.uniform(0.8, 1.2, self.count).astype(np.float32)
+
+        self.health = np.empty(self.count, dtype=np.float32)
+        self.bleached = np.empty(self.count, dtype=bool)
+        self.recovery = np.empty(self.count, dtype=np.float32)
+        self._damage = np.empty(self.count, dtype=np.float32)
+        self._mask = np.empty(self.count, dtype=bool)
+        # Scratch for per-colony conditions, allocated on first use
+        self._deviation = None
+        self._over = None
+        self.reset()
+
+        # Level of detail: one drawn coral per strip of the reef
+        strips = config.CORAL_RENDER_COUNT
+        self.strip_width = (config.SCREEN_WIDTH - 100) / strips
+        self._strip = np.minimum(((self.x - 50) / self.strip_width).astype(np.intp), strips - 1)
+        self._strip_counts = np.maximum(np.bincount(self._strip, minlength=strips), 1)
+
+    @property
+    def positions(self):
+        """(count, 2) array of colony screen positions."""
+        return np.column_stack((self.x, self.y))
+
+    @property
+    def reef_health(self):
+        return float(self.health.mean())
+
+    def reset(self):
+        self.health.fill(config.INITIAL_HEALTH)
+        self.bleached.fill(False)
+        self.recovery.fill(config.CORAL_RECOVERY_TIME)
+
+    def update(self, delta_time, conditions, damage_multiplier=1.0):
+        """
+        Apply one tick of damage, bleaching and recovery.
+
+        Args:
+            delta_time (float): Seconds to advance
+            conditions: (temperature, ph, salinity) for the whole reef, or a
+                (3, count) array with the conditions at each colony
+            damage_multiplier (float): Scale on damage, e.g. from modifiers
+        """
+        conditions = np.asarray(conditions, dtype=np.float32)
+        health = self.health
+        damage = self._damage
+
+        if conditions.ndim == 1:
+            deviation = np.abs(conditions - OPTIMAL)
+            deviation *= deviation > DAMAGE_THRESHOLDS
+            rate = float(deviation @ DAMAGE_WEIGHTS)
+            stressed = rate > 0
+            if stressed:
+                np.multiply(self.tolerance, rate * delta_time * damage_multiplier, out=damage)
+                health -= damage
+                self.recovery.fill(config.CORAL_RECOVERY_TIME)
+            else:
+                self.recovery -= delta_time
+        else:
+            if self._deviation is None:
+                self._deviation = np.empty((3, self.count), dtype=np.float32)
+                self._over = np.empty((3, self.count), dtype=bool)
+            deviation = self._deviation
+            np.subtract(conditions, OPTIMAL[:, None], out=deviation)
+            np.abs(deviation, out=deviation)
+            np.greater(deviation, DAMAGE_THRESHOLDS[:, None], out=self._over)
+            deviation *= self._over
+            np.dot(DAMAGE_WEIGHTS, deviation, out=damage)
+            stressed = np.greater(damage, 0, out=self._mask)
+            damage *= self.tolerance
+            damage *= delta_time * damage_multiplier
+            health -= damage
+            self.recovery -= delta_time
+            self.recovery[stressed] = config.CORAL_RECOVERY_TIME
+
+        np.maximum(health, 0.0, out=health)
+
+        if np.any(stressed):
+            # Stressed colonies below the threshold lose their symbionts
+            self.bleached |= stressed & (health < config.CORAL_BLEACH_HEALTH)
+        # Bleached colonies recover after enough stress-free time, unless dead
+        recovered = self.bleached & (self.recovery <= 0) & (health > 0)
+        self.bleached &= ~recovered
+
+    def heal(self, amount):
+        """Add health to colonies that are alive and not bleached."""
+        healable = (self.health > 0) & ~self.bleached
+        self.health += healable * np.float32(amount)
+        np.minimum(self.health, self.max_health, out=self.health)
+
+    def damage(self, amount):
+        self.health -= np.float32(amount)
+        np.maximum(self.health, 0.0, out=self.health)
+
+    def render_sites(self):
+        """
+        Where to draw the representative corals.
+
+        Returns:
+            list: (x, y, species name) per strip, species being the most
+                common in the strip
+        """
+        strips = len(self._strip_counts)
+        common = np.zeros((strips, len(SPECIES)), dtype=np.intp)
+        np.add.at(common, (self._strip, self.species), 1)
+        return [
+            (int(50 + (index + 0.5) * self.strip_width), config.SCREEN_HEIGHT - 100, SPECIES[species])
+            for index, species in enumerate(common.argmax(axis=1))
+        ]
+
+    def render_health(self):
+        """Mean health per strip, in render_sites() order."""
+        return np.bincount(self._strip, weights=self.health, minlength=len(self._strip_counts)) / self._strip_counts
+
+    def bleached_fraction(self):
+        return float(np.count_nonzero(self.bleached)) / self.count
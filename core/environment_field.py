@@ -0,0 +1,257 @@
+"""
+Environment Field Module
+
+Optional spatially resolved environment: temperature, pH and salinity on a
+2D grid over the reef instead of one scalar each.
+
+Each tick the field relaxes toward the global conditions set with the
+sliders (pinned at the open-water edges, so changes spread inward with a
+lag), diffuses, is advected along a uniform current, and receives heat,
+acid or fresh water from active events at their footprints. Corals sample
+the field at their own positions, and reef damage averages over them.
+
+Features:
+- Explicit 5-point stencil diffusion and first-order upwind advection as
+  whole-array NumPy updates, substepped to stay stable at any delta
+- Localized event sources with a Gaussian footprint, added over a window
+  around the footprint only
+- Preallocated scratch arrays; no per-cell Python loops and no per-tick
+  allocations of grid-sized arrays
+- Per-sample stress values for coral rendering
+
+Grid coordinates map linearly onto the screen: column 0 is x = 0 and the
+last column is x = SCREEN_WIDTH, likewise rows for y.
+"""
+
+import math
+
+import numpy as np
+
+import config
+from core.health_system import DAMAGE_THRESHOLDS as THRESHOLDS, DAMAGE_WEIGHTS as WEIGHTS
+
+FACTORS = ("temperature", "ph", "salinity")
+
+# Largest stable explicit diffusion number per substep is 0.25
+MAX_DIFFUSION_NUMBER = 0.2
+# Largest upwind Courant number per substep
+MAX_COURANT_NUMBER = 0.9
+
+# HealthSystem damage rules in FACTORS order
+DAMAGE_THRESHOLDS = np.array([THRESHOLDS[factor] for factor in FACTORS], dtype=np.float32)
+DAMAGE_WEIGHTS = np.array([WEIGHTS[factor] for factor in FACTORS], dtype=np.float32)
+
+class EnvironmentField:
+    """
+    Grid of environmental conditions.
+
+    Args:
+        shape (tuple): (rows, columns)
+        diffusion (float): Diffusivity in cells^2 per second
+        current (tuple): Uniform current (x, y) in cells per second
+        relaxation_time (float): Seconds for the reef to settle to global conditions
+
+    Attributes:
+        values (numpy.ndarray): float32 array (3, rows, columns) in FACTORS order
+        samples (numpy.ndarray): (3, n) conditions at the sample points,
+            refreshed in place every tick
+    """
+
+    def __init__(self, shape=None, diffusion=None, current=None, relaxation_time=None):
+        self.shape = tuple(shape or config.FIELD_SIZE)
+        self.diffusion = config.FIELD_DIFFUSION if diffusion is None else diffusion
+        self.current = tuple(config.FIELD_CURRENT if current is None else current)
+        self.relaxation_time = relaxation_time or config.FIELD_RELAXATION_TIME
+
+        self.optimal = np.array(
+            [config.TEMP_OPTIMAL, config.PH_OPTIMAL, config.SALINITY_OPTIMAL], dtype=np.float32
+        )
+        self.thresholds = DAMAGE_THRESHOLDS
+        # Deviation beyond the threshold that counts as full stress: the
+        # rest of the way to the farther end of each range
+        self.stress_spans = np.array([
+            max(config.TEMP_MAX - config.TEMP_OPTIMAL, config.TEMP_OPTIMAL - config.TEMP_MIN),
+            max(config.PH_MAX - config.PH_OPTIMAL, config.PH_OPTIMAL - config.PH_MIN),
+            max(config.SALINITY_MAX - config.SALINITY_OPTIMAL, config.SALINITY_OPTIMAL - config.SALINITY_MIN)
+        ], dtype=np.float32) - self.thresholds
+        self.minimum = np.array(
+            [config.TEMP_MIN, config.PH_MIN, config.SALINITY_MIN], dtype=np.float32
+        )[:, None, None]
+        self.maximum = np.array(
+            [config.TEMP_MAX, config.PH_MAX, config.SALINITY_MAX], dtype=np.float32
+        )[:, None, None]
+
+        self.values = np.empty((3,) + self.shape, dtype=np.float32)
+        self.values[:] = self.optimal[:, None, None]
+        self._laplacian = np.empty((3, self.shape[0] - 2, self.shape[1] - 2), dtype=np.float32)
+        self._scratch = np.empty_like(self.values)
+
+        # Footprint kernels by radius in cells
+        self._kernels = {}
+
+        default_points = [
+            (x, config.SCREEN_HEIGHT - 100) for x in range(100, config.SCREEN_WIDTH - 100, 150)
+        ]
+        self.set_sample_points(default_points)
+
+    def set_sample_points(self, points):
+        """
+        Set the screen positions sampled each tick, e.g. coral positions.
+
+        Args:
+            points (list): (x, y) screen coordinates
+        """
+        rows, cols = self.shape
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        sample_cols = np.clip(
+            (points[:, 0] / config.SCREEN_WIDTH * (cols - 1)).round().astype(np.intp), 0, cols - 1
+        )
+        sample_rows = np.clip(
+            (points[:, 1] / config.SCREEN_HEIGHT * (rows - 1)).round().astype(np.intp), 0, rows - 1
+        )
+        # Flat cell indices: one take() per tick instead of 2D fancy indexing
+        self._sample_cells = sample_rows * cols + sample_cols
+        self.samples = np.empty((3, len(points)), dtype=np.float32)
+        self._sample()
+
+    def reset(self, ambient):
+        """Set every cell to the global conditions (temperature, ph, salinity)."""
+        self.values[:] = np.asarray(ambient, dtype=np.float32)[:, None, None]
+        self._sample()
+
+    def update(self, delta_time, ambient, events=()):
+        """
+        Advance the field.
+
+        Args:
+            delta_time (float): Seconds to advance
+            ambient (tuple): Global (temperature, ph, salinity) from the sliders
+            events (list): Active Events; each acts as a source at its footprint
+        """
+        if delta_time <= 0:
+            return
+        ambient = np.asarray(ambient, dtype=np.float32)
+
+        # Substep so the explicit schemes stay stable for long frames; not
+        # capped, so the cost of an update grows with delta_time
+        diffusion_number = self.diffusion * delta_time
+        courant_number = max(abs(self.current[0]), abs(self.current[1])) * delta_time
+        substeps = max(
+            1,
+            math.ceil(diffusion_number / MAX_DIFFUSION_NUMBER),
+            math.ceil(courant_number / MAX_COURANT_NUMBER)
+        )
+        step = delta_time / substeps
+
+        for _ in range(substeps):
+            for event in events:
+                self._add_source(event, step)
+            self._diffuse(step)
+            self._advect(step)
+            self._relax(ambient, step)
+
+        np.clip(self.values, self.minimum, self.maximum, out=self.values)
+        self._sample()
+
+    def _add_source(self, event, step):
+        x, y = event.position
+        rows, cols = self.shape
+        radius = max(1, int(event.radius * (cols - 1)))
+        kernel = self._kernels.get(radius)
+        if kernel is None:
+            offsets = np.arange(-2 * radius, 2 * radius + 1, dtype=np.float32)
+            kernel = np.exp(-(offsets[:, None] ** 2 + offsets[None, :] ** 2) / (2.0 * radius * radius))
+            self._kernels[radius] = kernel = kernel.astype(np.float32)
+
+        # Clip the kernel window to the grid
+        center_row = int(y * (rows - 1))
+        center_col = int(x * (cols - 1))
+        half = kernel.shape[0] // 2
+        top, left = center_row - half, center_col - half
+        r0, c0 = max(0, top), max(0, left)
+        r1, c1 = min(rows, top + kernel.shape[0]), min(cols, left + kernel.shape[1])
+        if r0 >= r1 or c0 >= c1:
+            return
+        window = kernel[r0 - top:r1 - top, c0 - left:c1 - left]
+
+        for index, factor in enumerate(FACTORS):
+            change = event.effects.get(factor)
+            if change:
+                self.values[index, r0:r1, c0:c1] += window * (change * step)
+
+    def _diffuse(self, step):
+        values = self.values
+        laplacian = self._laplacian
+        # 5-point stencil on the interior; edges are pinned by _relax
+        np.add(values[:, :-2, 1:-1], values[:, 2:, 1:-1], out=laplacian)
+        laplacian += values[:, 1:-1, :-2]
+        laplacian += values[:, 1:-1, 2:]
+        laplacian *= self.diffusion * step
+        # Centre term folded into one in-place scale of the interior
+        interior = values[:, 1:-1, 1:-1]
+        interior *= 1.0 - 4.0 * self.diffusion * step
+        interior += laplacian
+
+    def _advect(self, step):
+        values = self.values
+        flux = self._scratch
+        current_x, current_y = self.current
+        # First-order upwind: each cell moves toward its upstream neighbour
+        if current_x > 0:
+            np.subtract(values[:, :, 1:], values[:, :, :-1], out=flux[:, :, 1:])
+            flux[:, :, 1:] *= current_x * step
+            values[:, :, 1:] -= flux[:, :, 1:]
+        elif current_x < 0:
+            np.subtract(values[:, :, :-1], values[:, :, 1:], out=flux[:, :, :-1])
+            flux[:, :, :-1] *= -current_x * step
+            values[:, :, :-1] -= flux[:, :, :-1]
+        if current_y > 0:
+            np.subtract(values[:, 1:, :], values[:, :-1, :], out=flux[:, 1:, :])
+            flux[:, 1:, :] *= current_y * step
+            values[:, 1:, :] -= flux[:, 1:, :]
+        elif current_y < 0:
+            np.subtract(values[:, :-1, :], values[:, 1:, :], out=flux[:, :-1, :])
+            flux[:, :-1, :] *= -current_y * step
+            values[:, :-1, :] -= flux[:, :-1, :]
+
+    def _relax(self, ambient, step):
+        values = self.values
+        rate = 1.0 - math.exp(-step / self.relaxation_time)
+        # values += (ambient - values) * rate, without temporaries
+        values *= 1.0 - rate
+        values += (ambient * rate)[:, None, None]
+        # Open water at the edges is held at the global conditions
+        edge = ambient[:, None]
+        values[:, 0, :] = edge
+        values[:, -1, :] = edge
+        values[:, :, 0] = edge
+        values[:, :, -1] = edge
+
+    def _sample(self):
+        np.take(self.values.reshape(3, -1), self._sample_cells, axis=1, out=self.samples)
+
+    @property
+    def stress(self):
+        """New (n,) array of 0.0-1.0 stress at the sample points."""
+        excess = np.abs(self.samples - self.optimal[:, None]) - self.thresholds[:, None]
+        return np.clip(excess / self.stress_spans[:, None], 0.0, 1.0).max(axis=0)
+
+    def damage_rate(self):
+        """
+        Health lost per second, averaged over the sample points.
+
+        Uses the same per-factor rules as HealthSystem (DAMAGE_THRESHOLDS
+        and DAMAGE_WEIGHTS).
+        """
+        if not self.samples.shape[1]:
+            return 0.0
+        deviation = np.abs(self.samples - self.optimal[:, None])
+        deviation *= deviation > self.thresholds[:, None]
+        return float((deviation * DAMAGE_WEIGHTS[:, None]).sum(axis=0).mean())
+
+    def sample(self, x, y):
+        """Conditions (temperature, ph, salinity) at a screen position."""
+        rows, cols = self.shape
+        row = min(rows - 1, max(0, round(y / config.SCREEN_HEIGHT * (rows - 1))))
+        col = min(cols - 1, max(0, round(x / config.SCREEN_WIDTH * (cols - 1))))
+        return tuple(float(value) for value in self.values[:, row, col])
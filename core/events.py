@@ -15,6 +15,39 @@ Key Features:
 import random
 import config
 from utils.logger import logger, log_exception
+from utils.metrics import metrics
+from core.modifiers import ModifierStack
+
+EVENTS_GENERATED = metrics.counter("events_generated_total", "Pending events generated by the EventSystem")
+EVENTS_HANDLED = metrics.counter("events_handled_total", "Events activated by the EventSystem")
+
+# Possible events and their effects
+EVENT_TYPES = [
+    {
+        "description": "Heat wave approaching!",
+        "effects": {"temperature": 3.0}
+    },
+    {
+        "description": "Cold current detected!",
+        "effects": {"temperature": -3.0}
+    },
+    {
+        "description": "Acid rain affecting the area!",
+        "effects": {"ph": -0.5}
+    },
+    {
+        "description": "Agricultural runoff detected!",
+        "effects": {"ph": 0.3}
+    },
+    {
+        "description": "Heavy rainfall reducing salinity!",
+        "effects": {"salinity": -2.0}
+    },
+    {
+        "description": "Increased evaporation!",
+        "effects": {"salinity": 2.0}
+    }
+]
 
 class Event:
     """
@@ -26,16 +59,28 @@ class Event:
         duration (float): How long the event lasts in seconds
         time_remaining (float): Time until event ends
         cooldown (float): Minimum time before next event can start
+        position (tuple): Footprint centre as (x, y) fractions of the screen,
+            used by the environment field
+        radius (float): Footprint radius as a fraction of the screen width
+        blocked (bool): Whether a shield absorbed this scheduled event
     """
+
+    __slots__ = ("description", "effects", "duration", "time_remaining", "cooldown", "position", "radius", "blocked")
+
     def __init__(self, description, effects):
         self.description = description
         self.effects = effects
         self.duration = random.uniform(5.0, 8.0)  # Events last 5-8 seconds
         self.time_remaining = self.duration
         self.cooldown = 10.0  # Increased cooldown to 10 seconds minimum
+        # Somewhere over the reef band
+        self.position = (random.uniform(0.1, 0.9), random.uniform(0.6, 0.95))
+        self.radius = random.uniform(*config.FIELD_EVENT_RADIUS)
+        self.blocked = False
 
 class EventSystem:
-    def __init__(self):
+    def __init__(self, modifiers=None):
+        self.modifiers = modifiers or ModifierStack()
         self.active_events = []
         self.event_timer = 0
         self.event_interval = random.uniform(15.0, 20.0)  # Longer interval between events
@@ -48,32 +93,7 @@ class EventSystem:
         self.difficulty_multiplier = 1.0  # Add difficulty multiplier
         
         # Define possible events and their effects
-        self.possible_events = [
-            {
-                "description": "Heat wave approaching!",
-                "effects": {"temperature": 3.0}
-            },
-            {
-                "description": "Cold current detected!",
-                "effects": {"temperature": -3.0}
-            },
-            {
-                "description": "Acid rain affecting the area!",
-                "effects": {"ph": -0.5}
-            },
-            {
-                "description": "Agricultural runoff detected!",
-                "effects": {"ph": 0.3}
-            },
-            {
-                "description": "Heavy rainfall reducing salinity!",
-                "effects": {"salinity": -2.0}
-            },
-            {
-                "description": "Increased evaporation!",
-                "effects": {"salinity": 2.0}
-            }
-        ]
+        self.possible_events = EVENT_TYPES
 
     def adjust_difficulty(self, multiplier):
         """
@@ -128,9 +148,15 @@ class EventSystem:
                     self.event_interval = random.uniform(15.0 / self.difficulty_multiplier, 
                                                        20.0 / self.difficulty_multiplier)
                     self.is_warning = False
-                    if self.pending_event:
+                    if self.pending_event and self.modifiers.get("event_shield") > 0:
+                        # A shield absorbs the event and is used up
+                        logger.debug(f"Event blocked by shield: {self.pending_event.description}")
+                        self.consume_shield()
+                        self.pending_event = None
+                    elif self.pending_event:
                         self.active_events.append(self.pending_event)
                         self.events_handled += 1
+                        EVENTS_HANDLED.inc()
                         logger.debug(f"Event activated: {self.pending_event.description}")
                         self.pending_event = None
                     
@@ -150,8 +176,39 @@ class EventSystem:
             event_data["description"],
             adjusted_effects
         )
+        EVENTS_GENERATED.inc()
         logger.debug(f"Generated new event: {event_data['description']} with multiplier {self.difficulty_multiplier}")
 
+    def consume_shield(self):
+        """Remove the event_shield modifiers that blocked an event."""
+        for modifier in list(self.modifiers.modifiers["event_shield"]):
+            self.modifiers.remove(modifier)
+
+    def sync_scheduled(self, active, upcoming=None):
+        """
+        Mirror events from an external schedule, such as a climate
+        scenario, instead of generating random ones. Call every tick in
+        place of update().
+        
+        Args:
+            active (list): Scheduled Events in progress
+            upcoming (Event): Next scheduled Event within the warning window, or None
+        """
+        for event in active:
+            if event.blocked or event in self.active_events:
+                continue
+            if self.modifiers.get("event_shield") > 0:
+                logger.debug(f"Scheduled event blocked by shield: {event.description}")
+                event.blocked = True
+                self.consume_shield()
+                continue
+            self.events_handled += 1
+            EVENTS_HANDLED.inc()
+            logger.debug(f"Scheduled event started: {event.description}")
+        self.active_events = [event for event in active if not event.blocked]
+        self.pending_event = upcoming
+        self.is_warning = upcoming is not None
+
     def get_warning_message(self):
         """Get the warning message for the pending event."""
         if self.is_warning and self.pending_event:
@@ -1,6 +1,8 @@
 import json
 import random
 import os
+import config
+from utils.logger import logger
 
 """
 Facts Manager Module
@@ -10,24 +12,42 @@ Provides relevant information based on game events and coral health status.
 
 Features:
 - Fact rotation system
-- Context-sensitive fact selection
+- Context-sensitive fact selection: facts are indexed by environmental
+  factor and severity, so the active event and reef health pick a
+  matching fact in O(1)
 - Timed display management
 - Educational content integration
+- Lazy loading of the corpus relative to the package, not the CWD
+
+Corpus format (assets/facts.json): a mapping of factor ("temperature",
+"ph", "salinity", "general") to a list of entries. An entry is either a
+string, shown at any severity, or {"text": ..., "severity": ...} where
+severity is a health state from HealthSystem.get_health_state().
 """
 
+SEVERITIES = ("healthy", "stressed", "bleached")
+GENERAL = "general"
+
 class FactsManager:
-    def __init__(self):
-        self.facts = self.load_facts()
+    def __init__(self, path=None):
+        self.path = path or os.path.join(config.ASSETS_DIR, "facts.json")
+        self._index = None  # (factor, severity) -> list of facts, built on first use
         self.current_fact = None
         self.display_time = 5.0  # How long to show each fact
         self.time_until_next = 30.0  # Time between facts
-        
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = self.build_index(self.load_facts())
+        return self._index
+
     def load_facts(self):
         try:
-            with open(os.path.join("assets", "facts.json"), "r") as f:
+            with open(self.path, "r", encoding="utf-8") as f:
                 return json.load(f)
-        except:
-            print("Warning: Could not load facts file")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load facts file {self.path}: {e}")
             return {
                 "temperature": [
                     "Coral reefs thrive in water temperatures between 23-29°C (73-84°F).",
@@ -42,19 +62,63 @@ class FactsManager:
                     "Heavy rains can temporarily lower salinity near coastal reefs."
                 ]
             }
-            
-    def update(self, delta_time):
+
+    def build_index(self, facts):
+        """
+        Index facts by (factor, severity).
+
+        Facts without a severity are added to every severity bucket, so a
+        lookup never has to merge lists at selection time.
+
+        Args:
+            facts (dict): Factor to list of fact entries
+
+        Returns:
+            dict: (factor, severity) to list of fact strings
+        """
+        index = {}
+        for factor, entries in facts.items():
+            for entry in entries:
+                if isinstance(entry, str):
+                    text, severities = entry, SEVERITIES
+                else:
+                    text = entry["text"]
+                    severities = (entry["severity"],) if "severity" in entry else SEVERITIES
+                for severity in severities:
+                    index.setdefault((factor, severity), []).append(text)
+        return index
+
+    def update(self, delta_time, active_events=(), health_state="healthy"):
+        """
+        Advance the fact timer and pick a new fact when it expires.
+
+        Args:
+            delta_time (float): Time since last update
+            active_events (list): EventSystem.active_events
+            health_state (str): HealthSystem.get_health_state()
+        """
         self.time_until_next -= delta_time
-        
+
         if self.time_until_next <= 0:
-            self.select_new_fact()
+            self.select_new_fact(active_events, health_state)
             self.time_until_next = 30.0
-            
-    def select_new_fact(self):
+
+    def select_new_fact(self, active_events=(), health_state="healthy"):
         # Choose a category based on current conditions
-        categories = list(self.facts.keys())
-        category = random.choice(categories)
-        self.current_fact = random.choice(self.facts[category])
-        
+        factor = GENERAL
+        if active_events:
+            factor = next(iter(active_events[0].effects), GENERAL)
+
+        index = self.index
+        candidates = (
+            index.get((factor, health_state))
+            or index.get((GENERAL, health_state))
+            or index.get((factor, "healthy"))
+        )
+        if not candidates:
+            # Conditions with no matching facts fall back to any category
+            candidates = random.choice(list(index.values())) if index else None
+        self.current_fact = random.choice(candidates) if candidates else None
+
     def get_current_fact(self):
-        return self.current_fact 
\ No newline at end of file
+        return self.current_fact
@@ -1,6 +1,8 @@
 from core.health_system import HealthSystem
 from core.events import EventSystem
 from core.player_actions import PlayerActions
+from core.modifiers import ModifierStack
+from core.simulation import TimeWarp
 import config
 from utils.logger import logger
 
@@ -15,6 +17,11 @@ Features:
 - Difficulty progression
 - Game state transitions
 - Score tracking
+- Ownership of the modifier stack shared by the core systems
+- Optional spatial environment field fed by the sliders and events
+- Optional per-colony coral population behind the reef health
+- Decades mode: a climate scenario schedules events and drives conditions
+- Time warp setting, applied by whoever steps the simulation
 """
 
 class GameManager:
@@ -22,12 +29,14 @@ class GameManager:
         logger.info("Initializing GameManager")
         self.difficulty = "normal"
         self.settings = config.DIFFICULTY_SETTINGS[self.difficulty]
-        self.health_system = HealthSystem()
-        self.event_system = EventSystem()
+        self.modifiers = ModifierStack()
+        self.health_system = HealthSystem(self.modifiers)
+        self.event_system = EventSystem(self.modifiers)
         self.player_actions = PlayerActions()
         self.game_state = "menu"  # States: menu, playing, round_end, game_over
         self.score = 0
         self.time_elapsed = 0
+        self.time_warp = TimeWarp()
         
         # Round management
         self.current_round = 1
@@ -47,11 +56,69 @@ class GameManager:
         }
         self.CONTROL_RELEASE_TIME = 0.5
         
-    def start_game(self):
-        """Initialize a new game."""
+        # Optional per-tick recorder (core.telemetry.TelemetryRecorder)
+        self.telemetry = None
+        # Optional persistent store (core.profile_store.ProfileStore)
+        self.profile_store = None
+        self.profile_name = config.DEFAULT_PROFILE
+        # Optional spatial conditions (core.environment_field.EnvironmentField)
+        self.environment_field = None
+        # Decades mode (core.climate_scenario.ClimateScenario) and its clock in years
+        self.scenario = None
+        self.climate_year = 0.0
+        # Optional scripted events in place of random ones: an object with
+        # events_at(time, warning_time) returning (active, upcoming), e.g.
+        # the event storms of the stress scenarios (benchmarks.stress)
+        self.event_schedule = None
+        # Called with no arguments at the end of start_game, by systems
+        # that keep per-game state outside the GameManager
+        self.game_start_listeners = []
+        
+    def attach_environment_field(self, field):
+        """Resolve conditions on field; events then act locally on it."""
+        self.environment_field = field
+        self.health_system.field = field
+        if self.health_system.population is not None:
+            field.set_sample_points(self.health_system.population.positions)
+        self.reset_environment_field()
+        
+    def attach_coral_population(self, population):
+        """Model the reef as individual colonies; health becomes their mean."""
+        self.health_system.population = population
+        if self.environment_field:
+            # Colonies read the field at their own positions
+            self.environment_field.set_sample_points(population.positions)
+        
+    def reset_environment_field(self):
+        if self.environment_field:
+            health_system = self.health_system
+            self.environment_field.reset((health_system.temperature, health_system.ph, health_system.salinity))
+        
+    @property
+    def leaderboard_key(self):
+        """Leaderboard runs are ranked on: the difficulty, or the climate scenario."""
+        if self.scenario:
+            return f"decades-{self.scenario.preset}"
+        return self.difficulty
+        
+    def start_game(self, scenario=None):
+        """
+        Initialize a new game.
+        
+        Args:
+            scenario (ClimateScenario): Play in decades mode through this
+                scenario instead of with random events
+        """
         logger.info(f"Starting new game with difficulty: {self.difficulty}")
+        self.scenario = scenario
+        self.climate_year = 0.0
+        self.time_warp.reset()
+        if scenario:
+            logger.info(f"Decades mode: {scenario.preset} scenario over {scenario.years} years, "
+                        f"{scenario.seconds_per_year:.1f}s per year")
         self.game_state = "playing"
         self.health_system.reset()
+        self.modifiers.clear()
         self.score = 0
         self.time_elapsed = 0
         self.current_round = 1
@@ -63,7 +130,13 @@ class GameManager:
         self.health_system.salinity = config.SALINITY_OPTIMAL
         
         # Reset event system
-        self.event_system = EventSystem()
+        self.event_system = EventSystem(self.modifiers)
+        self.reset_environment_field()
+        
+        if self.telemetry:
+            self.telemetry.start_run(self)
+        for listener in self.game_start_listeners:
+            listener()
         
         # Log game start
         logger.info("Game started with initial settings:")
@@ -84,10 +157,15 @@ class GameManager:
         self.health_system.temperature = config.TEMP_OPTIMAL
         self.health_system.ph = config.PH_OPTIMAL
         self.health_system.salinity = config.SALINITY_OPTIMAL
+        self.reset_environment_field()
         
         # Adjust difficulty
         self.adjust_difficulty()
         
+    def return_to_menu(self):
+        """Leave the round transition for the main menu."""
+        self.game_state = "menu"
+        
     def adjust_difficulty(self):
         """Increase difficulty as rounds progress."""
         # Example: Increase event frequency and damage
@@ -104,8 +182,17 @@ class GameManager:
             self.handle_round_end()
             return
             
-        # Update event system
-        self.event_system.update(delta_time)
+        # Expire modifiers, then update event system; in decades mode the
+        # scenario schedules events and sets conditions
+        self.modifiers.update(delta_time)
+        if self.scenario:
+            self.update_climate(delta_time)
+        elif self.event_schedule:
+            self.event_system.sync_scheduled(
+                *self.event_schedule.events_at(self.time_elapsed, self.event_system.warning_time)
+            )
+        else:
+            self.event_system.update(delta_time)
         
         # Update control timeouts
         for factor in self.control_timeout:
@@ -114,7 +201,49 @@ class GameManager:
                 if self.control_timeout[factor] <= 0:
                     self.player_controlled[factor] = False
         
-        # Apply event effects only to factors not being controlled by player
+        if self.environment_field:
+            # Events heat, acidify or freshen their footprint; the sliders
+            # set the global conditions the field relaxes toward. Scheduled
+            # climate events are already part of the global conditions.
+            health_system = self.health_system
+            self.environment_field.update(
+                delta_time,
+                (health_system.temperature, health_system.ph, health_system.salinity),
+                () if self.scenario else self.event_system.active_events
+            )
+        elif not self.scenario:
+            # Apply event effects only to factors not being controlled by player
+            self.apply_event_effects(delta_time)
+        
+        # Update health system
+        self.health_system.update(delta_time)
+        self.time_elapsed += delta_time
+        
+        if self.telemetry:
+            self.telemetry.record(self, delta_time)
+        
+        # Check win/lose conditions
+        if self.health_system.current_health <= 0:
+            logger.info(f"Reef health depleted. Game over with score: {self.score}")
+            self.finish_game("depleted")
+            
+    def update_climate(self, delta_time):
+        """Advance the scenario clock, its events, and conditions toward its climate."""
+        scenario = self.scenario
+        self.climate_year = min(scenario.years, self.climate_year + delta_time / scenario.seconds_per_year)
+        warning_years = self.event_system.warning_time / scenario.seconds_per_year
+        self.event_system.sync_scheduled(*scenario.events_at(self.climate_year, warning_years))
+        
+        # Player changes hold briefly, then conditions drift back to the climate
+        response = min(1.0, delta_time / config.CLIMATE_RESPONSE_TIME)
+        climate = scenario.conditions(self.climate_year)
+        for factor, value in zip(("temperature", "ph", "salinity"), climate):
+            if not self.player_controlled[factor]:
+                current_value = getattr(self.health_system, factor)
+                setattr(self.health_system, factor, current_value + (value - current_value) * response)
+            
+    def apply_event_effects(self, delta_time):
+        """Shift the global conditions by the active event's effects."""
         event_effects = self.event_system.get_current_effects()
         for factor, change in event_effects.items():
             if not self.player_controlled[factor] and self.control_timeout[factor] <= 0:
@@ -130,14 +259,21 @@ class GameManager:
                     new_value = max(config.SALINITY_MIN, min(config.SALINITY_MAX, new_value))
                     
                 setattr(self.health_system, factor, new_value)
-        
-        # Update health system
-        self.health_system.update(delta_time)
-        self.time_elapsed += delta_time
-        
-        # Check win/lose conditions
-        if self.health_system.current_health <= 0:
-            self.game_state = "game_over"
+            
+    def finish_game(self, outcome):
+        """
+        Enter the game over state and hand the finished run to the recorders.
+
+        Args:
+            outcome (str): "completed" or "depleted"
+        """
+        self.game_state = "game_over"
+        if self.telemetry:
+            self.telemetry.end_run()
+        if self.profile_store:
+            self.profile_store.record_run(
+                self.profile_name, self.leaderboard_key, self.score, self.current_round, outcome
+            )
             
     def handle_player_action(self, action_type, value):
         if self.game_state != "playing":
@@ -157,13 +293,13 @@ class GameManager:
         
     def handle_round_end(self):
         """Handle the end of a round."""
-        logger.info(f"Round {self.current_round} completed. Score: {self.score}")
         round_score = int(self.health_system.current_health)
         self.score += round_score
+        logger.info(f"Round {self.current_round} completed. Round score: {round_score}, total score: {self.score}")
         
         if self.current_round >= self.TOTAL_ROUNDS:
             logger.info(f"Game completed! Final score: {self.score}")
-            self.game_state = "game_over"
+            self.finish_game("completed")
         else:
             self.last_round_health = self.health_system.current_health
             self.game_state = "round_end"
@@ -1,4 +1,5 @@
 import config
+from core.modifiers import ModifierStack
 
 """
 Health System Module
@@ -12,20 +13,45 @@ Features:
 - Environmental factor monitoring (temperature, pH, salinity)
 - Damage calculation from suboptimal conditions
 - Health regeneration under optimal conditions
+- Damage scaled by the "damage_multiplier" modifier stat
+- Optional spatial field: with one attached, damage averages over the
+  conditions at each coral instead of the global values
+- Optional coral population: with one attached, current_health is the
+  mean health of its colonies
 """
 
+# Damage rules per factor: no damage within the threshold of optimal,
+# otherwise deviation times the weight in health per second
+DAMAGE_THRESHOLDS = {"temperature": 2.0, "ph": 0.3, "salinity": 1.0}
+DAMAGE_WEIGHTS = {"temperature": 2.0, "ph": 4.0, "salinity": 3.0}
+
 class HealthSystem:
-    def __init__(self):
+    def __init__(self, modifiers=None):
+        self.modifiers = modifiers or ModifierStack()
         self.current_health = config.INITIAL_HEALTH
         self.max_health = 100
         self.temperature = config.TEMP_OPTIMAL
         self.ph = config.PH_OPTIMAL
         self.salinity = config.SALINITY_OPTIMAL
+        # Optional core.environment_field.EnvironmentField; the scalar
+        # factors above are then the global conditions it relaxes toward
+        self.field = None
+        # Optional core.coral_population.CoralPopulation
+        self.population = None
         
     def decrease_health(self, amount):
+        if self.population is not None:
+            self.population.damage(amount)
+            self.current_health = self.population.reef_health
+            return
         self.current_health = max(0, self.current_health - amount)
         
     def increase_health(self, amount):
+        if self.population is not None:
+            # Only living, unbleached colonies regenerate
+            self.population.heal(amount)
+            self.current_health = self.population.reef_health
+            return
         # Only allow healing if not at max health
         if self.current_health < self.max_health:
             self.current_health = min(self.max_health, self.current_health + amount)
@@ -43,32 +69,63 @@ class HealthSystem:
         self.temperature = config.TEMP_OPTIMAL
         self.ph = config.PH_OPTIMAL
         self.salinity = config.SALINITY_OPTIMAL
+        if self.population is not None:
+            self.population.reset()
 
     def update(self, delta_time):
         # Natural health decrease over time
         # self.current_health -= config.HEALTH_DECREASE_RATE * delta_time
         
-        # Check environmental factors
-        self.apply_temperature_effects(delta_time)
-        self.apply_ph_effects(delta_time)
-        self.apply_salinity_effects(delta_time)
+        # Check environmental factors; damage scales with active modifiers
+        damage_multiplier = self.modifiers.get("damage_multiplier")
+        if self.population is not None:
+            # Each colony takes damage by the conditions at its position
+            if self.field is not None:
+                conditions = self.field.samples
+            else:
+                conditions = (self.temperature, self.ph, self.salinity)
+            self.population.update(delta_time, conditions, damage_multiplier)
+            self.current_health = self.population.reef_health
+            return
+        
+        damage_time = delta_time * damage_multiplier
+        if self.field is not None:
+            self.current_health -= self.field.damage_rate() * damage_time
+        else:
+            self.apply_temperature_effects(damage_time)
+            self.apply_ph_effects(damage_time)
+            self.apply_salinity_effects(damage_time)
         
         # Clamp health between 0 and max_health
         self.current_health = max(0, min(self.max_health, self.current_health))
         
+    def coral_health(self):
+        """
+        Health to draw each coral with, when it differs between corals.
+
+        Returns:
+            Array-like of per-coral health, or None when every coral shows
+            current_health
+        """
+        if self.population is not None:
+            return self.population.render_health()
+        if self.field is not None:
+            return self.current_health * (1.0 - self.field.stress)
+        return None
+        
     def apply_temperature_effects(self, delta_time):
         temp_diff = abs(self.temperature - config.TEMP_OPTIMAL)
-        if temp_diff > 2:
-            self.current_health -= temp_diff * 2 * delta_time
+        if temp_diff > DAMAGE_THRESHOLDS["temperature"]:
+            self.current_health -= temp_diff * DAMAGE_WEIGHTS["temperature"] * delta_time
     def apply_ph_effects(self, delta_time):
         ph_diff = abs(self.ph - config.PH_OPTIMAL)
-        if ph_diff > 0.3:
-            self.current_health -= ph_diff * 4 * delta_time
+        if ph_diff > DAMAGE_THRESHOLDS["ph"]:
+            self.current_health -= ph_diff * DAMAGE_WEIGHTS["ph"] * delta_time
             
     def apply_salinity_effects(self, delta_time):
         salinity_diff = abs(self.salinity - config.SALINITY_OPTIMAL)
-        if salinity_diff > 1:
-            self.current_health -= salinity_diff * 3 * delta_time
+        if salinity_diff > DAMAGE_THRESHOLDS["salinity"]:
+            self.current_health -= salinity_diff * DAMAGE_WEIGHTS["salinity"] * delta_time
             
     def apply_player_action(self, action_type, value):
         if action_type == "temperature":
@@ -0,0 +1,133 @@
+import heapq
+import itertools
+
+"""
+Modifiers Module
+
+Stack of timed stat modifiers applied by power-ups and other temporary
+effects. Systems read effective stat values instead of having attributes
+set on them, and expiry removes a modifier rather than re-applying it.
+
+Effective value of a stat: (base + sum of additive amounts) * product of
+multipliers.
+
+Features:
+- Additive and multiplicative modifiers keyed by stat, tagged by source
+- Effective values cached and recomputed only for stats whose modifiers
+  changed, so reads are O(1)
+- Expiry through a heap ordered by expiry time, so update() costs nothing
+  per live modifier
+- Removal by source, for effects consumed before they expire
+"""
+
+# Stats and their values with no modifiers applied
+BASE_STATS = {
+    "damage_multiplier": 1.0,  # Scales environmental damage in HealthSystem
+    "regen_rate": 1.0,         # Scales health regeneration
+    "event_shield": 0          # Positive while the next event will be blocked
+}
+
+class Modifier:
+    """
+    A single change to one stat.
+
+    Attributes:
+        stat (str): Stat name
+        source (str): What applied the modifier, e.g. a power-up name
+        add (float): Amount added to the base value
+        mul (float): Factor the sum is multiplied by
+        expires_at (float): Stack time of expiry, None for no expiry
+    """
+
+    __slots__ = ("stat", "source", "add", "mul", "expires_at", "removed")
+
+    def __init__(self, stat, source, add=0.0, mul=1.0, expires_at=None):
+        self.stat = stat
+        self.source = source
+        self.add = add
+        self.mul = mul
+        self.expires_at = expires_at
+        self.removed = False
+
+class ModifierStack:
+    def __init__(self, base_stats=None):
+        self.base_stats = dict(BASE_STATS if base_stats is None else base_stats)
+        self.time = 0.0
+        self.modifiers = {stat: [] for stat in self.base_stats}
+        self.values = dict(self.base_stats)
+        self._dirty = set()
+        self._expiry = []  # (expires_at, sequence, modifier)
+        self._sequence = itertools.count()
+
+    def add(self, stat, source, add=0.0, mul=1.0, duration=None):
+        """
+        Apply a modifier.
+
+        Args:
+            stat (str): Stat to modify; must be in base_stats
+            source (str): Source tag used by remove_source()
+            add (float): Additive amount
+            mul (float): Multiplier
+            duration (float): Seconds until expiry, None for no expiry
+
+        Returns:
+            Modifier: The applied modifier
+        """
+        if stat not in self.base_stats:
+            raise KeyError(f"Unknown stat '{stat}'")
+        expires_at = None if duration is None else self.time + duration
+        modifier = Modifier(stat, source, add, mul, expires_at)
+        self.modifiers[stat].append(modifier)
+        self._dirty.add(stat)
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, next(self._sequence), modifier))
+        return modifier
+
+    def remove(self, modifier):
+        if modifier.removed:
+            return
+        modifier.removed = True
+        self.modifiers[modifier.stat].remove(modifier)
+        self._dirty.add(modifier.stat)
+
+    def remove_source(self, source):
+        """Remove every modifier applied by source."""
+        for stat, modifiers in self.modifiers.items():
+            for modifier in [m for m in modifiers if m.source == source]:
+                self.remove(modifier)
+
+    def has_source(self, source):
+        return any(m.source == source for modifiers in self.modifiers.values() for m in modifiers)
+
+    def update(self, delta_time):
+        """Advance the stack clock and drop expired modifiers."""
+        self.time += delta_time
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= self.time:
+            # Entries for modifiers removed early are skipped by remove()
+            self.remove(heapq.heappop(expiry)[2])
+
+    def get(self, stat):
+        """Effective value of a stat."""
+        if stat in self._dirty:
+            self._recompute(stat)
+        return self.values[stat]
+
+    def clear(self):
+        """Remove all modifiers, e.g. when a new game starts."""
+        for stat, modifiers in self.modifiers.items():
+            for modifier in modifiers:
+                modifier.removed = True
+            modifiers.clear()
+            self.values[stat] = self.base_stats[stat]
+        self._dirty.clear()
+        self._expiry.clear()
+
+    def _recompute(self, stat):
+        total = self.base_stats[stat]
+        factor = 1.0
+        for modifier in self.modifiers[stat]:
+            total += modifier.add
+            factor *= modifier.mul
+        self.values[stat] = total * factor
+        self._dirty.discard(stat)
@@ -1,24 +1,40 @@
 import random
 import pygame
 import config
+from utils.logger import logger
 
 class PowerUp:
-    def __init__(self, name, description, duration, effect):
+    """
+    A timed bundle of stat modifiers.
+
+    Args:
+        name (str): Display name, also the modifier source tag
+        description (str): Short description
+        duration (float): Seconds the modifiers last
+        modifiers (list): (stat, add, mul) tuples applied on activation
+    """
+
+    __slots__ = ("name", "description", "duration", "modifiers", "active", "time_remaining")
+
+    def __init__(self, name, description, duration, modifiers):
         self.name = name
         self.description = description
         self.duration = duration
-        self.effect = effect
+        self.modifiers = modifiers
         self.active = False
         self.time_remaining = 0
         
-    def activate(self):
+    def activate(self, stack):
         self.active = True
         self.time_remaining = self.duration
+        for stat, add, mul in self.modifiers:
+            stack.add(stat, self.name, add, mul, self.duration)
         
-    def update(self, delta_time):
+    def update(self, delta_time, stack):
         if self.active:
             self.time_remaining -= delta_time
-            if self.time_remaining <= 0:
+            # The stack expires the modifiers; they may also be consumed early
+            if self.time_remaining <= 0 or not stack.has_source(self.name):
                 self.active = False
                 return True
         return False
@@ -37,28 +53,27 @@ class PowerUpManager:
                 "Stabilizer",
                 "Reduces environmental fluctuations",
                 15.0,
-                lambda gm: setattr(gm, "damage_multiplier", 0.5)
+                [("damage_multiplier", 0.0, 0.5)]
             ),
             PowerUp(
                 "Rapid Recovery",
                 "Doubles health regeneration",
                 10.0,
-                lambda gm: setattr(gm.health_system, "regen_rate", 2.0)
+                [("regen_rate", 0.0, 2.0)]
             ),
             PowerUp(
                 "Event Shield",
                 "Blocks the next negative event",
                 20.0,
-                lambda gm: setattr(gm.event_system, "event_blocked", True)
+                [("event_shield", 1, 1.0)]
             )
         ]
         
     def update(self, delta_time):
         # Update active power-ups
         for power_up in self.power_ups:
-            if power_up.update(delta_time):
-                # Reset effect when power-up expires
-                power_up.effect(self.game_manager)
+            if power_up.update(delta_time, self.game_manager.modifiers):
+                logger.debug(f"Power-up ended: {power_up.name}")
                 
         # Check for new power-up spawn
         self.time_until_next -= delta_time
@@ -70,7 +85,8 @@ class PowerUpManager:
         available = [p for p in self.power_ups if not p.active]
         if available:
             power_up = random.choice(available)
-            # Create visual notification
+            power_up.activate(self.game_manager.modifiers)
+            logger.info(f"Power-up activated: {power_up.name}")
             return power_up
             
     def draw(self):
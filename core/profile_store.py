@@ -0,0 +1,188 @@
+"""
+Profile Store Module
+
+Persistent local store for player profiles, run history, per-difficulty
+leaderboards and achievement unlocks, backed by SQLite in WAL mode.
+
+Features:
+- Writes queued from the game thread and committed in batches by a
+  dedicated writer thread, so round and game ends never wait on disk
+- Indexed top-N leaderboard queries per difficulty
+- Leaderboards cached in memory after each commit for drawing
+- Achievement unlocks recorded once per profile
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import config
+from utils.logger import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    difficulty TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    rounds INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    finished REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_leaderboard ON runs (difficulty, score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_profile ON runs (profile_id, finished);
+CREATE TABLE IF NOT EXISTS achievements (
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    name TEXT NOT NULL,
+    unlocked REAL NOT NULL,
+    PRIMARY KEY (profile_id, name)
+);
+"""
+
+LEADERBOARD_QUERY = """
+SELECT profiles.name, runs.score, runs.finished
+FROM runs JOIN profiles ON profiles.id = runs.profile_id
+WHERE runs.difficulty = ?
+ORDER BY runs.score DESC
+LIMIT ?
+"""
+
+_STOP = object()
+
+class ProfileStore:
+    """
+    Asynchronous, batched writer in front of a SQLite database.
+
+    The writer thread owns the only connection. Game code calls the
+    record_* methods, which just enqueue; top_scores() reads the cache the
+    writer refreshes after each commit.
+
+    Args:
+        path (str): Database file
+        batch_window (float): Seconds the writer waits to gather a batch
+        leaderboard_size (int): Entries cached per difficulty
+    """
+
+    def __init__(self, path=None, batch_window=None, leaderboard_size=None):
+        self.path = path or config.PROFILE_DB_PATH
+        self.batch_window = config.PROFILE_BATCH_WINDOW if batch_window is None else batch_window
+        self.leaderboard_size = leaderboard_size or config.LEADERBOARD_SIZE
+        self.leaderboards = {}
+        self._queue = queue.SimpleQueue()
+        self._profile_ids = {}
+        self._thread = threading.Thread(target=self._run, name="profile-store", daemon=True)
+        self._thread.start()
+
+    def record_run(self, profile, difficulty, score, rounds, outcome):
+        """Queue a finished run for the leaderboard and run history."""
+        self._queue.put(("run", profile, difficulty, int(score), rounds, outcome, time.time()))
+
+    def record_achievement(self, profile, name):
+        """Queue an achievement unlock; repeats keep the first unlock time."""
+        self._queue.put(("achievement", profile, name, time.time()))
+
+    def top_scores(self, difficulty):
+        """
+        Cached leaderboard for a difficulty.
+
+        Returns:
+            list: (profile name, score, finished timestamp), best first
+        """
+        return self.leaderboards.get(difficulty, [])
+
+    def close(self):
+        """Flush queued writes and stop the writer thread."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _run(self):
+        try:
+            connection = self._connect()
+        except sqlite3.Error as e:
+            logger.warning(f"Profile store unavailable, scores will not be saved: {e}")
+            connection = None
+
+        if connection is not None:
+            for difficulty in config.DIFFICULTY_SETTINGS:
+                self._refresh_leaderboard(connection, difficulty)
+
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                batch.pop()
+                running = False
+            if connection is not None and batch:
+                self._write_batch(connection, batch)
+
+        if connection is not None:
+            connection.close()
+
+    def _write_batch(self, connection, batch):
+        changed = set()
+        try:
+            with connection:
+                for item in batch:
+                    if item[0] == "run":
+                        _, profile, difficulty, score, rounds, outcome, finished = item
+                        connection.execute(
+                            "INSERT INTO runs (profile_id, difficulty, score, rounds, outcome, finished) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            (self._profile_id(connection, profile), difficulty, score, rounds, outcome, finished)
+                        )
+                        changed.add(difficulty)
+                    else:
+                        _, profile, name, unlocked = item
+                        connection.execute(
+                            "INSERT OR IGNORE INTO achievements (profile_id, name, unlocked) VALUES (?, ?, ?)",
+                            (self._profile_id(connection, profile), name, unlocked)
+                        )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save {len(batch)} profile store writes: {e}")
+            self._profile_ids.clear()  # Ids from a rolled-back transaction are invalid
+            return
+        for difficulty in changed:
+            self._refresh_leaderboard(connection, difficulty)
+
+    def _profile_id(self, connection, name):
+        profile_id = self._profile_ids.get(name)
+        if profile_id is None:
+            connection.execute(
+                "INSERT OR IGNORE INTO profiles (name, created) VALUES (?, ?)", (name, time.time())
+            )
+            profile_id = connection.execute(
+                "SELECT id FROM profiles WHERE name = ?", (name,)
+            ).fetchone()[0]
+            self._profile_ids[name] = profile_id
+        return profile_id
+
+    def _refresh_leaderboard(self, connection, difficulty):
+        rows = connection.execute(LEADERBOARD_QUERY, (difficulty, self.leaderboard_size)).fetchall()
+        # Replacing the dict entry is atomic for readers on the game thread
+        self.leaderboards[difficulty] = rows
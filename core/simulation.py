@@ -0,0 +1,273 @@
+import collections
+import math
+import threading
+import time
+import config
+from utils.logger import logger, log_exception
+from utils.metrics import metrics
+
+"""
+Simulation Module
+
+Decouples the simulation from rendering. The renderer reads immutable
+snapshots of the game state; in threaded mode the simulation ticks on its
+own thread at a fixed rate, so a slow draw no longer stretches the sim
+delta and sim cost can be measured on its own.
+
+Features:
+- SimSnapshot: immutable view of everything the game screen draws
+- SimulationThread: fixed-rate ticking with bounded catch-up
+- Double-buffered snapshot publication; readers never block and never
+  see a partially updated state
+- Input handed across as commands on a deque (append and popleft are
+  atomic, no lock needed)
+- Idle blocking outside of play, so menus cost no sim CPU
+- TimeWarp: sim speed multipliers run as bounded substeps within a
+  per-frame budget, reporting the warp actually achieved
+"""
+
+SIM_TICK_TIME = metrics.histogram("sim_tick_seconds", "Time spent in one simulation step")
+
+# Most fixed steps run to catch up after a stall, so a long pause does
+# not turn into a burst of simulation
+MAX_CATCH_UP_STEPS = 5
+
+# Seconds over which the achieved warp is averaged
+WARP_SMOOTHING_TIME = 0.5
+
+SimSnapshot = collections.namedtuple("SimSnapshot", [
+    "tick",            # Simulation steps taken
+    "game_state",      # GameManager.game_state
+    "health",          # HealthSystem.current_health
+    "health_state",    # HealthSystem.get_health_state()
+    "temperature",
+    "ph",
+    "salinity",
+    "active_events",   # Tuple of Events; only description and effects are read
+    "is_warning",
+    "warning_message",
+    "current_round",
+    "total_rounds",
+    "time_remaining",
+    "score",
+    "coral_health",    # HealthSystem.coral_health(): per-coral health or None
+    "year",            # Calendar year in decades mode, otherwise None
+    "time_warp",       # TimeWarp.requested
+    "achieved_warp"    # TimeWarp.achieved
+])
+
+def take_snapshot(game_manager, tick=0):
+    """
+    Capture the state the renderer needs from a GameManager.
+
+    Args:
+        game_manager (GameManager): Source of the state
+        tick (int): Simulation step counter to stamp the snapshot with
+
+    Returns:
+        SimSnapshot: Immutable snapshot
+    """
+    health_system = game_manager.health_system
+    event_system = game_manager.event_system
+    return SimSnapshot(
+        tick,
+        game_manager.game_state,
+        health_system.current_health,
+        health_system.get_health_state(),
+        health_system.temperature,
+        health_system.ph,
+        health_system.salinity,
+        tuple(event_system.active_events),
+        event_system.is_warning,
+        event_system.get_warning_message(),
+        game_manager.current_round,
+        game_manager.TOTAL_ROUNDS,
+        max(0, game_manager.round_timer),
+        game_manager.score,
+        health_system.coral_health(),  # A new array each call, safe to share
+        game_manager.scenario.start_year + game_manager.climate_year if game_manager.scenario else None,
+        game_manager.time_warp.requested,
+        game_manager.time_warp.achieved
+    )
+
+class TimeWarp:
+    """
+    Sim speed multiplier, applied by substepping.
+
+    A warped frame is not one long step: the sim time it covers is split
+    into equal steps of at most TIME_WARP_MAX_STEP, so damage thresholds
+    and event warnings see the same step sizes as at normal speed.
+    Stepping stops after TIME_WARP_MAX_SUBSTEPS steps, or when the next
+    step would run over TIME_WARP_BUDGET of wall-clock time; the sim time
+    left over is dropped and the achieved warp falls below the requested.
+
+    Attributes:
+        level (int): Index of the selected multiplier in levels
+        achieved (float): Smoothed sim seconds per real second
+    """
+
+    def __init__(self, levels=None):
+        self.levels = tuple(levels or config.TIME_WARP_LEVELS)
+        self.max_step = config.TIME_WARP_MAX_STEP
+        self.max_substeps = config.TIME_WARP_MAX_SUBSTEPS
+        self.budget = config.TIME_WARP_BUDGET
+        self.reset()
+
+    @property
+    def requested(self):
+        return self.levels[self.level]
+
+    def reset(self):
+        self.level = 0
+        self.achieved = float(self.requested)
+
+    def set_level(self, level):
+        level = max(0, min(len(self.levels) - 1, level))
+        if level != self.level:
+            self.level = level
+            logger.info(f"Time warp set to x{self.requested}")
+
+    def faster(self):
+        self.set_level(self.level + 1)
+
+    def slower(self):
+        self.set_level(self.level - 1)
+
+    def advance(self, step, delta_time, active=None):
+        """
+        Run the sim steps covering delta_time of real time.
+
+        Args:
+            step (callable): step(sim_delta) advances the simulation
+            delta_time (float): Real seconds to cover
+            active (callable): Checked after each step; stepping stops
+                once it returns False, e.g. when the round has ended
+
+        Returns:
+            int: Steps taken
+        """
+        if delta_time <= 0:
+            return 0
+        sim_time = delta_time * self.requested
+        substeps = min(self.max_substeps, max(1, math.ceil(sim_time / self.max_step - 1e-9)))
+        sim_step = min(self.max_step, sim_time / substeps)
+
+        start = time.perf_counter()
+        steps = 0
+        while steps < substeps:
+            tick_start = time.perf_counter()
+            step(sim_step)
+            SIM_TICK_TIME.observe(time.perf_counter() - tick_start)
+            steps += 1
+            if active and not active():
+                # A cut-short frame says nothing about the achievable warp
+                return steps
+            # Stop before a step that would run over the budget
+            elapsed = time.perf_counter() - start
+            if elapsed + elapsed / steps > self.budget:
+                break
+
+        smoothing = min(1.0, delta_time / WARP_SMOOTHING_TIME)
+        self.achieved += (steps * sim_step / delta_time - self.achieved) * smoothing
+        return steps
+
+class SimulationThread:
+    """
+    Runs the simulation step at a fixed rate on a background thread.
+
+    Only this thread mutates the GameManager while it runs; other threads
+    change game state by submitting commands and read it from snapshots.
+
+    Args:
+        game_manager (GameManager): State owned by the thread
+        step (callable): step(delta_time) advances the simulation while playing
+        rate (float): Fixed ticks per second; with time warp each tick
+            runs as many steps as game_manager.time_warp allows
+    """
+
+    def __init__(self, game_manager, step, rate=None):
+        self.game_manager = game_manager
+        self.step = step
+        self.step_time = 1.0 / (rate or config.SIM_RATE)
+        self.tick = 0
+        self.commands = collections.deque()
+        self._wake = threading.Event()
+        snapshot = take_snapshot(game_manager)
+        self._buffers = [snapshot, snapshot]
+        self._front = 0
+        self._running = False
+        self._thread = None
+
+    @property
+    def latest(self):
+        """Most recently published snapshot."""
+        return self._buffers[self._front]
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on the simulation thread before its next step."""
+        self.commands.append((fn, args))
+        self._wake.set()
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+        logger.info(f"Simulation thread started at {1.0 / self.step_time:.0f} steps per second")
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+
+    def _publish(self):
+        back = 1 - self._front
+        self._buffers[back] = take_snapshot(self.game_manager, self.tick)
+        self._front = back  # Single assignment: readers switch atomically
+
+    def _playing(self):
+        return self.game_manager.game_state == "playing"
+
+    def _step(self, delta_time):
+        try:
+            self.step(delta_time)
+        except Exception as e:
+            log_exception(e, "Error in simulation step")
+        self.tick += 1
+
+    def _run_commands(self):
+        commands = self.commands
+        while commands:
+            fn, args = commands.popleft()
+            try:
+                fn(*args)
+            except Exception as e:
+                log_exception(e, "Error in simulation command")
+
+    def _run(self):
+        next_step = time.perf_counter()
+        while self._running:
+            self._wake.clear()
+            self._run_commands()
+
+            if self.game_manager.game_state != "playing":
+                self._publish()
+                # Nothing advances outside of play; sleep until a command arrives
+                self._wake.wait()
+                next_step = time.perf_counter()
+                continue
+
+            now = time.perf_counter()
+            steps = 0
+            while next_step <= now and steps < MAX_CATCH_UP_STEPS:
+                self.game_manager.time_warp.advance(self._step, self.step_time, self._playing)
+                next_step += self.step_time
+                steps += 1
+                if not self._playing():
+                    break
+            if steps == MAX_CATCH_UP_STEPS:
+                next_step = max(next_step, now)  # Drop the rest of the backlog
+            if steps:
+                self._publish()
+
+            self._wake.wait(max(0.0, next_step - time.perf_counter()))
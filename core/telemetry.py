@@ -0,0 +1,247 @@
+"""
+Telemetry Module
+
+Per-tick session recorder writing a compact columnar format that analysts
+can memory-map with NumPy, plus vectorized queries over recorded runs.
+
+Features:
+- Preallocated typed column buffers, one slot written per simulation tick
+- Chunked flushes to one raw little-endian file per column
+- JSON manifest with row count, column dtypes and event code table
+- Zero-parse loading through numpy.memmap
+- Vectorized queries: time in optimal range, damage per event,
+  reaction latency
+
+On-disk layout, one directory per run:
+    <TELEMETRY_DIR>/<run_id>/manifest.json
+    <TELEMETRY_DIR>/<run_id>/<column>.bin
+"""
+
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+import config
+from utils.logger import logger
+
+FORMAT_VERSION = 1
+
+COLUMNS = {
+    "time": np.dtype("<f8"),         # Seconds of game time since start_game
+    "dt": np.dtype("<f4"),           # Tick length in seconds
+    "round": np.dtype("<u2"),
+    "score": np.dtype("<i4"),
+    "health": np.dtype("<f4"),
+    "temperature": np.dtype("<f4"),
+    "ph": np.dtype("<f4"),
+    "salinity": np.dtype("<f4"),
+    "event": np.dtype("<i1"),        # Index into manifest "events", -1 when none
+    "controlled": np.dtype("<u1"),   # Bitmask of CONTROL_BITS
+}
+
+CONTROL_BITS = {"temperature": 1, "ph": 2, "salinity": 4}
+
+class TelemetryRecorder:
+    """
+    Records one row per GameManager.update tick while a game is running.
+
+    Args:
+        directory (str): Root directory runs are written under
+        chunk_ticks (int): Rows buffered in memory before each flush
+    """
+
+    def __init__(self, directory=None, chunk_ticks=None):
+        self.directory = directory or config.TELEMETRY_DIR
+        self.chunk_ticks = chunk_ticks or config.TELEMETRY_CHUNK_TICKS
+        self.buffers = {name: np.empty(self.chunk_ticks, dtype) for name, dtype in COLUMNS.items()}
+        self.size = 0
+        self.rows = 0
+        self.run_path = None
+        self.manifest = None
+        self.event_codes = {}
+        self.run_counter = 0
+
+    def start_run(self, game_manager):
+        """Finish any open run and begin a new one for a fresh game."""
+        self.end_run()
+        self.run_counter += 1
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{self.run_counter}"
+        self.run_path = os.path.join(self.directory, run_id)
+        os.makedirs(self.run_path, exist_ok=True)
+
+        events = [event["description"] for event in game_manager.event_system.possible_events]
+        self.event_codes = {description: code for code, description in enumerate(events)}
+        self.manifest = {
+            "format": FORMAT_VERSION,
+            "rows": 0,
+            "columns": {name: dtype.str for name, dtype in COLUMNS.items()},
+            "events": events,
+            "difficulty": game_manager.difficulty,
+            "started": datetime.now().isoformat(timespec="seconds")
+        }
+        self.rows = 0
+        self.size = 0
+        self._write_manifest()
+        logger.info(f"Recording telemetry to {self.run_path}")
+
+    def record(self, game_manager, delta_time):
+        """Append one tick. Called from GameManager.update."""
+        if self.run_path is None:
+            return
+        i = self.size
+        buffers = self.buffers
+        health = game_manager.health_system
+        buffers["time"][i] = game_manager.time_elapsed
+        buffers["dt"][i] = delta_time
+        buffers["round"][i] = game_manager.current_round
+        buffers["score"][i] = game_manager.score
+        buffers["health"][i] = health.current_health
+        buffers["temperature"][i] = health.temperature
+        buffers["ph"][i] = health.ph
+        buffers["salinity"][i] = health.salinity
+
+        active_events = game_manager.event_system.active_events
+        buffers["event"][i] = self.event_codes.get(active_events[0].description, -1) if active_events else -1
+
+        controlled = 0
+        for factor, bit in CONTROL_BITS.items():
+            if game_manager.player_controlled[factor]:
+                controlled |= bit
+        buffers["controlled"][i] = controlled
+
+        self.size = i + 1
+        if self.size == self.chunk_ticks:
+            self.flush()
+
+    def flush(self):
+        """Append buffered rows to the column files and update the manifest."""
+        if self.run_path is None or self.size == 0:
+            return
+        for name, buffer in self.buffers.items():
+            with open(os.path.join(self.run_path, f"{name}.bin"), "ab") as f:
+                buffer[:self.size].tofile(f)
+        self.rows += self.size
+        self.size = 0
+        self._write_manifest()
+
+    def end_run(self):
+        """Flush and close the current run, if any."""
+        if self.run_path is None:
+            return
+        self.flush()
+        logger.info(f"Telemetry run closed with {self.rows} ticks")
+        self.run_path = None
+
+    def _write_manifest(self):
+        self.manifest["rows"] = self.rows
+        tmp_path = os.path.join(self.run_path, "manifest.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.run_path, "manifest.json"))
+
+def load_run(path):
+    """
+    Memory-map a recorded run.
+
+    Args:
+        path (str): Run directory containing manifest.json
+
+    Returns:
+        dict: Column name to read-only numpy.memmap, plus "manifest"
+    """
+    with open(os.path.join(path, "manifest.json")) as f:
+        manifest = json.load(f)
+    rows = manifest["rows"]
+    run = {"manifest": manifest}
+    for name, dtype in manifest["columns"].items():
+        if rows == 0:
+            run[name] = np.empty(0, dtype=np.dtype(dtype))
+        else:
+            run[name] = np.memmap(os.path.join(path, f"{name}.bin"), dtype=np.dtype(dtype),
+                                  mode="r", shape=(rows,))
+    return run
+
+def load_runs(directory=None):
+    """Memory-map every run under a telemetry directory, oldest first."""
+    directory = directory or config.TELEMETRY_DIR
+    runs = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(os.path.join(path, "manifest.json")):
+            runs.append(load_run(path))
+    return runs
+
+def time_in_optimal_range(run):
+    """
+    Fraction of game time with every factor inside the regeneration thresholds.
+
+    Args:
+        run (dict): Run returned by load_run
+
+    Returns:
+        float: Fraction between 0 and 1
+    """
+    dt = run["dt"]
+    total = float(dt.sum())
+    if total == 0:
+        return 0.0
+    thresholds = config.HEALTH_REGEN_THRESHOLDS
+    optimal = (
+        (np.abs(run["temperature"] - config.TEMP_OPTIMAL) < thresholds["temperature"])
+        & (np.abs(run["ph"] - config.PH_OPTIMAL) < thresholds["ph"])
+        & (np.abs(run["salinity"] - config.SALINITY_OPTIMAL) < thresholds["salinity"])
+    )
+    return float(dt[optimal].sum()) / total
+
+def damage_per_event(run):
+    """
+    Health lost while each event was active.
+
+    Args:
+        run (dict): Run returned by load_run
+
+    Returns:
+        dict: Event description (or None for no event) to health lost
+    """
+    health = run["health"].astype(np.float64)
+    if health.size == 0:
+        return {}
+    loss = -np.minimum(np.diff(health, prepend=health[0]), 0.0)
+    events = run["manifest"]["events"]
+    totals = np.bincount(run["event"].astype(np.int64) + 1, weights=loss,
+                         minlength=len(events) + 1)
+    result = {None: float(totals[0])}
+    for code, description in enumerate(events):
+        result[description] = float(totals[code + 1])
+    return result
+
+def reaction_latency(run):
+    """
+    Seconds from each event's start to the player's first slider input.
+
+    Events the player never reacted to before they ended are omitted.
+
+    Args:
+        run (dict): Run returned by load_run
+
+    Returns:
+        numpy.ndarray: One latency per event the player reacted to
+    """
+    event = run["event"]
+    if event.size == 0:
+        return np.empty(0)
+    time = run["time"]
+    active = event >= 0
+    edges = np.diff(active.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    controls = np.flatnonzero(run["controlled"])
+
+    first = np.searchsorted(controls, starts)
+    valid = first < controls.size
+    starts, ends, first = starts[valid], ends[valid], first[valid]
+    reacted = controls[first]
+    in_window = reacted <= ends
+    return time[reacted[in_window]] - time[starts[in_window]]
@@ -1,38 +1,86 @@
 import pygame
 import sys
+import time
 from core.game_manager import GameManager
+from core.simulation import SimulationThread, take_snapshot
 from ui.main_menu import MainMenu
-from visuals.visual_feedback import VisualFeedback
-from ui.game_over_screen import GameOverScreen
-from ui.game_screen import GameScreen
 import config
 from visuals.ocean_background import OceanBackground
-from ui.round_transition import RoundTransitionScreen
+from ui.screen_loader import ScreenLoader
 from utils.logger import logger
+from utils.frame_governor import FrameGovernor
+from utils.startup_timer import startup_timer
+from utils.metrics import metrics, MetricsExporter, SURFACE_ALLOCATIONS
+
+FRAME_TIME = metrics.histogram("frame_time_seconds", "Time spent handling, updating and drawing one frame")
+SURFACES_PER_FRAME = metrics.histogram(
+    "surface_allocations_per_frame", "Surfaces allocated during one frame", (0, 1, 5, 10, 20, 50, 100, 200, 500)
+)
 
 class CoralReefSimulator:
     def __init__(self):
         logger.info("Initializing Coral Reef Simulator")
         try:
-            pygame.init()
-            self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-            pygame.display.set_caption("Coral Reef Survival Simulator")
+            with startup_timer.measure("pygame.init"):
+                # Only the modules the game uses; the audio backend
+                # initializes the mixer itself, if it needs one
+                pygame.display.init()
+                pygame.font.init()
+            with startup_timer.measure("display"):
+                self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+                pygame.display.set_caption("Coral Reef Survival Simulator")
             
             # Initialize game components
             self.clock = pygame.time.Clock()
+            self.frame_governor = FrameGovernor(self.clock)
             self.game_manager = GameManager()
+            if config.TELEMETRY_ENABLED:
+                from core.telemetry import TelemetryRecorder
+                self.game_manager.telemetry = TelemetryRecorder()
+            if config.ENVIRONMENT_FIELD_ENABLED:
+                from core.environment_field import EnvironmentField
+                self.game_manager.attach_environment_field(EnvironmentField())
+            if config.CORAL_POPULATION_ENABLED:
+                from core.coral_population import CoralPopulation
+                self.game_manager.attach_coral_population(CoralPopulation())
+            
+            # Optional fixed-rate simulation thread; screens then read its
+            # snapshots and change game state through its command queue
+            self.simulation = None
+            self.decades = False
+            self.snapshot = take_snapshot(self.game_manager)
+            if config.SIM_THREAD:
+                self.simulation = SimulationThread(self.game_manager, self.simulate)
+                self.simulation.start()
             
-            # Create screen dictionary with "playing" instead of "game"
-            self.screens = {
-                "menu": MainMenu(self.screen),
-                "playing": GameScreen(self.screen, self.game_manager),  # Changed from "game" to "playing"
-                "game_over": GameOverScreen(self.screen, self.game_manager),
-                "round_end": RoundTransitionScreen(self.screen, self.game_manager)
-            }
-            self.visual_feedback = VisualFeedback(self.screen)
+            # Only the menu is created up front. The other screens are
+            # imported and built by the loader while the menu is up, or on
+            # first entry if Start comes first.
+            with startup_timer.measure("screens"):
+                self.screens = {"menu": MainMenu(self.screen)}
+            self.loader = ScreenLoader()
+            self.loader.add("screens.import", self.create_screens)
+            if config.PROFILE_STORE_ENABLED:
+                # Opened by the loader too, keeping sqlite3 off the first-frame path
+                self.loader.add("profile_store", self.open_profile_store)
+            self.screens["menu"].loading_progress = 0.0
             self.ocean_background = OceanBackground(self.screen)
             self.running = True
             
+            self.memory_tracker = None
+            if config.MEMORY_TRACKING:
+                from utils.memory_tracker import MemoryTracker
+                self.memory_tracker = MemoryTracker(report_interval=config.MEMORY_REPORT_INTERVAL)
+                self.memory_tracker.start()
+            
+            self.metrics_exporter = None
+            if config.METRICS_ENABLED:
+                self.metrics_exporter = MetricsExporter(
+                    metrics, config.METRICS_EXPORT_PATH,
+                    config.METRICS_EXPORT_INTERVAL, config.METRICS_HTTP_PORT
+                )
+                self.metrics_exporter.start()
+            
             logger.debug("All game screens initialized successfully")
             
         except Exception as e:
@@ -42,56 +90,185 @@ class CoralReefSimulator:
     def run(self):
         logger.info("Starting game loop")
         while self.running:
-            
-            delta_time = self.clock.tick(config.FPS) / 1000.0
-            self.handle_events()
+            if self.simulation:
+                self.snapshot = self.simulation.latest
+            current_state = self.game_state
+            # Keep frames coming while the loader has work to do
+            governor_state = current_state if self.loader.done else "loading"
+            events = self.frame_governor.get_events(governor_state)
+            delta_time = self.frame_governor.tick(governor_state)
+            frame_start = time.perf_counter()
+            surfaces_before = SURFACE_ALLOCATIONS.value
+            self.handle_events(events)
             self.update(delta_time)
-            self.draw()
-            pygame.display.flip()
+            if self.frame_governor.should_draw():
+                self.draw()
+                if "first_frame" not in startup_timer.marks:
+                    startup_timer.mark("first_frame")
+            if current_state == "menu":
+                # Build screens after the frame is shown, so the menu appears first
+                self.load_screens()
+            FRAME_TIME.observe(time.perf_counter() - frame_start)
+            SURFACES_PER_FRAME.observe(SURFACE_ALLOCATIONS.value - surfaces_before)
+            if self.memory_tracker:
+                self.memory_tracker.frame()
                 
         # Clean up when game ends
+        logger.info(f"Average CPU use: {self.frame_governor.get_session_cpu_percent():.1f}%")
         logger.info("Game shutting down")
+        if self.simulation:
+            self.simulation.stop()
+        if self.game_manager.telemetry:
+            self.game_manager.telemetry.end_run()
+        if self.game_manager.profile_store:
+            self.game_manager.profile_store.close()
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
+        if self.memory_tracker:
+            from utils.memory_tracker import format_report
+            self.memory_tracker.snapshot()
+            logger.info(format_report(self.memory_tracker.report()))
+            self.memory_tracker.stop()
         pygame.quit()
         sys.exit()
         
-    def handle_events(self):
-        for event in pygame.event.get():
+    @property
+    def game_state(self):
+        """Game state as seen by the renderer."""
+        if self.simulation:
+            return self.snapshot.game_state
+        return self.game_manager.game_state
+        
+    def command(self, fn, *args):
+        """Change game state directly, or through the simulation thread when it owns the state."""
+        if self.simulation:
+            self.simulation.submit(fn, *args)
+        else:
+            fn(*args)
+        
+    def create_screens(self):
+        """Import and create the gameplay screens, queueing the game screen's build steps."""
+        from ui.game_screen import GameScreen
+        from ui.game_over_screen import GameOverScreen
+        from ui.round_transition import RoundTransitionScreen
+        from visuals.visual_feedback import VisualFeedback
+        
+        # Changed from "game" to "playing"
+        game_screen = GameScreen(self.screen, self.game_manager, deferred=True)
+        if self.simulation:
+            game_screen.submit = self.simulation.submit
+        self.screens["playing"] = game_screen
+        self.screens["game_over"] = GameOverScreen(self.screen, self.game_manager)
+        self.screens["round_end"] = RoundTransitionScreen(self.screen, self.game_manager)
+        self.visual_feedback = VisualFeedback(self.screen)
+        for name, step in game_screen.build_steps():
+            self.loader.add(f"game_screen.{name}", step)
+        
+    def open_profile_store(self):
+        from core.profile_store import ProfileStore
+        self.game_manager.profile_store = ProfileStore()
+        
+    def load_screens(self, finish=False):
+        """
+        Advance screen loading by one frame's budget, or to completion.
+        
+        Args:
+            finish (bool): Build everything left now, e.g. when Start is
+                clicked before loading is done
+        """
+        if self.loader.done:
+            return
+        if finish:
+            self.loader.finish()
+        else:
+            self.loader.run()
+        if self.loader.done:
+            self.screens["menu"].loading_progress = None
+            startup_timer.mark("screens_loaded")
+            logger.info(startup_timer.report())
+        else:
+            self.screens["menu"].loading_progress = self.loader.progress
+        
+    def start_game(self, decades=None):
+        """
+        Start a game; restarts keep the mode of the last one.
+        
+        Args:
+            decades (bool): Play the climate scenario in decades mode
+        """
+        if decades is not None:
+            self.decades = decades
+        self.load_screens(finish=True)
+        scenario = None
+        if self.decades:
+            from core.climate_scenario import ClimateScenario
+            scenario = ClimateScenario()
+        self.command(self.game_manager.start_game, scenario)
+        
+    def is_playing(self):
+        return self.game_manager.game_state == "playing"
+        
+    def visual_delta(self, delta_time):
+        """
+        Frame time for visual-only systems (fish, particles, waves): sped
+        up with the achieved time warp, but at most TIME_WARP_VISUAL_RATE.
+        """
+        if self.game_state != "playing":
+            return delta_time
+        return delta_time * max(1.0, min(self.snapshot.achieved_warp, config.TIME_WARP_VISUAL_RATE))
+        
+    def simulate(self, delta_time):
+        """One simulation step: game rules, then the rules owned by the game screen."""
+        playing = self.game_manager.game_state == "playing"
+        self.game_manager.update(delta_time)
+        if playing:
+            self.screens["playing"].update_simulation(delta_time)
+        
+    def handle_events(self, events):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
                 
-            # Use game_state directly from game_manager
-            current_state = self.game_manager.game_state
+            current_state = self.game_state
             
             if current_state == "menu":
                 action = self.screens["menu"].handle_event(event)
                 if action == "start":
-                    self.game_manager.start_game()
+                    self.start_game(decades=False)
+                elif action == "start_decades":
+                    self.start_game(decades=True)
             
             elif current_state == "playing":  # Changed from "game" to "playing"
                 self.screens["playing"].handle_event(event)  # Changed from "game" to "playing"
             
             elif current_state == "round_end":
                 action = self.screens["round_end"].handle_event(event)
-                if action == "menu":
-                    self.game_manager.game_state = "menu"
+                if action == "continue":
+                    self.command(self.game_manager.start_next_round)
+                elif action == "menu":
+                    self.command(self.game_manager.return_to_menu)
             
             elif current_state == "game_over":
                 action = self.screens["game_over"].handle_event(event)
                 if action == "restart":
-                    self.game_manager.start_game()
+                    self.start_game()
                 elif action == "quit":
                     self.running = False
                 
     def update(self, delta_time):
-        self.ocean_background.update(delta_time)
+        visual_delta_time = self.visual_delta(delta_time)
+        self.ocean_background.update(visual_delta_time)
         
-        current_state = self.game_manager.game_state
+        current_state = self.game_state
         if current_state == "menu":
             self.screens["menu"].update()
         elif current_state == "playing":
-            self.game_manager.update(delta_time)
-            self.screens["playing"].update(delta_time)
+            if not self.simulation:
+                # Substepped, so time warp never stretches a single step
+                self.game_manager.time_warp.advance(self.simulate, delta_time, self.is_playing)
+                self.snapshot = take_snapshot(self.game_manager)
+            self.screens["playing"].update_visuals(delta_time, self.snapshot, visual_delta_time)
             self.visual_feedback.update(delta_time)
         elif current_state == "round_end":
             self.screens["round_end"].update()
@@ -101,7 +278,7 @@ class CoralReefSimulator:
         self.ocean_background.draw()
         
         # Draw the current screen based on game state
-        current_state = self.game_manager.game_state
+        current_state = self.game_state
         if current_state in self.screens:
             self.screens[current_state].draw()
         
@@ -8,6 +8,7 @@ class GameOverScreen:
         self.game_manager = game_manager
         self.font = pygame.font.Font(None, 64)
         self.small_font = pygame.font.Font(None, 32)
+        self.list_font = pygame.font.Font(None, 26)
         logger.info("GameOverScreen initialized")
 
     def handle_event(self, event):
@@ -60,4 +61,23 @@ class GameOverScreen:
         pygame.draw.rect(self.screen, config.RED, quit_rect)
         quit_text = self.small_font.render("Quit", True, config.BLACK)
         quit_text_rect = quit_text.get_rect(center=quit_rect.center)
-        self.screen.blit(quit_text, quit_text_rect) 
\ No newline at end of file
+        self.screen.blit(quit_text, quit_text_rect)
+        
+        self.draw_leaderboard(quit_rect.bottom + 30)
+
+    def draw_leaderboard(self, top):
+        """Draw the cached top scores for the current difficulty."""
+        store = self.game_manager.profile_store
+        if not store:
+            return
+        entries = store.top_scores(self.game_manager.leaderboard_key)
+        if not entries:
+            return
+        
+        title = self.small_font.render(f"Top Scores ({self.game_manager.difficulty.title()})", True, config.WHITE)
+        self.screen.blit(title, title.get_rect(midtop=(config.SCREEN_WIDTH/2, top)))
+        y = top + title.get_height() + 8
+        for rank, (name, score, _) in enumerate(entries, 1):
+            line = self.list_font.render(f"{rank}. {name}  {score}", True, config.WHITE)
+            self.screen.blit(line, line.get_rect(midtop=(config.SCREEN_WIDTH/2, y)))
+            y += line.get_height() + 4 
\ No newline at end of file
@@ -2,13 +2,18 @@ import pygame
 import config
 from visuals.background_manager import BackgroundManager
 from visuals.animations import CoralAnimation, FishAnimation
+from visuals.fish_flock import FishFlock
 from core.facts_manager import FactsManager
 from audio.sound_manager import SoundManager
 from visuals.particle_system import ParticleSystem
 from ui.tutorial_overlay import TutorialOverlay
-from core.achievements import AchievementManager
+from core.achievements import AchievementManager, StreakCounter
 from core.power_ups import PowerUpManager
+from core.simulation import take_snapshot
+from visuals.text_cache import TextCache
+from visuals.text_layout import render_wrapped
 from utils.logger import logger
+from utils.startup_timer import startup_timer
 import math
 
 """
@@ -25,6 +30,10 @@ Features:
 - Particle effects
 - Sound management
 - Achievement tracking
+
+Updating is split in two: update_simulation() holds the gameplay rules
+and runs alongside GameManager.update, possibly on the simulation thread;
+update_visuals() and draw() only read a SimSnapshot.
 """
 
 class Slider:
@@ -58,83 +67,142 @@ class Slider:
         pygame.draw.rect(screen, config.BLACK, handle_rect)
 
 class GameScreen:
-    def __init__(self, screen, game_manager):
+    def __init__(self, screen, game_manager, deferred=False):
         logger.info("Initializing GameScreen")
         
         self.screen = screen
         self.game_manager = game_manager
         self.font = pygame.font.Font(None, 36)
-        
-        try:
-            # Initialize background first
-            logger.debug("Initializing BackgroundManager")
-            self.background = BackgroundManager(screen)
+        self.label_font = pygame.font.SysFont('arial', 24)
+        self.text_cache = TextCache()
+        self.snapshot = take_snapshot(game_manager)
+        
+        # Add timer for health regeneration
+        self.optimal_condition_timer = 0
+        self.REGEN_DELAY = 5.0
+        self.REGEN_RATE = 1.0
+        
+        if not deferred:
+            try:
+                for name, step in self.build_steps():
+                    step()
+            except Exception as e:
+                logger.error(f"Error during GameScreen initialization: {str(e)}", exc_info=True)
+                raise
             
-            # Create coral animations
-            logger.debug("Creating coral animations")
+    def build_steps(self):
+        """
+        Construction steps for the screen's components, in order.
+        
+        A screen created with deferred=True is not usable until every step
+        has run; the ScreenLoader runs them between menu frames.
+        
+        Returns:
+            list: (name, callable) pairs
+        """
+        return [
+            ("background", self._build_background),
+            ("corals", self._build_corals),
+            ("fish", self._build_fish),
+            ("controls", self._build_controls),
+            ("managers", self._build_managers),
+            ("tutorial", self._build_tutorial)
+        ]
+        
+    def _build_background(self):
+        # Initialize background first
+        logger.debug("Initializing BackgroundManager")
+        self.background = BackgroundManager(self.screen)
+        
+    def _build_corals(self):
+        # Create coral animations
+        logger.debug("Creating coral animations")
+        population = self.game_manager.health_system.population
+        if population is not None:
+            # One coral per strip of colonies, of the strip's main species
+            self.corals = [
+                CoralAnimation(x, y, coral_type) for x, y, coral_type in population.render_sites()
+            ]
+        else:
             self.corals = [
                 CoralAnimation(x, config.SCREEN_HEIGHT - 100) 
                 for x in range(100, config.SCREEN_WIDTH - 100, 150)
             ]
-            logger.info(f"Created {len(self.corals)} coral animations")
-            
-            # Create fish schools with different behaviors
-            logger.debug("Creating fish schools")
-            self.fish_schools = []
-            
-            # Surface fish school
-            surface_school = FishAnimation(screen)
-            surface_school.y = config.SCREEN_HEIGHT * 0.2  # Near surface
-            surface_school.target_y = surface_school.y
-            
-            # Middle fish school
-            middle_school = FishAnimation(screen)
-            middle_school.y = config.SCREEN_HEIGHT * 0.5  # Middle of screen
-            middle_school.target_y = middle_school.y
-            
-            # Deep fish school
-            deep_school = FishAnimation(screen)
-            deep_school.y = config.SCREEN_HEIGHT * 0.7  # Deeper water
-            deep_school.target_y = deep_school.y
-            
-            self.fish_schools.extend([surface_school, middle_school, deep_school])
-            logger.info(f"Created {len(self.fish_schools)} fish schools")
-            
-            # Create sliders
-            logger.debug("Initializing environmental control sliders")
-            self.sliders = {
-                "temperature": Slider(100, 500, 200, 20, config.TEMP_MIN, config.TEMP_MAX, config.TEMP_OPTIMAL),
-                "ph": Slider(400, 500, 200, 20, config.PH_MIN, config.PH_MAX, config.PH_OPTIMAL),
-                "salinity": Slider(700, 500, 200, 20, config.SALINITY_MIN, config.SALINITY_MAX, config.SALINITY_OPTIMAL)
-            }
-            
-            # Initialize other managers
-            logger.debug("Initializing game managers")
-            self.facts_manager = FactsManager()
+        logger.info(f"Created {len(self.corals)} coral animations")
+        if self.game_manager.environment_field and population is None:
+            # Each coral reads the conditions at its own position; loading
+            # finishes before play, so the simulation is not sampling yet
+            self.game_manager.environment_field.set_sample_points(
+                [(coral.x, coral.y) for coral in self.corals]
+            )
+        
+    def _build_fish(self):
+        self.fish_schools = []
+        self.fish_flock = None
+        if config.FISH_FLOCKING:
+            logger.debug("Creating fish flock")
+            self.fish_flock = FishFlock(self.screen)
+            self.fish_flock.set_reef([(coral.x, coral.y) for coral in self.corals])
+            logger.info(f"Created flock of {self.fish_flock.count} fish")
+            return
+        
+        # Create fish schools with different behaviors
+        logger.debug("Creating fish schools")
+        
+        # Surface fish school
+        surface_school = FishAnimation(self.screen)
+        surface_school.y = config.SCREEN_HEIGHT * 0.2  # Near surface
+        surface_school.target_y = surface_school.y
+        
+        # Middle fish school
+        middle_school = FishAnimation(self.screen)
+        middle_school.y = config.SCREEN_HEIGHT * 0.5  # Middle of screen
+        middle_school.target_y = middle_school.y
+        
+        # Deep fish school
+        deep_school = FishAnimation(self.screen)
+        deep_school.y = config.SCREEN_HEIGHT * 0.7  # Deeper water
+        deep_school.target_y = deep_school.y
+        
+        self.fish_schools.extend([surface_school, middle_school, deep_school])
+        logger.info(f"Created {len(self.fish_schools)} fish schools")
+        
+    def _build_controls(self):
+        # Create sliders
+        logger.debug("Initializing environmental control sliders")
+        self.sliders = {
+            "temperature": Slider(100, 500, 200, 20, config.TEMP_MIN, config.TEMP_MAX, config.TEMP_OPTIMAL),
+            "ph": Slider(400, 500, 200, 20, config.PH_MIN, config.PH_MAX, config.PH_OPTIMAL),
+            "salinity": Slider(700, 500, 200, 20, config.SALINITY_MIN, config.SALINITY_MAX, config.SALINITY_OPTIMAL)
+        }
+        
+    def _build_managers(self):
+        # Initialize other managers
+        logger.debug("Initializing game managers")
+        self.facts_manager = FactsManager()
+        self.fact_surface = None
+        self._rendered_fact = None
+        with startup_timer.measure("audio.manager"):
             self.sound_manager = SoundManager()
-            self.particle_system = ParticleSystem(screen)
-            self.achievement_manager = AchievementManager(screen)
-            self.power_up_manager = PowerUpManager(screen, game_manager)
-            
-            # Initialize tutorial
-            logger.debug("Initializing tutorial overlay")
-            self.tutorial = TutorialOverlay(screen)
-            self.tutorial.active = True
-            
-            # Start background music
-            logger.debug("Starting background music")
-            self.sound_manager.play_background_music()
-            
-            # Add timer for health regeneration
-            self.optimal_condition_timer = 0
-            self.REGEN_DELAY = 5.0
-            self.REGEN_RATE = 1.0
-            
-            logger.info("GameScreen initialization completed successfully")
-            
-        except Exception as e:
-            logger.error(f"Error during GameScreen initialization: {str(e)}", exc_info=True)
-            raise
+        self.particle_system = ParticleSystem(self.screen)
+        self.achievement_manager = AchievementManager(self.screen)
+        self.optimal_streak = StreakCounter()  # Seconds in balanced conditions
+        self.event_streak = StreakCounter()    # Events survived without bleaching
+        self._was_critical = False
+        self._event_was_active = False
+        self.game_manager.game_start_listeners.append(self.reset_game_state)
+        self.power_up_manager = PowerUpManager(self.screen, self.game_manager)
+        
+        # Start background music
+        logger.debug("Starting background music")
+        self.sound_manager.play_background_music()
+        
+    def _build_tutorial(self):
+        # Initialize tutorial
+        logger.debug("Initializing tutorial overlay")
+        self.tutorial = TutorialOverlay(self.screen)
+        self.tutorial.active = True
+        logger.info("GameScreen initialization completed successfully")
 
     def handle_event(self, event):
         # Handle tutorial first
@@ -146,78 +214,152 @@ class GameScreen:
         # Handle other events only if tutorial is not active
         for slider in self.sliders.values():
             slider.handle_event(event)
-            
-    def update(self, delta_time):
-        """Update game state based on time passed since last frame."""
-        # Get current health for animations
-        current_health = self.game_manager.health_system.current_health
         
-        # Always allow player control through sliders
-        for action_type, slider in self.sliders.items():
-            if slider.active:  # When player is actively moving the slider
-                self.game_manager.handle_player_action(action_type, slider.value)
-            else:  # When slider is not being controlled, update it to show current value
-                current_value = getattr(self.game_manager.health_system, action_type)
-                slider.value = current_value
+        # Time warp: ] speeds up, [ slows down
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RIGHTBRACKET:
+                self.submit(self.game_manager.time_warp.faster)
+            elif event.key == pygame.K_LEFTBRACKET:
+                self.submit(self.game_manager.time_warp.slower)
+            
+    def submit(self, fn, *args):
+        """
+        Apply a game-state change. Replaced with SimulationThread.submit
+        when the simulation runs on its own thread.
+        """
+        fn(*args)
+            
+    def reset_game_state(self):
+        """Forget the previous game's streaks and critical health; runs on each new game."""
+        self.optimal_condition_timer = 0
+        self.optimal_streak.reset()
+        self.event_streak.reset()
+        self._was_critical = False
+        self._event_was_active = False
+            
+    def update_simulation(self, delta_time):
+        """
+        Advance the gameplay rules owned by this screen: regeneration,
+        power-ups and achievements. Runs wherever GameManager.update runs.
+        """
+        health_system = self.game_manager.health_system
+        current_health = health_system.current_health
         
         # Check conditions and update health regeneration
         if self.check_optimal_conditions():
             self.optimal_condition_timer += delta_time
             if self.optimal_condition_timer >= self.REGEN_DELAY:
-                # Increase health by 1 per second
-                self.game_manager.health_system.increase_health(self.REGEN_RATE * delta_time)
+                # Increase health by 1 per second, scaled by regen modifiers
+                regen_rate = self.REGEN_RATE * self.game_manager.modifiers.get("regen_rate")
+                health_system.increase_health(regen_rate * delta_time)
         else:
             # Reset timer if conditions are not optimal
             self.optimal_condition_timer = 0
+                
+        self.power_up_manager.update(delta_time)
+        
+        # Update achievement streaks; only changed values trigger rule checks
+        self.optimal_streak.update(self.check_balanced_conditions(), delta_time)
+        event_active = bool(self.game_manager.event_system.active_events)
+        if self._event_was_active and not event_active:
+            self.event_streak.update(current_health >= 30)
+        self._event_was_active = event_active
+        if current_health < 30:
+            self._was_critical = True
+        
+        unlocked = self.achievement_manager.update_state({
+            "optimal_streak": int(self.optimal_streak.current),
+            "event_streak": self.event_streak.current,
+            "recovery_achieved": self.check_recovery()
+        })
+        if unlocked and self.game_manager.profile_store:
+            for achievement in unlocked:
+                self.game_manager.profile_store.record_achievement(
+                    self.game_manager.profile_name, achievement.name
+                )
+            
+    def update_visuals(self, delta_time, snapshot, visual_delta_time=None):
+        """
+        Update input, animations, sound and HUD from a simulation snapshot.
+        
+        Args:
+            delta_time (float): Time since last frame
+            snapshot (SimSnapshot): Latest published simulation state
+            visual_delta_time (float): Time to advance fish, corals,
+                background and particles by; defaults to delta_time, and
+                is longer under time warp
+        """
+        if visual_delta_time is None:
+            visual_delta_time = delta_time
+        self.snapshot = snapshot
+        current_health = snapshot.health
+        
+        # Always allow player control through sliders
+        for action_type, slider in self.sliders.items():
+            if slider.active:  # When player is actively moving the slider
+                self.submit(self.game_manager.handle_player_action, action_type, slider.value)
+            else:  # When slider is not being controlled, update it to show current value
+                slider.value = getattr(snapshot, action_type)
             
+        coral_health = snapshot.coral_health
+        if coral_health is not None and len(coral_health) != len(self.corals):
+            coral_health = None
+        
         # Update animations and visual elements
+        if self.fish_flock:
+            # Fish steer away from the stressed corals
+            self.fish_flock.update(visual_delta_time, current_health, coral_health)
         for school in self.fish_schools:
-            school.update(delta_time, current_health)  # Pass health state to fish animations
+            school.update(visual_delta_time, current_health)  # Pass health state to fish animations
             
-        for coral in self.corals:
-            coral.update(delta_time, current_health)
+        if coral_health is not None:
+            # Corals under local stress look worse than the reef average
+            for coral, health in zip(self.corals, coral_health):
+                coral.update(visual_delta_time, float(health))
+        else:
+            for coral in self.corals:
+                coral.update(visual_delta_time, current_health)
             
-        self.background.update(delta_time, current_health)
+        self.background.update(visual_delta_time, current_health)
         
-        self.facts_manager.update(delta_time)
+        self.facts_manager.update(delta_time, snapshot.active_events, snapshot.health_state)
+        fact = self.facts_manager.get_current_fact()
+        if fact is not self._rendered_fact:
+            # Wrap and render once per selected fact, not every frame
+            self._rendered_fact = fact
+            self.fact_surface = render_wrapped(
+                self.font, fact, config.WHITE, config.SCREEN_WIDTH - 100
+            ) if fact else None
         
         # Play sounds based on health changes
         if current_health < 30:
             self.sound_manager.play_sound("alert")
         
-        self.particle_system.update(delta_time)
+        self.particle_system.update(visual_delta_time)
         
         # Create particles for events
-        for event in self.game_manager.event_system.active_events:
+        for event in snapshot.active_events:
             if "temperature" in event.effects:
                 self.particle_system.create_warning_effect(150, 500)
             elif "ph" in event.effects:
                 self.particle_system.create_warning_effect(450, 500)
             elif "salinity" in event.effects:
                 self.particle_system.create_warning_effect(750, 500)
-                
-        self.power_up_manager.update(delta_time)
         
-        # Update achievement state
-        game_state = {
-            "optimal_time": self.calculate_optimal_time(),
-            "events_handled": self.game_manager.event_system.events_handled,
-            "recovery_achieved": self.check_recovery()
-        }
-        self.achievement_manager.update(delta_time, game_state)
-        self.achievement_manager.check_achievements(game_state)
+        self.achievement_manager.update(delta_time)
         
         # Handle warning sounds
-        if self.game_manager.event_system.is_warning:
+        if snapshot.is_warning:
             self.sound_manager.play_warning()
         else:
             self.sound_manager.reset_warning()
         
     def check_optimal_conditions(self):
         """Check if environmental conditions are optimal for coral health regeneration."""
-        temp_optimal = abs(self.sliders["temperature"].value - config.TEMP_OPTIMAL) < config.HEALTH_REGEN_THRESHOLDS["temperature"]
-        ph_optimal = abs(self.sliders["ph"].value - config.PH_OPTIMAL) < config.HEALTH_REGEN_THRESHOLDS["ph"]
-        salinity_optimal = abs(self.sliders["salinity"].value - config.SALINITY_OPTIMAL) < config.HEALTH_REGEN_THRESHOLDS["salinity"]
+        health_system = self.game_manager.health_system
+        temp_optimal = abs(health_system.temperature - config.TEMP_OPTIMAL) < config.HEALTH_REGEN_THRESHOLDS["temperature"]
+        ph_optimal = abs(health_system.ph - config.PH_OPTIMAL) < config.HEALTH_REGEN_THRESHOLDS["ph"]
+        salinity_optimal = abs(health_system.salinity - config.SALINITY_OPTIMAL) < config.HEALTH_REGEN_THRESHOLDS["salinity"]
         
         return all([temp_optimal, ph_optimal, salinity_optimal])
         
@@ -231,19 +373,18 @@ class GameScreen:
         
         return base_regen_rate * health_factor * delta_time
         
-    def calculate_optimal_time(self):
-        # Check if all values are within optimal ranges
-        temp_optimal = abs(self.sliders["temperature"].value - config.TEMP_OPTIMAL) < 1
-        ph_optimal = abs(self.sliders["ph"].value - config.PH_OPTIMAL) < 0.2
-        salinity_optimal = abs(self.sliders["salinity"].value - config.SALINITY_OPTIMAL) < 1
+    def check_balanced_conditions(self):
+        """Check the ranges the Perfect Balance achievement counts as optimal."""
+        health_system = self.game_manager.health_system
+        temp_optimal = abs(health_system.temperature - config.TEMP_OPTIMAL) < 1
+        ph_optimal = abs(health_system.ph - config.PH_OPTIMAL) < 0.2
+        salinity_optimal = abs(health_system.salinity - config.SALINITY_OPTIMAL) < 1
         
-        if all([temp_optimal, ph_optimal, salinity_optimal]):
-            return self.game_manager.time_elapsed
-        return 0
+        return temp_optimal and ph_optimal and salinity_optimal
         
     def check_recovery(self):
         health = self.game_manager.health_system.current_health
-        return health > 70 and getattr(self, "_was_critical", False)
+        return health > 70 and self._was_critical
         
     def draw(self):
         # Clear the screen first
@@ -257,11 +398,15 @@ class GameScreen:
             coral.draw(self.screen)
         
         # Draw fish schools
+        if self.fish_flock:
+            self.fish_flock.draw(self.screen)
         for school in self.fish_schools:
             school.draw(self.screen)
         
+        snapshot = self.snapshot
+        
         # Draw health bar
-        health = self.game_manager.health_system.current_health
+        health = snapshot.health
         health_bar_bg = pygame.Rect(50, 50, 300, 30)
         pygame.draw.rect(self.screen, (100, 0, 0), health_bar_bg)
         health_rect = pygame.Rect(50, 50, health * 3, 30)
@@ -270,55 +415,66 @@ class GameScreen:
         
         # Draw health text
         health_text = f"{int(health)}/100 ({int(health)}%)"
-        health_value = self.font.render(health_text, True, config.WHITE)
+        health_value = self.text_cache.render(self.font, health_text, config.WHITE)
         text_rect = health_value.get_rect(midleft=(health_bar_bg.right + 10, health_bar_bg.centery))
         self.screen.blit(health_value, text_rect)
         
         # Draw sliders
         for name, slider in self.sliders.items():
             slider.draw(self.screen)
-            label = pygame.font.SysFont('arial', 24).render(f"{name}: {slider.value:.1f}", True, config.WHITE)
+            label = self.text_cache.render(self.label_font, f"{name}: {slider.value:.1f}", config.WHITE)
             self.screen.blit(label, (slider.rect.x, slider.rect.y - 30))
         
         # Draw events and warnings
         y = 100
-        warning = self.game_manager.event_system.get_warning_message()
+        warning = snapshot.warning_message
         if warning:
-            warning_text = self.font.render(warning, True, (255, 255, 0))
+            warning_text = self.text_cache.render(self.font, warning, (255, 255, 0))
             warning_rect = warning_text.get_rect(center=(config.SCREEN_WIDTH/2, y))
             self.screen.blit(warning_text, warning_rect)
             y += 40
         
         # Draw active events
-        for event in self.game_manager.event_system.active_events:
-            text = self.font.render(event.description, True, config.WHITE)
+        for event in snapshot.active_events:
+            text = self.text_cache.render(self.font, event.description, config.WHITE)
             self.screen.blit(text, (50, y))
             y += 40
         
         # Draw current fact
-        fact = self.facts_manager.get_current_fact()
-        if fact:
-            fact_text = self.font.render(fact, True, config.WHITE)
-            fact_rect = fact_text.get_rect(center=(config.SCREEN_WIDTH/2, config.SCREEN_HEIGHT - 50))
-            self.screen.blit(fact_text, fact_rect)
+        if self.fact_surface:
+            fact_rect = self.fact_surface.get_rect(midbottom=(config.SCREEN_WIDTH/2, config.SCREEN_HEIGHT - 20))
+            self.screen.blit(self.fact_surface, fact_rect)
         
         # Draw round information
-        round_info = self.game_manager.get_round_info()
-        round_text = f"Round {round_info['current_round']}/{round_info['total_rounds']}"
-        time_text = f"Time: {int(round_info['time_remaining'])}s"
-        score_text = f"Score: {round_info['score']}"
-        
-        self.screen.blit(self.font.render(round_text, True, config.WHITE), (10, 10))
-        self.screen.blit(self.font.render(time_text, True, config.WHITE), (config.SCREEN_WIDTH - 150, 10))
-        self.screen.blit(self.font.render(score_text, True, config.WHITE), (config.SCREEN_WIDTH//2 - 50, 10))
+        round_text = f"Round {snapshot.current_round}/{snapshot.total_rounds}"
+        time_text = f"Time: {int(snapshot.time_remaining)}s"
+        if snapshot.year is not None:
+            time_text = f"Year {int(snapshot.year)}"
+        score_text = f"Score: {snapshot.score}"
+        
+        self.screen.blit(self.text_cache.render(self.font, round_text, config.WHITE), (10, 10))
+        self.screen.blit(self.text_cache.render(self.font, time_text, config.WHITE), (config.SCREEN_WIDTH - 150, 10))
+        self.screen.blit(self.text_cache.render(self.font, score_text, config.WHITE), (config.SCREEN_WIDTH//2 - 50, 10))
+        if snapshot.time_warp > 1:
+            self.draw_time_warp(snapshot.time_warp, snapshot.achieved_warp)
         
         # Draw particles
         self.particle_system.draw()
         
+        # Draw achievement notifications
+        self.achievement_manager.draw()
+        
         # Draw tutorial overlay last
         if self.tutorial.active:
             self.tutorial.draw()
         
+    def draw_time_warp(self, requested, achieved):
+        """Draw the requested warp and, in brackets, the warp the sim keeps up."""
+        # Yellow when the frame budget holds the sim back
+        color = config.WHITE if achieved >= requested * 0.9 else (255, 255, 0)
+        warp_text = self.text_cache.render(self.font, f"Warp x{requested} ({achieved:.1f})", color)
+        self.screen.blit(warp_text, warp_text.get_rect(topright=(config.SCREEN_WIDTH - 170, 10)))
+        
     def draw_regen_timer(self, progress):
         """Draw a circular progress indicator for regeneration timer."""
         center_x = config.SCREEN_WIDTH - 50
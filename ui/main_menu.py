@@ -1,12 +1,14 @@
 import pygame
 import config
-import sys
-from core.game_manager import GameManager
 
 class MainMenu:
     def __init__(self, screen):
         self.screen = screen
         self.font = pygame.font.Font(None, 48)
+        self.small_font = pygame.font.Font(None, 28)
+        
+        # Fraction of the game screen built so far; None once loaded
+        self.loading_progress = None
         
         # Create start button
         button_width = 200
@@ -17,19 +19,31 @@ class MainMenu:
             button_width,
             button_height
         )
+        # Decades mode, below the loading bar
+        self.decades_button = pygame.Rect(
+            self.start_button.x,
+            self.start_button.bottom + 70,
+            button_width,
+            button_height
+        )
         
         self.button_color = (100, 100, 100)
         self.hover_color = (150, 150, 150)
         self.hover = False
+        self.decades_hover = False
         
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.start_button.collidepoint(event.pos):
                 return "start"
+            if self.decades_button.collidepoint(event.pos):
+                return "start_decades"
         return None
         
     def update(self):
-        self.hover = self.start_button.collidepoint(pygame.mouse.get_pos())
+        mouse_pos = pygame.mouse.get_pos()
+        self.hover = self.start_button.collidepoint(mouse_pos)
+        self.decades_hover = self.decades_button.collidepoint(mouse_pos)
         
     def draw(self):
         self.screen.fill(config.OCEAN_BLUE)
@@ -45,4 +59,24 @@ class MainMenu:
                         self.start_button)
         start_text = self.font.render("Start", True, config.WHITE)
         text_rect = start_text.get_rect(center=self.start_button.center)
-        self.screen.blit(start_text, text_rect) 
\ No newline at end of file
+        self.screen.blit(start_text, text_rect)
+        
+        # Draw decades button
+        pygame.draw.rect(self.screen,
+                        self.hover_color if self.decades_hover else self.button_color,
+                        self.decades_button)
+        decades_text = self.font.render("Decades", True, config.WHITE)
+        self.screen.blit(decades_text, decades_text.get_rect(center=self.decades_button.center))
+        
+        if self.loading_progress is not None:
+            self.draw_loading_bar(self.loading_progress)
+            
+    def draw_loading_bar(self, progress):
+        """Draw the loading indicator below the start button."""
+        bar = pygame.Rect(0, 0, self.start_button.width, 8)
+        bar.midtop = (self.start_button.centerx, self.start_button.bottom + 30)
+        pygame.draw.rect(self.screen, self.button_color, bar)
+        pygame.draw.rect(self.screen, config.WHITE, (bar.x, bar.y, int(bar.width * progress), bar.height))
+        
+        label = self.small_font.render(f"Loading reef... {int(progress * 100)}%", True, config.WHITE)
+        self.screen.blit(label, label.get_rect(midtop=(bar.centerx, bar.bottom + 8))) 
\ No newline at end of file
@@ -54,8 +54,7 @@ class RoundTransitionScreen:
             mouse_pos = event.pos
             
             if self.continue_button.collidepoint(mouse_pos):
-                self.game_manager.start_next_round()
-                return "playing"
+                return "continue"
                 
             elif self.pause_button.collidepoint(mouse_pos):
                 return "menu"
@@ -0,0 +1,91 @@
+"""
+Screen Loader Module
+
+Builds expensive screens incrementally on the main thread while the menu
+is already showing, so launch is not held up by sprites, animations and
+audio the player does not need yet.
+
+Features:
+- Ordered construction steps run within a per-frame time budget
+- Progress for a loading indicator
+- Synchronous completion when a screen is needed early
+- Per-step timing in the startup breakdown
+"""
+
+import collections
+import time
+import config
+from utils.logger import logger
+from utils.startup_timer import startup_timer
+
+class ScreenLoader:
+    """
+    Queue of named construction steps.
+
+    Steps touch pygame surfaces, which must be created on the main thread,
+    so instead of a background thread the loop calls run() once per frame.
+
+    Args:
+        frame_budget (float): Seconds of loading work per run() call
+    """
+
+    def __init__(self, frame_budget=None):
+        self.frame_budget = config.LOADING_FRAME_BUDGET if frame_budget is None else frame_budget
+        self.steps = collections.deque()
+        self.total = 0
+        self.completed = 0
+
+    def add(self, name, step):
+        """Queue step() to run under the startup phase name."""
+        self.steps.append((name, step))
+        self.total += 1
+
+    @property
+    def done(self):
+        return not self.steps
+
+    @property
+    def progress(self):
+        """Fraction of steps completed, 0.0 to 1.0."""
+        return self.completed / self.total if self.total else 1.0
+
+    def run(self):
+        """
+        Run steps until the frame budget is spent. At least one step runs
+        per call, so a step longer than the budget still makes progress.
+
+        Returns:
+            bool: True if this call completed the last step
+        """
+        if not self.steps:
+            return False
+        deadline = time.perf_counter() + self.frame_budget
+        while self.steps:
+            self._run_step()
+            if time.perf_counter() >= deadline:
+                break
+        return not self.steps
+
+    def finish(self):
+        """
+        Run all remaining steps now.
+
+        Returns:
+            bool: True if any steps were left to run
+        """
+        if not self.steps:
+            return False
+        logger.debug(f"Finishing {len(self.steps)} loading steps synchronously")
+        while self.steps:
+            self._run_step()
+        return True
+
+    def _run_step(self):
+        name, step = self.steps.popleft()
+        try:
+            with startup_timer.measure(name):
+                step()
+        except Exception as e:
+            logger.error(f"Error while loading {name}: {str(e)}", exc_info=True)
+            raise
+        self.completed += 1
@@ -1,5 +1,6 @@
 import pygame
 import config
+from utils.metrics import count_surfaces
 
 class TutorialOverlay:
     def __init__(self, screen):
@@ -30,6 +31,7 @@ class TutorialOverlay:
             
         # Draw semi-transparent overlay
         overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        count_surfaces(overlay)
         overlay.fill((0, 0, 0))
         overlay.set_alpha(128)
         self.screen.blit(overlay, (0, 0))
@@ -0,0 +1,170 @@
+"""
+Frame Governor Module
+
+Decides how fast the main loop should run based on the current game state
+and window focus, so static screens and background windows stop burning a
+full core redrawing the same frame.
+
+Features:
+- Per game state frame-rate policy (see config.STATE_FPS)
+- Blocking on pygame.event.wait for screens where nothing animates
+- Low idle frame rate while the window is unfocused or minimized
+- Full frame rate restored immediately on player input
+- Measured CPU-use reporting per reporting interval
+"""
+
+import time
+import pygame
+import config
+from utils.logger import logger
+
+# Events that count as player input and restore the full frame rate
+INPUT_EVENTS = (
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+)
+
+
+class FrameGovernor:
+    """
+    Frame-rate policy for the main loop.
+
+    The governor owns event polling and clock ticking. For states mapped to
+    None in config.STATE_FPS it blocks on pygame.event.wait until input
+    arrives (or config.IDLE_WAKE_INTERVAL passes); for all other states it
+    ticks the clock at the state's rate, dropping to config.IDLE_FPS when
+    the window has lost focus or is minimized.
+
+    Attributes:
+        clock: The pygame clock used to cap the frame rate
+        focused (bool): Whether the window currently has input focus
+        minimized (bool): Whether the window is minimized or hidden
+        cpu_percent (float): Process CPU use over the last report interval
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.focused = True
+        self.minimized = False
+        self.last_input_time = time.perf_counter()
+        self.cpu_percent = 0.0
+
+        # CPU accounting for the current report interval
+        self._report_wall_start = time.perf_counter()
+        self._report_cpu_start = time.process_time()
+        self._report_frames = 0
+        self._session_wall_start = self._report_wall_start
+        self._session_cpu_start = self._report_cpu_start
+
+    def get_target_fps(self, game_state):
+        """
+        Get the frame-rate cap for a game state.
+
+        Args:
+            game_state (str): Current game state
+
+        Returns:
+            int or None: Frames per second, or None to block on input
+        """
+        # Recent input always gets the full rate so interaction feels instant
+        if time.perf_counter() - self.last_input_time < config.INPUT_GRACE_PERIOD:
+            return config.FPS
+
+        fps = config.STATE_FPS.get(game_state, config.FPS)
+        if fps is None:
+            return None
+        if self.minimized or not self.focused:
+            return min(fps, config.IDLE_FPS)
+        return fps
+
+    def get_events(self, game_state):
+        """
+        Collect pending events, blocking first if the state is idle.
+
+        Args:
+            game_state (str): Current game state
+
+        Returns:
+            list: Pygame events to process this frame
+        """
+        events = []
+        if self.get_target_fps(game_state) is None:
+            timeout = int(config.IDLE_WAKE_INTERVAL * 1000)
+            event = pygame.event.wait(timeout)
+            # Time spent blocked is not game time; restart the frame clock so
+            # input that starts play does not hand the game a second of delta
+            self.clock.tick()
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+        events.extend(pygame.event.get())
+
+        for event in events:
+            self._track_event(event)
+        return events
+
+    def tick(self, game_state):
+        """
+        Advance the clock according to the policy for the game state.
+
+        Args:
+            game_state (str): Current game state
+
+        Returns:
+            float: Seconds elapsed since the previous frame
+        """
+        fps = self.get_target_fps(game_state)
+        if fps is None:
+            # The clock restarted when the wait in get_events returned
+            delta_time = self.clock.tick() / 1000.0
+        else:
+            delta_time = self.clock.tick(fps) / 1000.0
+
+        self._report_frames += 1
+        self._maybe_report(game_state, fps)
+        return delta_time
+
+    def should_draw(self):
+        """Return False when nothing drawn would be visible."""
+        return not self.minimized
+
+    def _track_event(self, event):
+        if event.type in INPUT_EVENTS:
+            self.last_input_time = time.perf_counter()
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+            self.last_input_time = time.perf_counter()
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            self.minimized = False
+
+    def _maybe_report(self, game_state, fps):
+        now = time.perf_counter()
+        wall = now - self._report_wall_start
+        if wall < config.CPU_REPORT_INTERVAL:
+            return
+
+        cpu = time.process_time() - self._report_cpu_start
+        self.cpu_percent = 100.0 * cpu / wall
+        logger.info(
+            f"Frame governor: state={game_state} "
+            f"target_fps={fps if fps is not None else 'blocking'} "
+            f"actual_fps={self._report_frames / wall:.1f} "
+            f"cpu={self.cpu_percent:.1f}%"
+        )
+        self._report_wall_start = now
+        self._report_cpu_start = time.process_time()
+        self._report_frames = 0
+
+    def get_session_cpu_percent(self):
+        """Return average process CPU use since the governor was created."""
+        wall = time.perf_counter() - self._session_wall_start
+        if wall <= 0:
+            return 0.0
+        return 100.0 * (time.process_time() - self._session_cpu_start) / wall
@@ -0,0 +1,176 @@
+"""
+Import Audit Module
+
+Measures the cold-import cost of the game's entry module with
+`python -X importtime` and checks it against a budget, so modules that
+are not needed for the first frame stay off the startup path.
+
+The budget is relative: a fraction (config.IMPORT_BUDGET_RATIO) of the
+cold import of a fixed set of stdlib modules (config.IMPORT_REFERENCE),
+measured in the same run. Both are bytecode loaded and executed by the
+same interpreter, so the check holds across machines of any speed.
+
+Features:
+- Fresh interpreter per run, median over several runs
+- Split of first-party time from stdlib and third-party time; only
+  first-party time counts against the budget
+- Budget scaled to the machine by a stdlib reference import
+- Slowest first-party modules by self and cumulative time
+- Check that modules deferred past the first frame (config.IMPORT_DEFERRED)
+  are not imported at startup
+- Nonzero exit status when over budget, for use as a CI gate
+
+Usage:
+    python -m utils.import_audit [--module main] [--runs 5] [--budget-ratio R] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import config
+
+# Top-level names of the game's own modules and packages
+FIRST_PARTY = ("main", "config", "core", "ui", "visuals", "audio", "utils")
+
+def is_first_party(module):
+    return module.split(".", 1)[0] in FIRST_PARTY
+
+def parse_importtime(text):
+    """
+    Parse `-X importtime` output.
+
+    Args:
+        text (str): stderr of the measured interpreter
+
+    Returns:
+        dict: Module name to (self microseconds, cumulative microseconds)
+    """
+    timings = {}
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Column header
+        timings[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return timings
+
+def measure(module, runs):
+    """
+    Import module in fresh interpreters and collect per-module timings.
+
+    Args:
+        module (str): Module to import
+        runs (int): Number of interpreters to start
+
+    Returns:
+        list: One parse_importtime() dict per run
+    """
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    results = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=config.PACKAGE_DIR, env=env, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+        results.append(parse_importtime(completed.stderr))
+    return results
+
+def total_ms(results):
+    """Median over runs of the summed self time of every module imported."""
+    return statistics.median(sum(timing[0] for timing in run.values()) for run in results) / 1000.0
+
+def summarize(module, results, reference_results, budget_ratio, top=10):
+    """
+    Reduce per-run timings to medians and check them against the budget:
+    budget_ratio times the median cold import of the reference modules.
+
+    Returns:
+        dict: Report, with "passed" False when over budget or when a
+            deferred module was imported
+    """
+    def median_ms(values):
+        return statistics.median(values) / 1000.0
+
+    modules = set().union(*results)
+    self_ms = {name: median_ms([run.get(name, (0, 0))[0] for run in results]) for name in modules}
+    cumulative_ms = {name: median_ms([run.get(name, (0, 0))[1] for run in results]) for name in modules}
+
+    first_party = sorted(name for name in modules if is_first_party(name))
+    first_party_ms = sum(self_ms[name] for name in first_party)
+    module_ms = total_ms(results)
+    reference_ms = total_ms(reference_results)
+    budget_ms = budget_ratio * reference_ms
+    deferred = sorted(name for name in config.IMPORT_DEFERRED if name in modules)
+
+    return {
+        "module": module,
+        "runs": len(results),
+        "total_ms": round(module_ms, 1),
+        "first_party_ms": round(first_party_ms, 1),
+        "third_party_ms": round(module_ms - first_party_ms, 1),
+        "reference_ms": round(reference_ms, 1),
+        "budget_ratio": budget_ratio,
+        "budget_ms": round(budget_ms, 1),
+        "slowest_self": [
+            (name, round(self_ms[name], 2))
+            for name in sorted(first_party, key=self_ms.get, reverse=True)[:top]
+        ],
+        "slowest_cumulative": [
+            (name, round(cumulative_ms[name], 2))
+            for name in sorted(first_party, key=cumulative_ms.get, reverse=True)[:top]
+        ],
+        "deferred_imported": deferred,
+        "passed": first_party_ms <= budget_ms and not deferred
+    }
+
+def format_report(report):
+    lines = [
+        f"Cold import of {report['module']} (median of {report['runs']} runs)",
+        f"  total:                  {report['total_ms']:.1f} ms",
+        f"  stdlib and third-party: {report['third_party_ms']:.1f} ms",
+        f"  first-party:            {report['first_party_ms']:.1f} ms (budget {report['budget_ms']:.1f} ms, "
+        f"{report['budget_ratio']:g}x the {report['reference_ms']:.1f} ms stdlib reference)",
+        "",
+        "Slowest first-party modules (self):"
+    ]
+    lines.extend(f"  {ms:7.2f} ms  {name}" for name, ms in report["slowest_self"])
+    lines.append("")
+    lines.append("Slowest first-party modules (cumulative):")
+    lines.extend(f"  {ms:7.2f} ms  {name}" for name, ms in report["slowest_cumulative"])
+    if report["deferred_imported"]:
+        lines.append("")
+        lines.append("Imported at startup but should be deferred:")
+        lines.extend(f"  {name}" for name in report["deferred_imported"])
+    lines.append("")
+    lines.append("PASS" if report["passed"] else "FAIL")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit cold-import time of the game against a budget.")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure (default: 5)")
+    parser.add_argument("--budget-ratio", type=float, default=config.IMPORT_BUDGET_RATIO,
+                        help="First-party import budget as a fraction of the reference import "
+                             "(default: config.IMPORT_BUDGET_RATIO)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    # Alternate module and reference runs, so load that comes and goes
+    # during the audit weighs on both sides of the budget alike
+    results, reference_results = [], []
+    for _ in range(args.runs):
+        results += measure(args.module, 1)
+        reference_results += measure(", ".join(config.IMPORT_REFERENCE), 1)
+    report = summarize(args.module, results, reference_results, args.budget_ratio)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 0 if report["passed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
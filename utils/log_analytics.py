@@ -0,0 +1,379 @@
+"""
+Log Analytics Module
+
+Command-line analysis of coral_reef_simulator_YYYYMMDD.log session files
+written by utils.logger. Answers questions such as how long sessions are,
+how often players reach game over and what rounds score, without grep.
+
+Features:
+- Streams gzip-compressed rotated files, memory-maps plain ones
+- Text and JSON-lines log formats
+- Precompiled marker fast path: lines that cannot matter are skipped
+  without being parsed
+- Session reconstruction from startup, start_game, handle_round_end,
+  game over and shutdown messages
+- Constant memory per file (running aggregates, no per-record state)
+- Files analysed in parallel worker processes
+
+Usage:
+    python -m utils.log_analytics [paths ...] [--jobs N]
+
+Paths may be files or directories; directories are searched for *.log,
+rotated *.log.N and *.log.N.gz files. Defaults to logs/.
+
+A session cut in two by log rotation is reported as one unterminated
+session; the records after the rotation belong to no session and are
+ignored.
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import mmap
+import os
+import re
+from datetime import datetime
+from multiprocessing import Pool
+
+# Fast path: only lines containing one of these markers are parsed further
+MARKERS = re.compile(
+    rb"Initializing Coral Reef Simulator|Starting new game|Round \d+ completed"
+    rb"|Game completed!|Game over with score|Game shutting down| - ERROR - |\"level\": \"ERROR\""
+)
+
+# Text format: asctime - name - levelname - location - message
+TEXT_RECORD = re.compile(
+    r"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),\d{3} - \S+ - (\w+) - \S+ - (.*)$"
+)
+ROUND_COMPLETED = re.compile(r"^Round (\d+) completed\.(?: Round score: (\d+),)?")
+FINAL_SCORE = re.compile(r"score: (\d+)")
+# Rotated file: the live log's path, then .N and optionally .gz
+ROTATED_LOG = re.compile(r"^(.*\.log)\.(\d+)(?:\.gz)?$")
+
+class StreamingStats:
+    """
+    Running count/sum/min/max plus a quantized histogram for percentiles.
+
+    Memory is bounded by the value range divided by the resolution, not by
+    the number of observations.
+
+    Args:
+        resolution (float): Histogram bucket width
+    """
+
+    def __init__(self, resolution=1.0):
+        self.resolution = resolution
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        key = int(value / self.resolution)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        for attr, pick in (("min", min), ("max", max)):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            if theirs is not None:
+                setattr(self, attr, theirs if mine is None else pick(mine, theirs))
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= target:
+                return key * self.resolution
+        return self.max
+
+class LogSummary:
+    """Aggregates for one or more log files; mergeable across workers."""
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.lines = 0
+        self.errors = 0
+        self.sessions = 0
+        self.clean_shutdowns = 0
+        self.session_seconds = StreamingStats(1.0)
+        self.games_started = 0
+        self.games_completed = 0
+        self.game_overs = 0
+        self.games_abandoned = 0
+        self.rounds_completed = 0
+        self.round_scores = StreamingStats(1.0)
+        self.final_scores = StreamingStats(1.0)
+        self.days = {}  # date -> [sessions, games, game overs]
+
+    def merge(self, other):
+        for attr in ("files", "bytes", "lines", "errors", "sessions", "clean_shutdowns",
+                     "games_started", "games_completed", "game_overs",
+                     "games_abandoned", "rounds_completed"):
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+        self.session_seconds.merge(other.session_seconds)
+        self.round_scores.merge(other.round_scores)
+        self.final_scores.merge(other.final_scores)
+        for day, counts in other.days.items():
+            mine = self.days.setdefault(day, [0, 0, 0])
+            for i, count in enumerate(counts):
+                mine[i] += count
+
+class SessionTracker:
+    """Rebuilds sessions and games from a time-ordered record stream."""
+
+    def __init__(self, summary):
+        self.summary = summary
+        self.session_start = None
+        self.last_time = None
+        self.game_active = False
+
+    def _day(self, timestamp):
+        return self.summary.days.setdefault(timestamp.date().isoformat(), [0, 0, 0])
+
+    def _end_game(self):
+        if self.game_active:
+            self.summary.games_abandoned += 1
+            self.game_active = False
+
+    def _end_session(self, end_time, clean):
+        self._end_game()
+        if self.session_start is not None:
+            self.summary.session_seconds.add((end_time - self.session_start).total_seconds())
+            if clean:
+                self.summary.clean_shutdowns += 1
+        self.session_start = None
+
+    def handle(self, timestamp, level, message):
+        summary = self.summary
+        self.last_time = timestamp
+        if level == "ERROR":
+            summary.errors += 1
+
+        if message.startswith("Initializing Coral Reef Simulator"):
+            if self.session_start is not None:
+                self._end_session(timestamp, clean=False)
+            self.session_start = timestamp
+            summary.sessions += 1
+            self._day(timestamp)[0] += 1
+        elif self.session_start is None:
+            return  # Records orphaned by rotation or a truncated file
+        elif message.startswith("Starting new game"):
+            self._end_game()
+            self.game_active = True
+            summary.games_started += 1
+            self._day(timestamp)[1] += 1
+        elif message.startswith("Round "):
+            match = ROUND_COMPLETED.match(message)
+            if match:
+                summary.rounds_completed += 1
+                if match.group(2) is not None:
+                    summary.round_scores.add(int(match.group(2)))
+        elif message.startswith("Game completed!") or message.startswith("Reef health depleted"):
+            match = FINAL_SCORE.search(message)
+            if match:
+                summary.final_scores.add(int(match.group(1)))
+            if message.startswith("Game completed!"):
+                summary.games_completed += 1
+            else:
+                summary.game_overs += 1
+                self._day(timestamp)[2] += 1
+            self.game_active = False
+        elif message.startswith("Game shutting down"):
+            self._end_session(timestamp, clean=True)
+
+    def finish(self):
+        if self.session_start is not None:
+            self._end_session(self.last_time, clean=False)
+
+def _parse_time(text):
+    # Fixed-width slicing is several times faster than strptime
+    return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                    int(text[11:13]), int(text[14:16]), int(text[17:19]))
+
+def _parse_line(line):
+    """Return (timestamp, level, message) or None for unparseable lines."""
+    text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+    if text.startswith("{"):
+        try:
+            entry = json.loads(text)
+            return _parse_time(entry["time"]), entry["level"], entry["message"]
+        except (ValueError, KeyError):
+            return None
+    match = TEXT_RECORD.match(text)
+    if match is None:
+        return None
+    return _parse_time(match.group(1)), match.group(2), match.group(3)
+
+def _iter_lines(path):
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as f:
+            yield from f
+        return
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+def analyze_file(path):
+    """
+    Analyse one log file in a single streaming pass.
+
+    Args:
+        path (str): Plain or gzip-compressed log file
+
+    Returns:
+        LogSummary: Aggregates for the file
+    """
+    summary = LogSummary()
+    summary.files = 1
+    summary.bytes = os.path.getsize(path)
+    tracker = SessionTracker(summary)
+    search = MARKERS.search
+    last_line = None
+    lines = 0
+
+    for line in _iter_lines(path):
+        lines += 1
+        last_line = line
+        if search(line) is None:
+            continue
+        record = _parse_line(line)
+        if record is not None:
+            tracker.handle(*record)
+
+    # The final record dates an unterminated session
+    if last_line is not None and tracker.session_start is not None:
+        record = _parse_line(last_line)
+        if record is not None:
+            tracker.last_time = record[0]
+    tracker.finish()
+    summary.lines = lines
+    return summary
+
+def rotation_order(path):
+    """
+    Sort key for log files: per log, the highest (oldest) rotation number
+    first and the live .log last.
+    """
+    match = ROTATED_LOG.match(path)
+    if not match:
+        return (path, 0)
+    return (match.group(1), -int(match.group(2)))
+
+def find_log_files(paths):
+    """Expand directories into log files, oldest rotation first."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            matches = set(glob.glob(os.path.join(path, "*.log")))
+            matches.update(glob.glob(os.path.join(path, "*.log.*[0-9]")))
+            matches.update(glob.glob(os.path.join(path, "*.log.*[0-9].gz")))
+            files.extend(sorted(matches, key=rotation_order))
+        else:
+            files.append(path)
+    return files
+
+def analyze(paths, jobs=None):
+    """
+    Analyse log files in parallel and merge the results.
+
+    Args:
+        paths (list): Files or directories
+        jobs (int): Worker processes, defaults to the CPU count
+
+    Returns:
+        LogSummary: Aggregates for all files
+    """
+    files = find_log_files(paths)
+    total = LogSummary()
+    if not files:
+        return total
+    if jobs == 1 or len(files) == 1:
+        for path in files:
+            total.merge(analyze_file(path))
+        return total
+    with Pool(processes=jobs) as pool:
+        for summary in pool.imap_unordered(analyze_file, files):
+            total.merge(summary)
+    return total
+
+def _table(title, rows):
+    width = max(len(label) for label, _ in rows)
+    lines = [title, "-" * len(title)]
+    for label, value in rows:
+        lines.append(f"  {label.ljust(width)}  {value}")
+    return "\n".join(lines)
+
+def format_report(summary):
+    """Render a LogSummary as plain-text tables."""
+    durations = summary.session_seconds
+    games = summary.games_started
+    game_over_rate = 100.0 * summary.game_overs / games if games else 0.0
+    sections = [
+        _table("Input", [
+            ("Files", summary.files),
+            ("Lines", summary.lines),
+            ("Bytes", summary.bytes),
+            ("Errors logged", summary.errors),
+        ]),
+        _table("Sessions", [
+            ("Sessions", summary.sessions),
+            ("Clean shutdowns", summary.clean_shutdowns),
+            ("Mean length (s)", f"{durations.mean:.1f}"),
+            ("Median length (s)", f"{durations.percentile(0.5):.0f}"),
+            ("90th percentile (s)", f"{durations.percentile(0.9):.0f}"),
+            ("Longest (s)", f"{durations.max or 0:.0f}"),
+        ]),
+        _table("Games", [
+            ("Started", games),
+            ("Completed all rounds", summary.games_completed),
+            ("Game over", summary.game_overs),
+            ("Abandoned", summary.games_abandoned),
+            ("Game over rate", f"{game_over_rate:.1f}%"),
+            ("Mean final score", f"{summary.final_scores.mean:.1f}"),
+            ("Median final score", f"{summary.final_scores.percentile(0.5):.0f}"),
+        ]),
+        _table("Rounds", [
+            ("Completed", summary.rounds_completed),
+            ("Scored rounds", summary.round_scores.count),
+            ("Mean round score", f"{summary.round_scores.mean:.1f}"),
+            ("Median round score", f"{summary.round_scores.percentile(0.5):.0f}"),
+            ("10th percentile", f"{summary.round_scores.percentile(0.1):.0f}"),
+        ]),
+    ]
+    if summary.days:
+        rows = [(day, f"sessions={counts[0]} games={counts[1]} game_overs={counts[2]}")
+                for day, counts in sorted(summary.days.items())]
+        sections.append(_table("Per day", rows))
+    return "\n\n".join(sections)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise Coral Reef Simulator session logs.")
+    parser.add_argument("paths", nargs="*", default=["logs"],
+                        help="Log files or directories (default: logs)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    print(format_report(analyze(args.paths, args.jobs)))
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,29 @@ Features:
 - File and console output
 - Timestamp and context information
 - Color-coded console output
-- Rotation of log files
+- Rotation of log files, compressed in the background
 - Line numbers and function names in logs
+- Asynchronous output: the game thread only enqueues records, a listener
+  thread does all disk and console I/O
+- Optional JSON-lines structured format (config.LOG_FORMAT)
+- No filesystem access at import: the log file is opened on first use
+- Per-logger rate limiting for hot-path messages (config.LOG_RATE_LIMITS)
 """
 
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import traceback
 
+import config
+
 # ANSI color codes for console output
 COLORS = {
     'DEBUG': '\033[94m',    # Blue
@@ -31,72 +43,258 @@ COLORS = {
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter adding colors to log levels for console output."""
-    
+
     def format(self, record):
-        if record.levelname in COLORS:
-            record.levelname = f"{COLORS[record.levelname]}{record.levelname}{COLORS['ENDC']}"
-        return super().format(record)
+        # Records are shared between handlers, so restore the level name
+        # after formatting instead of leaking the color codes into the file
+        levelname = record.levelname
+        if levelname in COLORS:
+            record.levelname = f"{COLORS[levelname]}{levelname}{COLORS['ENDC']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
-def setup_logger(name='coral_reef_simulator'):
+class JsonFormatter(logging.Formatter):
+    """Formatter emitting one JSON object per line for structured logs."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "file": record.filename,
+            "line": record.lineno,
+            "func": record.funcName,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class RateLimitFilter(logging.Filter):
     """
-    Set up and configure the logger.
-    
+    Token-bucket rate limiter applied per logger and call site.
+
+    Limits are looked up by logger name, walking up the dotted hierarchy so
+    child loggers inherit their parent's limit. Suppressed records are
+    counted and the count is appended to the next record that passes.
+    CRITICAL records are never suppressed.
+
     Args:
-        name (str): Name of the logger instance
-        
-    Returns:
-        logging.Logger: Configured logger instance
+        limits (dict): Maps logger name to (records_per_second, burst)
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
+
+    def __init__(self, limits):
+        super().__init__()
+        self.limits = dict(limits)
+        self._resolved = {}
+        self._buckets = {}  # (name, pathname, lineno) -> [tokens, last_time, suppressed]
+
+    def _get_limit(self, name):
+        if name not in self._resolved:
+            limit = None
+            lookup = name
+            while lookup:
+                if lookup in self.limits:
+                    limit = self.limits[lookup]
+                    break
+                lookup = lookup.rpartition('.')[0]
+            self._resolved[name] = limit
+        return self._resolved[name]
+
+    def filter(self, record):
+        if record.levelno >= logging.CRITICAL:
+            return True
+        limit = self._get_limit(record.name)
+        if limit is None:
+            return True
+
+        rate, burst = limit
+        now = time.monotonic()
+        key = (record.name, record.pathname, record.lineno)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [burst, now, 0]
+        else:
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        if bucket[0] < 1:
+            bucket[2] += 1
+            return False
+
+        bucket[0] -= 1
+        if bucket[2]:
+            record.msg = f"{record.msg} ({bucket[2]} similar messages suppressed)"
+            bucket[2] = 0
+        return True
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that gzips rotated files on a background thread.
+
+    Rotated files are named <log>.N.gz. Only one compression runs at a time;
+    the next rollover waits for the previous one before shifting backups.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compress_thread = None
+
+    def rotation_filename(self, default_name):
+        return default_name + ".gz"
+
+    def doRollover(self):
+        if self._compress_thread is not None:
+            self._compress_thread.join()
+        super().doRollover()
+
+    def rotate(self, source, dest):
+        if not os.path.exists(source):
+            return
+        pending = dest[:-3] if dest.endswith(".gz") else dest + ".tmp"
+        os.replace(source, pending)
+        self._compress_thread = threading.Thread(
+            target=self._compress, args=(pending, dest),
+            name="log-compressor", daemon=False
+        )
+        self._compress_thread.start()
+
+    @staticmethod
+    def _compress(source, dest):
+        # Only needed after the first rotation, so kept off the startup path
+        import gzip
+        import shutil
+        try:
+            with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.remove(source)
+        except OSError as e:
+            sys.stderr.write(f"Could not compress rotated log {source}: {e}\n")
+
+# Listener thread draining the log queue, replaced on each setup_logger call
+_listener = None
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that starts the output listener on its first record.
+
+    Importing the logger therefore touches no files; the logs directory
+    and the log file are created when something is first logged.
+
+    Args:
+        log_queue (queue.SimpleQueue): Queue shared with the listener
+        start (callable): Creates and starts the listener
+    """
+
+    def __init__(self, log_queue, start):
+        super().__init__(log_queue)
+        self._start = start
+        self._started = False
+
+    def emit(self, record):
+        # Handler.handle holds the handler lock, so this runs once
+        if not self._started:
+            self._started = True
+            self._start()
+        super().emit(record)
+
+def _start_listener(name, log_queue):
+    """Create the file and console handlers and start the listener thread."""
     # Create logs directory if it doesn't exist
     if not os.path.exists('logs'):
         os.makedirs('logs')
-    
+
     # Create formatters with line numbers and function names
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d:%(funcName)s - %(message)s'
-    )
-    
+    if config.LOG_FORMAT == "json":
+        file_formatter = JsonFormatter()
+    else:
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d:%(funcName)s - %(message)s'
+        )
+
     console_formatter = ColoredFormatter(
         '%(levelname)s - %(filename)s:%(lineno)d:%(funcName)s - %(message)s'
     )
-    
+
     # File handler (with rotation)
     log_file = f'logs/{name}_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = RotatingFileHandler(
+    file_handler = CompressingRotatingFileHandler(
         log_file,
         maxBytes=5*1024*1024,  # 5MB
         backupCount=5
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(file_formatter)
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(console_formatter)
-    
+
+    global _listener
+    _stop_listener()
+    _listener = QueueListener(log_queue, file_handler, console_handler,
+                              respect_handler_level=True)
+    _listener.start()
+
+def setup_logger(name='coral_reef_simulator'):
+    """
+    Set up and configure the logger.
+
+    Records are put on an unbounded queue by a QueueHandler; a listener
+    thread writes them to the rotating file and the console, so logging
+    from the frame loop never blocks on I/O. The listener and log file
+    are only created once the first record is logged.
+
+    Args:
+        name (str): Name of the logger instance
+
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+
+    # Queue handler on the game thread, listener thread does the I/O
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue, lambda: _start_listener(name, log_queue))
+    queue_handler.addFilter(RateLimitFilter(config.LOG_RATE_LIMITS))
+
     # Remove any existing handlers
     logger.handlers = []
-    
+
     # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    logger.addHandler(queue_handler)
+
     return logger
 
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    _stop_listener()
+
+atexit.register(shutdown_logging)
+
 # Create a default logger instance
 logger = setup_logger()
 
 def log_exception(e, context=""):
     """
     Log an exception with full traceback.
-    
+
     Args:
         e (Exception): The exception to log
         context (str): Additional context information
     """
     error_msg = f"{context} - {str(e)}\n{traceback.format_exc()}"
-    logger.error(error_msg) 
\ No newline at end of file
+    # Attribute the record to the caller so rate limits apply per call site
+    logger.error(error_msg, stacklevel=2)
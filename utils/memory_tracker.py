@@ -0,0 +1,257 @@
+"""
+Memory Tracker Module
+
+tracemalloc-based allocation tracking, for finding what allocates per
+frame and what grows over a long session.
+
+Every frame:
+- Traced Python memory in use
+- Transient memory: the peak within the frame above its start and end,
+  i.e. memory allocated and released again during the frame
+- Pixel bytes of the Surfaces created (SURFACE_BYTES; pixel memory is
+  allocated by SDL, where tracemalloc cannot see it)
+
+Every snapshot interval, a tracemalloc snapshot with:
+- Live memory per subsystem: the game module nearest the allocation on
+  the call stack, e.g. visuals.particle_system
+- Growth per subsystem and per allocation site since the baseline
+  snapshot, the first one unless mark_baseline() was called later
+
+Snapshots leave out the tracker's own bookkeeping (and that of any
+excluded files, e.g. a test driver's), so their totals, live_bytes, are
+the memory to watch for growth; the raw traced total includes it.
+
+Tracing makes allocation several times slower, so frame times measured
+with the tracker running are not representative.
+"""
+
+import collections
+import os
+import statistics
+import time
+import tracemalloc
+
+import config
+from utils.logger import logger
+from utils.metrics import SURFACE_BYTES, SURFACE_ALLOCATIONS
+
+# Allocations made by tracemalloc, this tracker and the import system are not the game's
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+)
+
+# Subsystem for allocations with no game module on the recorded stack
+EXTERNAL = "(external)"
+
+class MemoryTracker:
+    """
+    Tracks allocations per frame and memory growth per subsystem.
+
+    Args:
+        trace_frames (int): Call stack depth recorded per allocation;
+            deeper finds the game module behind library allocations
+        snapshot_interval (int): Frames between snapshots, or 0 to only
+            take them on request
+        window (int): Recent frames kept for the per-frame percentiles
+        report_interval (float): Seconds between logged reports, or None
+            to only report on request
+        exclude (tuple): Further source files whose allocations are left
+            out of snapshots, e.g. the driver of a soak test
+    """
+
+    def __init__(self, trace_frames=None, snapshot_interval=None, window=None, report_interval=None, exclude=()):
+        self.trace_frames = trace_frames or config.MEMORY_TRACE_FRAMES
+        self.snapshot_interval = config.MEMORY_SNAPSHOT_INTERVAL if snapshot_interval is None else snapshot_interval
+        self.report_interval = report_interval
+        self.filters = SNAPSHOT_FILTERS + tuple(tracemalloc.Filter(False, path) for path in exclude)
+        window = window or config.MEMORY_WINDOW_FRAMES
+        self.transient = collections.deque(maxlen=window)
+        self.surface_bytes = collections.deque(maxlen=window)
+        self.surfaces = collections.deque(maxlen=window)
+        self.frames = 0
+        self.live_bytes = 0
+        self.subsystems = {}
+        self.sites = {}
+        self.baseline = None
+        self._module_names = {}
+        self._started_here = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_here = True
+        self._frame_start = tracemalloc.get_traced_memory()[0]
+        self._surface_bytes = SURFACE_BYTES.value
+        self._surface_count = SURFACE_ALLOCATIONS.value
+        self._last_report = time.monotonic()
+        tracemalloc.reset_peak()
+        logger.info(f"Memory tracking started, {self.trace_frames} frames per allocation traceback")
+
+    def stop(self):
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    @property
+    def current(self):
+        """Traced bytes in use, the tracker's own included."""
+        return tracemalloc.get_traced_memory()[0]
+
+    def frame(self):
+        """Record the frame that just ended; call once per frame."""
+        current, peak = tracemalloc.get_traced_memory()
+        self.transient.append(peak - max(self._frame_start, current))
+        self.surface_bytes.append(SURFACE_BYTES.value - self._surface_bytes)
+        self.surfaces.append(SURFACE_ALLOCATIONS.value - self._surface_count)
+        self._surface_bytes = SURFACE_BYTES.value
+        self._surface_count = SURFACE_ALLOCATIONS.value
+        self.frames += 1
+
+        if self.snapshot_interval and self.frames % self.snapshot_interval == 0:
+            self.snapshot()
+        if self.report_interval and time.monotonic() - self._last_report >= self.report_interval:
+            self._last_report = time.monotonic()
+            logger.info(format_report(self.report()))
+
+        # The snapshot and report allocate too; start the next frame after them
+        self._frame_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def _module_name(self, filename):
+        """Game module name of a source file, or None outside the game."""
+        name = self._module_names.get(filename, False)
+        if name is False:
+            name = None
+            path = os.path.abspath(filename)
+            if path.startswith(config.PACKAGE_DIR + os.sep) and path.endswith(".py") and path != os.path.abspath(__file__):
+                name = os.path.relpath(path, config.PACKAGE_DIR)[:-3].replace(os.sep, ".")
+            self._module_names[filename] = name
+        return name
+
+    def snapshot(self):
+        """Take a snapshot and group live memory by subsystem and allocation site."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.filters)
+        subsystems = {}
+        sites = {}
+        live_bytes = 0
+        for statistic in snapshot.statistics("traceback"):
+            live_bytes += statistic.size
+            subsystem = EXTERNAL
+            site = None
+            # Most recent call last; blame the innermost game frame
+            for frame in reversed(statistic.traceback):
+                module = self._module_name(frame.filename)
+                if module:
+                    subsystem = module
+                    site = f"{module}:{frame.lineno}"
+                    break
+            if site is None:
+                frame = statistic.traceback[-1]
+                site = f"{frame.filename}:{frame.lineno}"
+            size, count = subsystems.get(subsystem, (0, 0))
+            subsystems[subsystem] = (size + statistic.size, count + statistic.count)
+            size, count = sites.get(site, (0, 0))
+            sites[site] = (size + statistic.size, count + statistic.count)
+        self.subsystems = subsystems
+        self.sites = sites
+        self.live_bytes = live_bytes
+        if self.baseline is None:
+            self.mark_baseline()
+
+    def mark_baseline(self):
+        """Measure growth from the latest snapshot on, e.g. after a warm-up."""
+        if not self.subsystems:
+            self.snapshot()
+        self.baseline = {
+            "frame": self.frames,
+            "subsystems": {name: size for name, (size, count) in self.subsystems.items()},
+            "sites": {name: size for name, (size, count) in self.sites.items()}
+        }
+
+    def report(self, top=None):
+        """
+        Summarize the recent frames and the latest snapshot.
+
+        Returns:
+            dict: Per-frame transient and surface bytes, and live memory and
+                growth since the baseline by subsystem and site
+        """
+        top = top or config.MEMORY_TOP_SITES
+
+        def percentile(values, fraction):
+            if not values:
+                return 0
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+        baseline = self.baseline or {"frame": self.frames, "subsystems": {}, "sites": {}}
+        frames_since = max(1, self.frames - baseline["frame"])
+
+        def growth(current, before):
+            return sorted(
+                ((name, size - before.get(name, 0)) for name, (size, count) in current.items()),
+                key=lambda item: -item[1]
+            )
+
+        return {
+            "frames": self.frames,
+            "traced_bytes": self.current,
+            "live_bytes": self.live_bytes,
+            "frame": {
+                "transient_bytes_p50": percentile(self.transient, 0.5),
+                "transient_bytes_p99": percentile(self.transient, 0.99),
+                "surface_bytes_mean": statistics.fmean(self.surface_bytes) if self.surface_bytes else 0,
+                "surface_bytes_p99": percentile(self.surface_bytes, 0.99),
+                "surfaces_mean": statistics.fmean(self.surfaces) if self.surfaces else 0
+            },
+            "frames_since_baseline": frames_since,
+            "subsystems": [
+                {
+                    "name": name,
+                    "live_bytes": self.subsystems[name][0],
+                    "growth_bytes": size,
+                    "growth_bytes_per_frame": size / frames_since
+                }
+                for name, size in growth(self.subsystems, baseline["subsystems"])
+            ],
+            "top_sites": [
+                {"site": site, "live_bytes": size, "blocks": count}
+                for site, (size, count) in sorted(self.sites.items(), key=lambda item: -item[1][0])[:top]
+            ],
+            "growing_sites": [
+                {"site": site, "growth_bytes": size}
+                for site, size in growth(self.sites, baseline["sites"])[:top]
+                if size > 0
+            ]
+        }
+
+def format_report(report):
+    def kib(size):
+        return f"{size / 1024:,.1f} KiB"
+
+    frame = report["frame"]
+    lines = [
+        f"Memory after {report['frames']} frames: {kib(report['live_bytes'])} live at the last snapshot, "
+        f"{kib(report['traced_bytes'])} traced in all",
+        f"  per frame: transient p50 {kib(frame['transient_bytes_p50'])}, p99 {kib(frame['transient_bytes_p99'])}; "
+        f"surfaces {frame['surfaces_mean']:.1f} ({kib(frame['surface_bytes_mean'])} mean, "
+        f"{kib(frame['surface_bytes_p99'])} p99)",
+        f"  by subsystem, growth over the last {report['frames_since_baseline']} frames:"
+    ]
+    for subsystem in report["subsystems"][:config.MEMORY_TOP_SITES]:
+        lines.append(
+            f"    {subsystem['name']:<32} {kib(subsystem['live_bytes']):>14} live  "
+            f"{subsystem['growth_bytes'] / 1024:>+10.1f} KiB"
+        )
+    lines.append("  top allocation sites:")
+    for site in report["top_sites"]:
+        lines.append(f"    {site['site']:<48} {kib(site['live_bytes']):>14} in {site['blocks']} blocks")
+    if report["growing_sites"]:
+        lines.append("  growing sites:")
+        for site in report["growing_sites"]:
+            lines.append(f"    {site['site']:<48} {site['growth_bytes'] / 1024:>+10.1f} KiB")
+    return "\n".join(lines)
@@ -0,0 +1,248 @@
+"""
+Metrics Module
+
+Lightweight in-process metrics registry for a quantitative view of a session.
+Subsystems grab their metric objects once at import time and update them
+with plain attribute arithmetic, keeping each update well under a
+microsecond so recording can stay on in production.
+
+Features:
+- Counters, gauges and fixed-bucket histograms
+- Prometheus text exposition format
+- Periodic snapshot to a local file on a background thread
+- Optional localhost HTTP endpoint serving /metrics
+
+Updates are not locked. A concurrent increment may very rarely be lost,
+which is acceptable for monitoring data and keeps the hot path cheap.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+
+from utils.logger import logger
+
+# Default buckets in seconds, tuned around a 16.7 ms frame budget
+TIME_BUCKETS = (0.0005, 0.001, 0.002, 0.004, 0.008, 0.0167, 0.033, 0.05, 0.1, 0.25)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+class Counter:
+    """Monotonically increasing value."""
+
+    __slots__ = ("name", "description", "value")
+    kind = "counter"
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def render(self):
+        return [f"{self.name} {self.value}"]
+
+class Gauge:
+    """Value that can go up and down, such as a live object count."""
+
+    __slots__ = ("name", "description", "value")
+    kind = "gauge"
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def dec(self, amount=1):
+        self.value -= amount
+
+    def render(self):
+        return [f"{self.name} {self.value}"]
+
+class Histogram:
+    """
+    Distribution of observed values over fixed upper bounds.
+
+    Counts are stored per bucket and made cumulative only when rendered,
+    so observe() is a single bisect and three additions.
+    """
+
+    __slots__ = ("name", "description", "bounds", "counts", "sum", "count")
+    kind = "histogram"
+
+    def __init__(self, name, description, buckets=TIME_BUCKETS):
+        self.name = name
+        self.description = description
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Named collection of metrics.
+
+    The counter/gauge/histogram methods return the existing metric when the
+    name is already registered, so modules can declare the metrics they
+    update without coordinating.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, description, *args):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(name, description, *args)
+                    self._metrics[name] = metric
+        if not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name, description=""):
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name, description=""):
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(self, name, description="", buckets=TIME_BUCKETS):
+        return self._get_or_create(Histogram, name, description, buckets)
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """Return all metrics in Prometheus text exposition format."""
+        lines = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            if metric.description:
+                lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+class MetricsExporter:
+    """
+    Background exporter writing registry snapshots.
+
+    Args:
+        registry (MetricsRegistry): Registry to export
+        path (str): File the Prometheus text snapshot is written to
+        interval (float): Seconds between snapshots
+        http_port (int): Optional localhost port serving /metrics
+    """
+
+    def __init__(self, registry, path, interval, http_port=None):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.http_port = http_port
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        if self.http_port:
+            self._start_http_server()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.write_snapshot()
+
+    def write_snapshot(self):
+        """Write the current snapshot atomically so readers never see a partial file."""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(self.registry.render())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write metrics snapshot: {e}")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write_snapshot()
+
+    def _start_http_server(self):
+        # Imported here: http.server pulls in the email package, which
+        # would otherwise cost every startup a few milliseconds
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self.registry
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep scrapes out of the game log
+
+        try:
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.http_port), MetricsHandler)
+        except OSError as e:
+            logger.warning(f"Could not start metrics endpoint on port {self.http_port}: {e}")
+            return
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f"Serving metrics on http://127.0.0.1:{self.http_port}/metrics")
+
+# Create a default registry instance
+metrics = MetricsRegistry()
+
+# Shared by every draw path that creates a pygame Surface
+SURFACE_ALLOCATIONS = metrics.counter(
+    "surface_allocations_total", "pygame Surfaces created by update and draw code"
+)
+# Pixel memory is allocated by SDL, so tracemalloc does not see it
+SURFACE_BYTES = metrics.counter(
+    "surface_bytes_total", "Pixel bytes of the Surfaces counted in surface_allocations_total"
+)
+
+def count_surfaces(*surfaces):
+    """Count newly created Surfaces and their pixel memory."""
+    SURFACE_ALLOCATIONS.inc(len(surfaces))
+    SURFACE_BYTES.inc(sum(surface.get_pitch() * surface.get_height() for surface in surfaces))
@@ -0,0 +1,66 @@
+"""
+Object Pool Module
+
+Free lists for short-lived objects created at high frequency: particles,
+floating texts and bubbles. Finished objects are kept and reset for
+reuse instead of being dropped and allocated again, so busy frames do
+not churn the allocator or trigger the cyclic garbage collector.
+
+Features:
+- acquire() reuses a retired object, or creates one when none is free
+- sweep() removes finished objects from a live list in place, keeping
+  its order, and retires them to the free list
+- A capacity bounding the free list, so a burst does not pin its peak
+
+Classes kept in a pool (Particle, VisualEffect, Bubble) take the same
+arguments in reset() as in __init__, and call reset() from __init__ so
+the two cannot drift apart.
+"""
+
+import config
+
+class ObjectPool:
+    """
+    A free list of retired objects of one class.
+
+    Args:
+        factory (type): Class of the pooled objects
+        capacity (int): Most retired objects kept for reuse
+    """
+
+    def __init__(self, factory, capacity=None):
+        self.factory = factory
+        self.capacity = config.OBJECT_POOL_CAPACITY if capacity is None else capacity
+        self.free = []
+
+    def acquire(self, *args, **kwargs):
+        """A reset retired object, or a new one, built from the arguments."""
+        if self.free:
+            item = self.free.pop()
+            item.reset(*args, **kwargs)
+            return item
+        return self.factory(*args, **kwargs)
+
+    def release(self, item):
+        if len(self.free) < self.capacity:
+            self.free.append(item)
+
+    def sweep(self, items, finished):
+        """
+        Remove finished objects from a list in place and retire them.
+
+        Args:
+            items (list): Live objects; the survivors keep their order
+            finished (callable): Called once per object, e.g. its update,
+                and true when the object is done
+        """
+        free = self.free
+        kept = 0
+        for item in items:
+            if finished(item):
+                if len(free) < self.capacity:
+                    free.append(item)
+            else:
+                items[kept] = item
+                kept += 1
+        del items[kept:]
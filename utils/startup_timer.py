@@ -0,0 +1,83 @@
+"""
+Startup Timer Module
+
+Records how long each part of game startup takes, on the main thread and
+on background loaders, and formats a breakdown for the log.
+
+Features:
+- Context manager for timing named startup phases
+- Thread-aware records (main thread vs background workers)
+- Offsets relative to process start for time-to-first-frame reporting
+- Plain-text report for the log
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+class StartupPhase:
+    """One timed startup phase."""
+
+    def __init__(self, name, start, duration, thread_name):
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.thread_name = thread_name
+
+class StartupTimer:
+    """
+    Collects startup phases relative to a common origin.
+
+    Attributes:
+        origin (float): perf_counter value all offsets are relative to
+        phases (list): Recorded StartupPhase objects in completion order
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.marks = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, name):
+        """Time the enclosed block as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start)
+
+    def record(self, name, start, duration):
+        phase = StartupPhase(name, start - self.origin, duration, threading.current_thread().name)
+        with self._lock:
+            self.phases.append(phase)
+
+    def mark(self, name):
+        """Record a point in time, such as the first frame being shown."""
+        with self._lock:
+            self.marks[name] = time.perf_counter() - self.origin
+
+    def total(self, prefix):
+        """Sum the durations of phases whose name starts with prefix."""
+        with self._lock:
+            return sum(phase.duration for phase in self.phases if phase.name.startswith(prefix))
+
+    def report(self):
+        """Return the startup breakdown as text, slowest phases first."""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda phase: phase.duration, reverse=True)
+            marks = sorted(self.marks.items(), key=lambda item: item[1])
+        lines = ["Startup timing:"]
+        for name, offset in marks:
+            lines.append(f"  {name}: {offset * 1000:.1f} ms after start")
+        for phase in phases:
+            where = "" if phase.thread_name == "MainThread" else f" [{phase.thread_name}]"
+            lines.append(
+                f"  {phase.name}: {phase.duration * 1000:.1f} ms "
+                f"(at {phase.start * 1000:.1f} ms){where}"
+            )
+        return "\n".join(lines)
+
+# Create a default timer; its origin is the first import during startup
+startup_timer = StartupTimer()
@@ -18,17 +18,18 @@ import math
 import config
 import os
 from pygame import Color, Surface
-import colorsys
+from utils.metrics import count_surfaces
+from visuals.image_cache import image_cache
 
 class CoralAnimation:
-    def __init__(self, x, y):
+    def __init__(self, x, y, coral_type=None):
         self.x = x
         self.y = y
         self.sway_offset = random.random() * math.pi * 2
         self.sway_speed = 0.8
         self.time = 0
         self.size = random.randint(50, 80)
-        self.coral_type = random.choice(['branching', 'fan', 'brain'])
+        self.coral_type = coral_type or random.choice(['branching', 'fan', 'brain'])
         self.color_variation = random.uniform(-0.1, 0.1)
         
         # Load coral images
@@ -41,20 +42,17 @@ class CoralAnimation:
 
     def load_coral_images(self):
         images = []
-        coral_folder = os.path.join("assets", "images", "corals")
+        coral_folder = os.path.join(config.ASSETS_DIR, "images", "corals")
         try:
-            for filename in os.listdir(coral_folder):
-                if filename.endswith(('.png', '.svg')):
-                    image_path = os.path.join(coral_folder, filename)
-                    original_image = pygame.image.load(image_path).convert_alpha()
-                    
-                    # Scale image to match the desired size
-                    aspect_ratio = original_image.get_width() / original_image.get_height()
-                    new_height = self.size
-                    new_width = int(new_height * aspect_ratio)
-                    
-                    scaled_image = pygame.transform.scale(original_image, (new_width, new_height))
-                    images.append(scaled_image)
+            for image_path in image_cache.folder(coral_folder, ('.png', '.svg')):
+                original_image = image_cache.load(image_path)
+                
+                # Scale image to match the desired size
+                aspect_ratio = original_image.get_width() / original_image.get_height()
+                new_height = self.size
+                new_width = int(new_height * aspect_ratio)
+                
+                images.append(image_cache.scaled(image_path, (new_width, new_height)))
         except Exception as e:
             print(f"Warning: Could not load coral images: {e}")
         return images
@@ -157,16 +155,10 @@ class CoralAnimation:
         h = (h + self.color_variation * 20) % 360
         s = max(0, min(100, s + self.color_variation * 15))
         
-        # Convert HSV to RGB (note: pygame's hsva uses 0-100 for s,v while colorsys uses 0-1)
-        rgb = colorsys.hsv_to_rgb(h/360, s/100, v/100)
-        
-        # Scale RGB values to 0-255 range
-        r = int(rgb[0] * 255)
-        g = int(rgb[1] * 255)
-        b = int(rgb[2] * 255)
-        
-        # Create color with RGB values
-        return Color(r, g, b)
+        # Convert back to RGB through pygame's own HSV conversion
+        color = Color(0, 0, 0)
+        color.hsva = (h, s, v, 100)
+        return color
 
     def update(self, delta_time, health_value):
         """
@@ -185,6 +177,7 @@ class CoralAnimation:
         if self.current_image:
             # Apply color tint to the image based on health
             tinted_image = self.current_image.copy()
+            count_surfaces(tinted_image)
             tinted_image.fill(self.color, special_flags=pygame.BLEND_RGBA_MULT)
             
             # Calculate position with sway
@@ -262,10 +255,22 @@ class CoralAnimation:
             particle_alpha = random.randint(50, 150)
             
             particle_surface = pygame.Surface((int(particle_size*2), int(particle_size*2)), pygame.SRCALPHA)
+            count_surfaces(particle_surface)
             pygame.draw.circle(particle_surface, (*self.color[:3], particle_alpha), 
                              (particle_size, particle_size), particle_size)
             screen.blit(particle_surface, (particle_x, particle_y))
 
+class SchoolFish:
+    """One fish of a FishAnimation school, placed relative to the school."""
+
+    __slots__ = ("offset", "image", "scale", "vertical_offset")
+
+    def __init__(self, offset, image, scale, vertical_offset):
+        self.offset = offset
+        self.image = image
+        self.scale = scale
+        self.vertical_offset = vertical_offset
+
 class FishAnimation:
     def __init__(self, screen):
         self.screen = screen
@@ -285,12 +290,12 @@ class FishAnimation:
         # Create fish instances with random images and positions
         self.fishes = []
         for _ in range(self.fish_count):
-            self.fishes.append({
-                'offset': (random.uniform(-30, 30), random.uniform(-20, 20)),
-                'image': random.choice(self.fish_images),
-                'scale': random.uniform(0.8, 1.2),
-                'vertical_offset': random.uniform(-10, 10)
-            })
+            self.fishes.append(SchoolFish(
+                offset=(random.uniform(-30, 30), random.uniform(-20, 20)),
+                image=random.choice(self.fish_images),
+                scale=random.uniform(0.8, 1.2),
+                vertical_offset=random.uniform(-10, 10)
+            ))
 
     def reset_position(self):
         # Start position logic
@@ -304,18 +309,15 @@ class FishAnimation:
 
     def load_fish_images(self):
         images = []
-        fish_folder = os.path.join("assets", "images", "fish")
+        fish_folder = os.path.join(config.ASSETS_DIR, "images", "fish")
         reduced_size_by_percent = 0.1
         try:
-            for filename in os.listdir(fish_folder):
-                if filename.endswith(('.png', '.jpg')):
-                    image_path = os.path.join(fish_folder, filename)
-                    image = pygame.image.load(image_path).convert_alpha()
-                    # Scale image to 30% of original size
-                    new_width = int(image.get_width() * reduced_size_by_percent)
-                    new_height = int(image.get_height() * reduced_size_by_percent)
-                    image = pygame.transform.scale(image, (new_width, new_height))
-                    images.append(image)
+            for image_path in image_cache.folder(fish_folder, ('.png', '.jpg')):
+                image = image_cache.load(image_path)
+                # Scale image to 10% of original size
+                new_width = int(image.get_width() * reduced_size_by_percent)
+                new_height = int(image.get_height() * reduced_size_by_percent)
+                images.append(image_cache.scaled(image_path, (new_width, new_height)))
         except:
             print("Warning: Could not load fish images")
             # Create a default colored rectangle as fallback
@@ -376,22 +378,24 @@ class FishAnimation:
     def draw(self, screen):
         for fish in self.fishes:
             # Calculate fish position with smooth movement
-            fish_x = self.x + fish['offset'][0]
-            fish_y = self.y + fish['offset'][1] + \
-                    math.sin(self.x * 0.02 + fish['offset'][0] * 0.1) * 5 + \
-                    fish['vertical_offset']
+            fish_x = self.x + fish.offset[0]
+            fish_y = self.y + fish.offset[1] + \
+                    math.sin(self.x * 0.02 + fish.offset[0] * 0.1) * 5 + \
+                    fish.vertical_offset
             
             # Get the fish image and scale it
-            image = fish['image']
+            image = fish.image
             scaled_size = (
-                int(image.get_width() * fish['scale']),
-                int(image.get_height() * fish['scale'])
+                int(image.get_width() * fish.scale),
+                int(image.get_height() * fish.scale)
             )
             scaled_image = pygame.transform.scale(image, scaled_size)
+            count_surfaces(scaled_image)
             
             # Flip image based on direction
             if self.direction > 0:  # Moving right
                 scaled_image = pygame.transform.flip(scaled_image, True, False)
+                count_surfaces(scaled_image)
                 
             # Draw the fish with alpha blending for smoother appearance
             scaled_image.set_alpha(240)
@@ -2,23 +2,47 @@ import pygame
 import config
 from visuals.animations import CoralAnimation, FishAnimation
 import random
+from utils.metrics import count_surfaces
+from utils.object_pool import ObjectPool
+
+class Bubble:
+    __slots__ = ("x", "y", "size", "speed")
+
+    def __init__(self, x, y, size, speed):
+        self.reset(x, y, size, speed)
+
+    def reset(self, x, y, size, speed):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.speed = speed
+
+class WaterParticle:
+    __slots__ = ("x", "y", "speed", "alpha")
+
+    def __init__(self, x, y, speed, alpha):
+        self.x = x
+        self.y = y
+        self.speed = speed
+        self.alpha = alpha  # Transparency
 
 class BackgroundManager:
     def __init__(self, screen):
         self.screen = screen
         self.corals = []
         self.bubbles = []
+        self.bubble_pool = ObjectPool(Bubble)
         self.health_state = 100  # Initialize with full health
         
         # Add water current particles
         self.water_particles = []
         for _ in range(50):  # Create 50 water current particles
-            self.water_particles.append({
-                'x': random.randint(0, config.SCREEN_WIDTH),
-                'y': random.randint(0, config.SCREEN_HEIGHT),
-                'speed': random.uniform(10, 30),
-                'alpha': random.randint(20, 60)  # Transparency
-            })
+            self.water_particles.append(WaterParticle(
+                random.randint(0, config.SCREEN_WIDTH),
+                random.randint(0, config.SCREEN_HEIGHT),
+                random.uniform(10, 30),
+                random.randint(20, 60)
+            ))
         
         # Create background corals
         for _ in range(5):
@@ -48,10 +72,10 @@ class BackgroundManager:
         
         # Update water current particles
         for particle in self.water_particles:
-            particle['x'] += particle['speed'] * delta_time
-            if particle['x'] > config.SCREEN_WIDTH:
-                particle['x'] = -5
-                particle['y'] = random.randint(0, config.SCREEN_HEIGHT)
+            particle.x += particle.speed * delta_time
+            if particle.x > config.SCREEN_WIDTH:
+                particle.x = -5
+                particle.y = random.randint(0, config.SCREEN_HEIGHT)
         
         # Update background corals
         for coral in self.corals:
@@ -71,31 +95,25 @@ class BackgroundManager:
             y = config.SCREEN_HEIGHT + 10
             size = random.randint(2, 6)
             speed = random.uniform(30, 50)
-            self.bubbles.append({
-                'x': x,
-                'y': y,
-                'size': size,
-                'speed': speed
-            })
+            self.bubbles.append(self.bubble_pool.acquire(x, y, size, speed))
             
     def update_bubbles(self, delta_time):
-        """Update bubble positions and remove off-screen bubbles."""
-        new_bubbles = []
-        for bubble in self.bubbles:
-            bubble['y'] -= bubble['speed'] * delta_time
-            if bubble['y'] > -10:  # Keep bubble if still on screen
-                new_bubbles.append(bubble)
-        self.bubbles = new_bubbles
+        """Update bubble positions and return off-screen bubbles to the pool."""
+        def risen(bubble):
+            bubble.y -= bubble.speed * delta_time
+            return bubble.y <= -10  # Off the top: back to the pool
+        self.bubble_pool.sweep(self.bubbles, risen)
         
     def draw(self):
         """Draw all background elements."""
         # Draw water current particles first
         water_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
+        count_surfaces(water_surface)
         for particle in self.water_particles:
             pygame.draw.circle(
                 water_surface,
-                (255, 255, 255, particle['alpha']),
-                (int(particle['x']), int(particle['y'])),
+                (255, 255, 255, particle.alpha),
+                (int(particle.x), int(particle.y)),
                 1
             )
         self.screen.blit(water_surface, (0, 0))
@@ -108,6 +126,6 @@ class BackgroundManager:
             pygame.draw.circle(
                 self.screen,
                 (255, 255, 255, 128),
-                (int(bubble['x']), int(bubble['y'])),
-                bubble['size']
+                (int(bubble.x), int(bubble.y)),
+                bubble.size
             ) 
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+Fish Flock Module
+
+Per-fish schooling with the boids rules, replacing FishAnimation's rigid
+schools. Every fish has its own position and velocity in NumPy arrays;
+neighbours come from a spatial hash grid rebuilt each tick, and all
+steering and integration is vectorized.
+
+Features:
+- Separation, alignment and cohesion within a neighbour radius
+- Avoidance of stressed corals, stronger the lower their health
+- Fish keep further above the reef and swim faster as reef health drops
+- Horizontal wrap-around and soft top and bottom bounds
+- Pre-scaled, pre-flipped sprite variants drawn in one blits() call,
+  opaque sprites as plain opaque surfaces
+"""
+
+import os
+import numpy as np
+import pygame
+import config
+from utils.logger import logger
+from utils.metrics import count_surfaces
+from utils.spatial_hash import SpatialHashGrid
+from visuals.image_cache import image_cache
+
+# Sprite scales; each fish uses one, so variants can be prepared up front
+FISH_SCALES = (0.8, 1.0, 1.2)
+
+class FishFlock:
+    """
+    Boids flock of individual fish.
+
+    Args:
+        screen (pygame.Surface): Surface the flock is drawn on
+        count (int): Number of fish
+        seed (int): Seed for start positions and sprites
+
+    Attributes:
+        position (numpy.ndarray): (count, 2) float32 screen positions
+        velocity (numpy.ndarray): (count, 2) float32 pixels per second
+    """
+
+    def __init__(self, screen, count=None, seed=None):
+        self.screen = screen
+        self.count = count or config.FISH_COUNT
+        self.rng = np.random.default_rng(seed)
+        self.width = config.SCREEN_WIDTH
+        self.height = config.SCREEN_HEIGHT
+
+        self.position = np.column_stack((
+            self.rng.uniform(0, self.width, self.count),
+            self.rng.uniform(100, self.height - 250, self.count)
+        )).astype(np.float32)
+        heading = self.rng.uniform(0, 2 * np.pi, self.count)
+        speed = self.rng.uniform(config.FISH_MIN_SPEED, config.FISH_MAX_SPEED, self.count)
+        self.velocity = (np.column_stack((np.cos(heading), np.sin(heading) * 0.3)) * speed[:, None]).astype(np.float32)
+
+        self.grid = SpatialHashGrid(self.width, self.height, config.FISH_NEIGHBOUR_RADIUS)
+        self.coral_sites = np.empty((0, 2), dtype=np.float32)
+
+        # Sprite variant per fish: (image, scale) index; facing adds 0 or 1
+        self.variants = self._build_variants(self._load_fish_images())
+        self.sprites = [surface for surface, half_width, half_height in self.variants]
+        self.sprite_offsets = np.array(
+            [(half_width, half_height) for surface, half_width, half_height in self.variants], dtype=np.float32
+        )
+        image_count = len(self.variants) // (2 * len(FISH_SCALES))
+        self.variant_base = 2 * (
+            self.rng.integers(0, image_count, self.count) * len(FISH_SCALES)
+            + self.rng.integers(0, len(FISH_SCALES), self.count)
+        )
+
+    def _load_fish_images(self):
+        images = []
+        fish_folder = os.path.join(config.ASSETS_DIR, "images", "fish")
+        reduced_size_by_percent = 0.1
+        try:
+            for image_path in image_cache.folder(fish_folder, ('.png', '.jpg')):
+                image = image_cache.load(image_path)
+                # Scale image to 10% of original size
+                new_width = int(image.get_width() * reduced_size_by_percent)
+                new_height = int(image.get_height() * reduced_size_by_percent)
+                images.append(image_cache.scaled(image_path, (new_width, new_height)))
+        except (pygame.error, OSError) as e:
+            logger.warning(f"Could not load fish images: {e}")
+        if not images:
+            # Create a default colored rectangle as fallback
+            fallback = pygame.Surface((40, 30))
+            fallback.fill((255, 165, 0))
+            images.append(fallback)
+        return images
+
+    def _build_variants(self, images):
+        """Scaled and flipped copies of each image, with blit offsets."""
+        variants = []
+        for image in images:
+            for scale in FISH_SCALES:
+                size = (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale)))
+                scaled = pygame.transform.scale(image, size)
+                if pygame.mask.from_surface(scaled, 254).count() == size[0] * size[1]:
+                    # No transparent pixels: an opaque copy blits several
+                    # times faster than any alpha blend, at full opacity
+                    scaled = scaled.convert()
+                else:
+                    # Slight translucency baked into the pixels: per-pixel alpha
+                    # plus a surface alpha takes a much slower blit path
+                    scaled.fill((255, 255, 255, 240), special_flags=pygame.BLEND_RGBA_MULT)
+                # Sprites face left; the flipped copy is used when moving right
+                for surface in (scaled, pygame.transform.flip(scaled, True, False)):
+                    count_surfaces(surface)
+                    variants.append((surface, size[0] / 2, size[1] / 2))
+        return variants
+
+    def set_reef(self, sites):
+        """Set the coral positions fish avoid when the corals are stressed."""
+        self.coral_sites = np.asarray(sites, dtype=np.float32).reshape(-1, 2)
+
+    def update(self, delta_time, health_state, coral_health=None):
+        """
+        Steer and move every fish.
+
+        Args:
+            delta_time (float): Time since last update
+            health_state (float): Current coral health (0-100)
+            coral_health: Per-coral health matching set_reef() sites, or
+                None to use health_state for all of them
+        """
+        if delta_time <= 0:
+            return
+        position = self.position
+        velocity = self.velocity
+        n = self.count
+        acceleration = np.zeros_like(position)
+
+        # Neighbour pairs within the radius, from the rebuilt grid. Each
+        # pair is found once and accumulated onto both of its fish.
+        self.grid.rebuild(position)
+        i, j, dx, dy, distance_sq = self.grid.pairs(position, config.FISH_NEIGHBOUR_RADIUS)
+
+        def accumulate(for_i, for_j):
+            # Two half-length bincounts; no concatenated pair arrays
+            return np.bincount(i, weights=for_i, minlength=n) + np.bincount(j, weights=for_j, minlength=n)
+
+        def accumulate_opposite(for_i):
+            return np.bincount(i, weights=for_i, minlength=n) - np.bincount(j, weights=for_i, minlength=n)
+
+        neighbours = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+        has_neighbours = neighbours > 0
+        counts = np.maximum(neighbours, 1)[:, None]
+
+        # Cohesion: toward the neighbours' centre
+        centre_offset = np.column_stack((accumulate_opposite(dx), accumulate_opposite(dy))) / counts
+        acceleration += config.FISH_COHESION * centre_offset
+
+        # Alignment: toward the neighbours' mean velocity
+        vx = velocity[:, 0]
+        vy = velocity[:, 1]
+        mean_velocity = np.column_stack((
+            accumulate(vx.take(j), vx.take(i)),
+            accumulate(vy.take(j), vy.take(i))
+        )) / counts
+        acceleration += config.FISH_ALIGNMENT * (mean_velocity - velocity) * has_neighbours[:, None]
+
+        # Separation: away from close neighbours, inverse with distance
+        close = np.flatnonzero(distance_sq < config.FISH_SEPARATION_RADIUS ** 2)
+        if len(close):
+            near_i = i[close]
+            near_j = j[close]
+            inverse = config.FISH_SEPARATION / np.maximum(distance_sq[close], 1.0)
+            push_x = dx[close] * inverse
+            push_y = dy[close] * inverse
+            acceleration[:, 0] += np.bincount(near_j, weights=push_x, minlength=n)
+            acceleration[:, 0] -= np.bincount(near_i, weights=push_x, minlength=n)
+            acceleration[:, 1] += np.bincount(near_j, weights=push_y, minlength=n)
+            acceleration[:, 1] -= np.bincount(near_i, weights=push_y, minlength=n)
+
+        # Stressed corals push fish away
+        if len(self.coral_sites):
+            if coral_health is None:
+                coral_health = np.full(len(self.coral_sites), health_state, dtype=np.float32)
+            stress = 1.0 - np.clip(np.asarray(coral_health, dtype=np.float32) / 100.0, 0.0, 1.0)
+            stressed = np.flatnonzero(stress)
+            if len(stressed):
+                # Only fish in reach of a stressed coral; most swim well above the reef
+                sites = self.coral_sites[stressed]
+                near = np.flatnonzero(position[:, 1] > sites[:, 1].min() - config.FISH_REEF_AVOID_RADIUS)
+                if len(near):
+                    away = position[near, None, :] - sites[None, :, :]
+                    distance = np.sqrt(np.einsum("nkd,nkd->nk", away, away)) + 1e-3
+                    falloff = np.clip(1.0 - distance / config.FISH_REEF_AVOID_RADIUS, 0.0, None) * stress[stressed]
+                    acceleration[near] += config.FISH_REEF_AVOIDANCE * np.einsum(
+                        "nk,nkd->nd", falloff / distance, away
+                    )
+
+        # Stay below the surface and, the sicker the reef, further above it
+        reef_health = max(0.0, min(1.0, health_state / 100.0))
+        floor = self.height - 150 - (1.0 - reef_health) * 200
+        y = position[:, 1]
+        acceleration[:, 1] += config.FISH_BOUND_STRENGTH * (
+            np.clip(50 - y, 0.0, None) - np.clip(y - floor, 0.0, None)
+        )
+        acceleration += self.rng.normal(0.0, config.FISH_WANDER, (n, 2))
+
+        # Integrate, holding speed within a range that rises with stress
+        speed_multiplier = 1.0
+        if health_state < 30:
+            speed_multiplier = 1.6  # Faster when coral is unhealthy
+        elif health_state < 70:
+            speed_multiplier = 1.3  # Slightly faster when coral is stressed
+        velocity += acceleration.astype(np.float32) * delta_time
+        speed = np.sqrt(np.einsum("nd,nd->n", velocity, velocity)) + 1e-6
+        limited = np.clip(
+            speed, config.FISH_MIN_SPEED * speed_multiplier, config.FISH_MAX_SPEED * speed_multiplier
+        )
+        velocity *= (limited / speed)[:, None]
+        position += velocity * delta_time
+
+        # Wrap around horizontally, as fish used to re-enter from the sides
+        np.mod(position[:, 0] + 50, self.width + 100, out=position[:, 0])
+        position[:, 0] -= 50
+
+    def draw(self, screen):
+        facing = self.variant_base + (self.velocity[:, 0] > 0)
+        # Top-left corners in NumPy; blits() pairs them with the sprites lazily
+        corners = self.position - self.sprite_offsets[facing]
+        screen.blits(
+            zip(map(self.sprites.__getitem__, facing.tolist()), corners.tolist()),
+            doreturn=False
+        )
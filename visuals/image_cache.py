@@ -0,0 +1,77 @@
+"""
+Image Cache Module
+
+Loads each sprite file once and shares the decoded and scaled surfaces
+between animations, instead of every CoralAnimation and FishAnimation
+decoding the same PNG from disk.
+
+Features:
+- Decoded, display-converted originals keyed by path
+- Scaled copies keyed by path and size
+- Cached directory listings of sprite folders
+"""
+
+import os
+import pygame
+from utils.metrics import count_surfaces
+
+class ImageCache:
+    """
+    Process-wide cache of sprite surfaces.
+
+    Returned surfaces are shared; callers must not draw onto them. Loading
+    converts surfaces for the display, so a display mode must be set first.
+    """
+
+    def __init__(self):
+        self._images = {}
+        self._scaled = {}
+        self._folders = {}
+
+    def folder(self, folder, extensions):
+        """
+        List the image files in a folder.
+
+        Args:
+            folder (str): Directory to list
+            extensions (tuple): Accepted filename suffixes
+
+        Returns:
+            list: Paths of matching files, sorted
+        """
+        key = (folder, extensions)
+        paths = self._folders.get(key)
+        if paths is None:
+            paths = [
+                os.path.join(folder, filename)
+                for filename in sorted(os.listdir(folder))
+                if filename.endswith(extensions)
+            ]
+            self._folders[key] = paths
+        return paths
+
+    def load(self, path):
+        image = self._images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            count_surfaces(image)
+            self._images[path] = image
+        return image
+
+    def scaled(self, path, size):
+        """Return the image at path scaled to size (width, height)."""
+        key = (path, size)
+        image = self._scaled.get(key)
+        if image is None:
+            image = pygame.transform.scale(self.load(path), size)
+            count_surfaces(image)
+            self._scaled[key] = image
+        return image
+
+    def clear(self):
+        self._images.clear()
+        self._scaled.clear()
+        self._folders.clear()
+
+# Shared by all animations
+image_cache = ImageCache()
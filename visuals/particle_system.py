@@ -2,9 +2,18 @@ import pygame
 import random
 import math
 import config
+from utils.metrics import metrics, count_surfaces
+from utils.object_pool import ObjectPool
+
+PARTICLES_LIVE = metrics.gauge("particles_live", "Live particles in the ParticleSystem")
 
 class Particle:
+    __slots__ = ("x", "y", "color", "velocity", "lifetime", "time_remaining", "size", "alpha")
+
     def __init__(self, x, y, color, velocity=(0, 0), lifetime=1.0, size=3):
+        self.reset(x, y, color, velocity, lifetime, size)
+
+    def reset(self, x, y, color, velocity=(0, 0), lifetime=1.0, size=3):
         self.x = x
         self.y = y
         self.color = color
@@ -24,6 +33,7 @@ class Particle:
     def draw(self, screen):
         if self.alpha > 0:
             surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
+            count_surfaces(surface)
             pygame.draw.circle(surface, (*self.color, self.alpha), (self.size, self.size), self.size)
             screen.blit(surface, (int(self.x - self.size), int(self.y - self.size)))
 
@@ -33,22 +43,25 @@ class ParticleSystem:
     
     This class handles creation, updating and drawing of particle effects like bubbles
     and warning indicators. It maintains a list of active particles and automatically
-    removes them when their lifetime expires.
+    removes them when their lifetime expires. Expired particles go back to a
+    pool and are reused by the next effects.
     
     Attributes:
         screen: The pygame surface to draw particles on
         particles: List of active Particle objects
+        pool: ObjectPool of expired particles
     """
     
     def __init__(self, screen):
         self.screen = screen
         self.particles = []
+        self.pool = ObjectPool(Particle)
         
     def create_bubble_effect(self, x, y, count=5):
         for _ in range(count):
             velocity = (random.uniform(-20, 20), random.uniform(-50, -20))
             self.particles.append(
-                Particle(x, y, (255, 255, 255), velocity, 
+                self.pool.acquire(x, y, (255, 255, 255), velocity, 
                         random.uniform(0.5, 1.5), random.randint(2, 4))
             )
             
@@ -58,12 +71,13 @@ class ParticleSystem:
             speed = random.uniform(50, 100)
             velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
             self.particles.append(
-                Particle(x, y, (255, 50, 50), velocity, 
+                self.pool.acquire(x, y, (255, 50, 50), velocity, 
                         random.uniform(0.5, 1.0), random.randint(2, 4))
             )
     
     def update(self, delta_time):
-        self.particles = [p for p in self.particles if not p.update(delta_time)]
+        self.pool.sweep(self.particles, lambda particle: particle.update(delta_time))
+        PARTICLES_LIVE.set(len(self.particles))
         
     def draw(self):
         for particle in self.particles:
@@ -82,7 +96,7 @@ class ParticleSystem:
             
             # Create light green particles with transparency
             self.particles.append(
-                Particle(
+                self.pool.acquire(
                     x, y,
                     color=(200, 255, 200),  # Light green
                     velocity=velocity,
@@ -104,7 +118,7 @@ class ParticleSystem:
             
             # Create brighter green particles
             self.particles.append(
-                Particle(
+                self.pool.acquire(
                     x, y,
                     color=(100, 255, 100),  # Bright green
                     velocity=velocity,
@@ -0,0 +1,50 @@
+"""
+Text Cache Module
+
+Caches rendered text surfaces so HUD labels that rarely change are not
+re-rendered with font.render every frame.
+
+Features:
+- LRU cache keyed by font, text, color and antialiasing
+- Hit/miss metrics for the cache hit rate
+"""
+
+from collections import OrderedDict
+from utils.metrics import metrics, count_surfaces
+
+TEXT_CACHE_HITS = metrics.counter("text_cache_hits_total", "Text renders served from the cache")
+TEXT_CACHE_MISSES = metrics.counter("text_cache_misses_total", "Text renders that had to call font.render")
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text surfaces.
+
+    Returned surfaces are shared; callers must not draw onto them or change
+    their alpha.
+
+    Args:
+        max_entries (int): Number of surfaces kept before evicting
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            TEXT_CACHE_HITS.inc()
+            self._surfaces.move_to_end(key)
+            return surface
+
+        TEXT_CACHE_MISSES.inc()
+        surface = font.render(text, antialias, color)
+        count_surfaces(surface)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
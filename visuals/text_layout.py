@@ -0,0 +1,80 @@
+"""
+Text Layout Module
+
+Word-wraps text to a pixel width and renders it once into a single
+surface, for long strings such as educational facts that would otherwise
+overflow the window when rendered as one line.
+
+Features:
+- Greedy word wrapping measured with font.size
+- Over-long words broken by character
+- Left, center or right aligned lines on a transparent surface
+"""
+
+import pygame
+from utils.metrics import count_surfaces
+
+def wrap_text(font, text, max_width):
+    """
+    Split text into lines that each fit within max_width pixels.
+
+    Args:
+        font (pygame.font.Font): Font used for measuring
+        text (str): Text to wrap
+        max_width (int): Maximum line width in pixels
+
+    Returns:
+        list: Lines of text
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if font.size(candidate)[0] <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            # Break words that do not fit on a line of their own
+            while font.size(word)[0] > max_width and len(word) > 1:
+                cut = len(word) - 1
+                while cut > 1 and font.size(word[:cut])[0] > max_width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append(line)
+    return lines
+
+def render_wrapped(font, text, color, max_width, align="center", line_spacing=4):
+    """
+    Render word-wrapped text into one surface.
+
+    Args:
+        font (pygame.font.Font): Font to render with
+        text (str): Text to render
+        color (tuple): Text color
+        max_width (int): Maximum line width in pixels
+        align (str): "left", "center" or "right"
+        line_spacing (int): Extra pixels between lines
+
+    Returns:
+        pygame.Surface: Transparent surface sized to the wrapped text
+    """
+    line_surfaces = [font.render(line, True, color) for line in wrap_text(font, text, max_width)]
+    width = max(surface.get_width() for surface in line_surfaces)
+    line_height = font.get_linesize() + line_spacing
+    height = line_height * len(line_surfaces) - line_spacing
+
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    count_surfaces(surface, *line_surfaces)
+    for i, line_surface in enumerate(line_surfaces):
+        if align == "left":
+            x = 0
+        elif align == "right":
+            x = width - line_surface.get_width()
+        else:
+            x = (width - line_surface.get_width()) // 2
+        surface.blit(line_surface, (x, i * line_height))
+    return surface
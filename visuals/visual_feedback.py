@@ -1,15 +1,25 @@
 import pygame
 import config
+from utils.metrics import metrics, count_surfaces
+from utils.object_pool import ObjectPool
+
+VISUAL_EFFECTS_ACTIVE = metrics.gauge("visual_effects_active", "Active VisualEffect texts")
 
 class VisualEffect:
+    __slots__ = ("x", "y", "text", "color", "duration", "time_remaining", "font")
+
     def __init__(self, x, y, text, color, duration=2.0):
+        # Loaded once per effect; pooled effects keep theirs
+        self.font = pygame.font.Font(None, 24)
+        self.reset(x, y, text, color, duration)
+
+    def reset(self, x, y, text, color, duration=2.0):
         self.x = x
         self.y = y
         self.text = text
         self.color = color
         self.duration = duration
         self.time_remaining = duration
-        self.font = pygame.font.Font(None, 24)
         
     def update(self, delta_time):
         self.time_remaining -= delta_time
@@ -18,6 +28,7 @@ class VisualEffect:
     def draw(self, screen):
         alpha = int(255 * (self.time_remaining / self.duration))
         text_surface = self.font.render(self.text, True, self.color)
+        count_surfaces(text_surface)
         text_surface.set_alpha(alpha)
         screen.blit(text_surface, (self.x, self.y))
 
@@ -25,9 +36,10 @@ class VisualFeedback:
     def __init__(self, screen):
         self.screen = screen
         self.effects = []
+        self.pool = ObjectPool(VisualEffect)
         
     def add_effect(self, x, y, text, color=config.WHITE):
-        self.effects.append(VisualEffect(x, y, text, color))
+        self.effects.append(self.pool.acquire(x, y, text, color))
         
     def add_health_change(self, x, y, amount):
         text = f"{amount:+.1f}"
@@ -35,9 +47,9 @@ class VisualFeedback:
         self.add_effect(x, y, text, color)
         
     def update(self, delta_time):
-        # Update and remove finished effects
-        self.effects = [effect for effect in self.effects 
-                       if not effect.update(delta_time)]
+        # Update finished effects and return them to the pool
+        self.pool.sweep(self.effects, lambda effect: effect.update(delta_time))
+        VISUAL_EFFECTS_ACTIVE.set(len(self.effects))
         
     def draw(self):
         for effect in self.effects: